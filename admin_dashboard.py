@@ -11,7 +11,9 @@ import hashlib
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from auth.license_store import open_license_store
 
 
 class LicenseKeyGenerator:
@@ -19,7 +21,9 @@ class LicenseKeyGenerator:
 
     def __init__(self):
         self.license_database_file = self._get_license_database_path()
-        self.licenses = self.load_license_database()
+        # Licenses live in an indexed SQLite store next to the JSON file;
+        # an existing license_database.json is imported on first use
+        self.store = open_license_store(self.license_database_file)
 
     def _get_license_database_path(self) -> str:
         """Get the path for license database in AppData directory"""
@@ -43,97 +47,101 @@ class LicenseKeyGenerator:
         return os.path.join(app_dir, 'license_database.json')
 
     def load_license_database(self) -> Dict[str, Any]:
-        """Load existing license database"""
-        if os.path.exists(self.license_database_file):
-            try:
-                with open(self.license_database_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {"licenses": [], "next_id": 1}
-
-    def save_license_database(self):
-        """Save license database"""
-        try:
-            with open(self.license_database_file, 'w') as f:
-                json.dump(self.licenses, f, indent=2)
-        except Exception as e:
-            print(f"Error saving license database: {e}")
+        """Load all licenses in the legacy JSON layout"""
+        return {
+            "licenses": self.store.get_all_licenses(),
+            "next_id": int(self.store.get_meta('next_id') or 1)
+        }
+
+    def _build_license_record(self, license_id: int, hardware_id: str, license_type: str,
+                              user_name: str, duration_days: int = None) -> Dict[str, Any]:
+        """Create the record (and key) for a new license"""
+        issued_at = datetime.now()
+        expires_at = None
+
+        if duration_days:
+            expires_at = issued_at + timedelta(days=duration_days)
+
+        # Generate license key based on hardware ID and license type
+        key_data = f"{license_type.upper()}{hardware_id}{license_id}"
+        key_hash = hashlib.sha256(key_data.encode()).hexdigest()[:16].upper()
+
+        # Format as XXXX-XXXX-XXXX-XXXX
+        license_key = f"{key_hash[0:4]}-{key_hash[4:8]}-{key_hash[8:12]}-{key_hash[12:16]}"
+
+        return {
+            "id": license_id,
+            "license_key": license_key,
+            "hardware_id": hardware_id,
+            "license_type": license_type,
+            "user_name": user_name,
+            "issued_at": issued_at.isoformat(),
+            "expires_at": expires_at.isoformat() if expires_at else None,
+            "status": "active",
+            "generated_by": "admin",
+            "generated_at": datetime.now().isoformat()
+        }
 
     def generate_license_key(self, hardware_id: str, license_type: str,
                            user_name: str, duration_days: int = None) -> str:
         """Generate a license key for specific hardware ID"""
+        return self.generate_license_keys([{
+            'hardware_id': hardware_id,
+            'license_type': license_type,
+            'user_name': user_name,
+            'duration_days': duration_days
+        }])[0]
+
+    def generate_license_keys(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """Generate license keys in bulk, stored in a single transaction.
+
+        Each request holds ``hardware_id``, ``license_type``, ``user_name`` and
+        optionally ``duration_days``.  Returns the keys in request order.
+        """
         try:
-            # Create license data
-            license_id = self.licenses["next_id"]
-            self.licenses["next_id"] += 1
-
-            issued_at = datetime.now()
-            expires_at = None
-
-            if duration_days:
-                expires_at = issued_at + timedelta(days=duration_days)
-
-            # Generate license key based on hardware ID and license type
-            key_data = f"{license_type.upper()}{hardware_id}{license_id}"
-            key_hash = hashlib.sha256(key_data.encode()).hexdigest()[:16].upper()
-
-            # Format as XXXX-XXXX-XXXX-XXXX
-            license_key = f"{key_hash[0:4]}-{key_hash[4:8]}-{key_hash[8:12]}-{key_hash[12:16]}"
-
-            # Store license record
-            license_record = {
-                "id": license_id,
-                "license_key": license_key,
-                "hardware_id": hardware_id,
-                "license_type": license_type,
-                "user_name": user_name,
-                "issued_at": issued_at.isoformat(),
-                "expires_at": expires_at.isoformat() if expires_at else None,
-                "status": "active",
-                "generated_by": "admin",
-                "generated_at": datetime.now().isoformat()
-            }
-
-            self.licenses["licenses"].append(license_record)
-            self.save_license_database()
-
-            return license_key
+            if not requests:
+                return []
+
+            first_id = self.store.allocate_ids(len(requests))
+            records = [
+                self._build_license_record(
+                    first_id + index,
+                    request['hardware_id'],
+                    request['license_type'],
+                    request['user_name'],
+                    request.get('duration_days')
+                )
+                for index, request in enumerate(requests)
+            ]
+
+            self.store.add_licenses(records)
+            return [record['license_key'] for record in records]
 
         except Exception as e:
             raise Exception(f"Failed to generate license key: {e}")
 
     def get_all_licenses(self) -> List[Dict[str, Any]]:
         """Get all generated licenses"""
-        return self.licenses.get("licenses", [])
+        return self.store.get_all_licenses()
+
+    def get_license(self, license_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a license by key"""
+        return self.store.get_license(license_key)
 
     def revoke_license(self, license_key: str) -> bool:
         """Revoke a license"""
         try:
-            for license_record in self.licenses["licenses"]:
-                if license_record["license_key"] == license_key:
-                    license_record["status"] = "revoked"
-                    license_record["revoked_at"] = datetime.now().isoformat()
-                    self.save_license_database()
-                    return True
-            return False
-        except:
+            return self.store.revoke_license(license_key)
+        except Exception as e:
+            print(f"Error revoking license: {e}")
             return False
 
     def delete_license(self, license_key: str) -> bool:
         """Permanently delete a license"""
         try:
-            original_count = len(self.licenses["licenses"])
-            self.licenses["licenses"] = [
-                license_record for license_record in self.licenses["licenses"]
-                if license_record["license_key"] != license_key
-            ]
-
-            if len(self.licenses["licenses"]) < original_count:
-                self.save_license_database()
-                return True
-            return False
-        except:
+            return self.store.delete_license(license_key)
+        except Exception as e:
+            print(f"Error deleting license: {e}")
             return False
 
 
@@ -6,12 +6,28 @@ import json
 import base64
 import hashlib
 import os
+import time
 from typing import Dict, Any, Optional
 
 # Simple encryption using base64 and XOR (for demo purposes)
 # In production, use proper cryptography libraries
 
 
+def xor_with_key(data: bytes, key: bytes) -> bytes:
+    """XOR ``data`` with ``key`` repeated to its length.
+
+    Works on the whole buffer at once as one big-integer XOR instead of a
+    per-byte Python loop; the output is identical byte for byte.
+    """
+    length = len(data)
+    if not length:
+        return b''
+
+    stream = (key * (length // len(key) + 1))[:length]
+    result = int.from_bytes(data, 'big') ^ int.from_bytes(stream, 'big')
+    return result.to_bytes(length, 'big')
+
+
 class LicenseCrypto:
     """Handle encryption and decryption of license data"""
 
@@ -42,10 +58,7 @@ class LicenseCrypto:
 
             # Simple XOR encryption with hardware ID as key
             key = hashlib.sha256(hardware_id.encode()).digest()
-            encrypted_bytes = bytearray()
-
-            for i, byte in enumerate(json_data.encode()):
-                encrypted_bytes.append(byte ^ key[i % len(key)])
+            encrypted_bytes = xor_with_key(json_data.encode(), key)
 
             # Return base64 encoded encrypted data
             return base64.b64encode(encrypted_bytes).decode()
@@ -61,10 +74,7 @@ class LicenseCrypto:
 
             # Simple XOR decryption with hardware ID as key
             key = hashlib.sha256(hardware_id.encode()).digest()
-            decrypted_bytes = bytearray()
-
-            for i, byte in enumerate(encrypted_bytes):
-                decrypted_bytes.append(byte ^ key[i % len(key)])
+            decrypted_bytes = xor_with_key(encrypted_bytes, key)
 
             # Parse JSON
             license_data = json.loads(decrypted_bytes.decode())
@@ -179,7 +189,46 @@ class SecureStorage:
         return self.license_file
 
 
+def benchmark_xor_cipher(payload_sizes=(256, 4096, 65536), iterations: int = 200) -> Dict[int, Dict[str, float]]:
+    """Measure XOR cipher throughput (MB/s) against the old per-byte loop"""
+    def xor_per_byte(data: bytes, key: bytes) -> bytes:
+        output = bytearray()
+        for i, byte in enumerate(data):
+            output.append(byte ^ key[i % len(key)])
+        return bytes(output)
+
+    key = hashlib.sha256(b"BENCHMARK-HARDWARE-ID").digest()
+    results = {}
+
+    for size in payload_sizes:
+        data = os.urandom(size)
+        assert xor_with_key(data, key) == xor_per_byte(data, key)
+
+        timings = {}
+        for name, func in (('whole_buffer', xor_with_key), ('per_byte', xor_per_byte)):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                func(data, key)
+            elapsed = time.perf_counter() - started
+            timings[name] = (size * iterations) / elapsed / (1024 * 1024)
+
+        timings['speedup'] = timings['whole_buffer'] / timings['per_byte']
+        results[size] = timings
+
+    return results
+
+
 if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        # python auth/crypto_utils.py --benchmark
+        print("XOR cipher throughput (MB/s)")
+        print(f"{'payload':>10} {'whole buffer':>14} {'per byte':>10} {'speedup':>9}")
+        for size, timings in benchmark_xor_cipher().items():
+            print(f"{size:>10} {timings['whole_buffer']:>14.1f} {timings['per_byte']:>10.1f} {timings['speedup']:>8.1f}x")
+        sys.exit(0)
+
     # Test the crypto utilities
     print("License Crypto Test")
     print("=" * 40)
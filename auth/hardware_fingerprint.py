@@ -10,42 +10,156 @@ import uuid
 import os
 import sys
 import json
+import threading
+import time
 from typing import Optional
 
+# Overall time budget (seconds) for collecting all components concurrently
+COLLECTION_DEADLINE = 3.0
+
+# Value used for a component that could not be collected before the deadline
+COMPONENT_DEFAULTS = {
+    'cpu': "unknown_cpu",
+    'motherboard': "unknown_mb",
+    'mac': "unknown_mac",
+    'hdd': "unknown_hdd",
+    'machine_guid': "unknown_guid",
+    'system_uuid': "unknown_uuid"
+}
+
+_cache_lock = threading.Lock()
+
 
 class HardwareFingerprint:
     """Generate unique hardware fingerprint for license binding"""
 
-    def __init__(self):
+    def __init__(self, deadline: float = COLLECTION_DEADLINE):
         self.components = {}
+        self.timings = {}  # component -> ms, or None if it missed the deadline
+        self.from_cache = False
         self.cache_file = os.path.join(os.path.expanduser("~"), ".taskplanner_hwid_cache.json")
-        self._collect_hardware_info()
-
-    def _collect_hardware_info(self):
-        """Collect various hardware identifiers"""
-        try:
-            # Get CPU info
-            self.components['cpu'] = self._get_cpu_id()
-
-            # Get motherboard info
-            self.components['motherboard'] = self._get_motherboard_id()
+        self._collect_hardware_info(deadline)
+
+    def _get_collectors(self) -> dict:
+        """Component name -> collector method, in fingerprint order"""
+        collectors = {
+            'cpu': self._get_cpu_id,
+            'motherboard': self._get_motherboard_id,
+            'mac': self._get_mac_address,
+            'hdd': self._get_hdd_serial
+        }
 
-            # Get MAC address
-            self.components['mac'] = self._get_mac_address()
+        # Get Windows machine GUID (Windows only)
+        if platform.system() == "Windows":
+            collectors['machine_guid'] = self._get_windows_machine_guid
 
-            # Get hard drive serial
-            self.components['hdd'] = self._get_hdd_serial()
+        collectors['system_uuid'] = self._get_system_uuid
+        return collectors
 
-            # Get Windows machine GUID (Windows only)
-            if platform.system() == "Windows":
-                self.components['machine_guid'] = self._get_windows_machine_guid()
+    def _collect_hardware_info(self, deadline: float = COLLECTION_DEADLINE):
+        """Collect various hardware identifiers.
 
-            # Get system UUID
-            self.components['system_uuid'] = self._get_system_uuid()
+        Components collected during the current boot are reused from the
+        cache file.  Otherwise every component is collected on its own thread.
+        A component with a value cached on an earlier boot gets ``deadline``
+        seconds before that value is used instead, so a hanging ``wmic``/
+        ``lsblk`` call can no longer hold up startup.  Components without a
+        cached value are always waited for (each collector has its own
+        timeout), since a default value would change the hardware ID.
+        """
+        try:
+            boot_id = self._get_boot_id()
+            cache_data = self._load_cache()
+
+            if boot_id and cache_data.get('boot_id') == boot_id and cache_data.get('components'):
+                self.components = dict(cache_data['components'])
+                self.timings = {name: 0.0 for name in self.components}
+                self.from_cache = True
+                return
+
+            previous = cache_data.get('components') or {}
+            results = {}
+            timings = {}
+            threads = {}
+            collectors = self._get_collectors()
+
+            def collect(name, collector):
+                started = time.perf_counter()
+                try:
+                    results[name] = collector()
+                except Exception as e:
+                    print(f"Error collecting {name} info: {e}")
+                    results[name] = COMPONENT_DEFAULTS[name]
+                timings[name] = (time.perf_counter() - started) * 1000
+
+            for name, collector in collectors.items():
+                # Daemon threads: a component stuck past the deadline must not keep the process alive
+                thread = threading.Thread(target=collect, args=(name, collector),
+                                          name=f"hwid-{name}", daemon=True)
+                thread.start()
+                threads[name] = thread
+
+            end_time = time.monotonic() + deadline
+            for name, thread in threads.items():
+                if previous.get(name):
+                    thread.join(max(0.0, end_time - time.monotonic()))
+                else:
+                    thread.join()
+
+            # Snapshot: threads that missed the deadline may still write later
+            collected = dict(results)
+            self.timings = dict(timings)
+            for name in collectors:
+                if name in collected:
+                    self.components[name] = collected[name]
+                else:
+                    self.timings[name] = None
+                    self.components[name] = previous[name]
+                    print(f"Hardware component '{name}' timed out after {deadline:.1f}s, using cached value")
+
+            # Only a complete collection is trusted for the rest of this boot;
+            # otherwise keep what did complete and collect again next start
+            if collected:
+                values = {'components': {**previous, **collected}}
+                if boot_id and len(collected) == len(collectors):
+                    values['boot_id'] = boot_id
+                self._update_cache(**values)
 
         except Exception as e:
             print(f"Error collecting hardware info: {e}")
 
+    def _get_boot_id(self) -> str:
+        """Cheap identifier of the current boot ('' if unavailable)"""
+        try:
+            system = platform.system()
+            if system == "Linux":
+                with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+                    return f.read().strip()
+            elif system == "Windows":
+                import ctypes
+                uptime = ctypes.windll.kernel32.GetTickCount64() / 1000
+                # Boot time, rounded so clock jitter does not change it
+                return f"win-{int((time.time() - uptime) // 60)}"
+            elif system == "Darwin":
+                result = subprocess.run(
+                    ['sysctl', '-n', 'kern.boottime'],
+                    capture_output=True, text=True, timeout=2
+                )
+                return f"mac-{result.stdout.strip()}" if result.stdout.strip() else ''
+        except Exception:
+            pass
+        return ''
+
+    def get_timing_report(self) -> str:
+        """Format how long each component took to collect (ms)"""
+        source = "cached for this boot" if self.from_cache else "collected"
+        lines = [f"Hardware fingerprint components ({source})"]
+        for name in self.components:
+            elapsed = self.timings.get(name)
+            timing = "timed out" if elapsed is None else f"{elapsed:.1f} ms"
+            lines.append(f"  {name:<14} {timing}")
+        return "\n".join(lines)
+
     def _get_cpu_id(self) -> str:
         """Get CPU identifier"""
         try:
@@ -190,25 +304,36 @@ class HardwareFingerprint:
 
         return fallback_uuid
 
-    def _load_cached_uuid(self) -> str:
-        """Load cached UUID if it exists"""
+    def _load_cache(self) -> dict:
+        """Load the hardware ID cache file"""
         try:
             if os.path.exists(self.cache_file):
                 with open(self.cache_file, 'r') as f:
                     cache_data = json.load(f)
-                    return cache_data.get('fallback_uuid', '')
+                    if isinstance(cache_data, dict):
+                        return cache_data
         except:
             pass
-        return ''
+        return {}
+
+    def _update_cache(self, **values):
+        """Merge values into the cache file, keeping the other entries"""
+        with _cache_lock:
+            try:
+                cache_data = self._load_cache()
+                cache_data.update(values)
+                with open(self.cache_file, 'w') as f:
+                    json.dump(cache_data, f)
+            except:
+                pass
+
+    def _load_cached_uuid(self) -> str:
+        """Load cached UUID if it exists"""
+        return self._load_cache().get('fallback_uuid', '')
 
     def _save_cached_uuid(self, uuid_value: str):
         """Save UUID to cache"""
-        try:
-            cache_data = {'fallback_uuid': uuid_value}
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
-        except:
-            pass
+        self._update_cache(fallback_uuid=uuid_value)
 
     def generate_fingerprint(self) -> str:
         """Generate unique hardware fingerprint"""
@@ -243,13 +368,20 @@ class HardwareFingerprint:
             'system': platform.system(),
             'machine': platform.machine(),
             'processor': platform.processor(),
-            'components': self.components
+            'components': self.components,
+            'timings': self.timings
         }
 
 
+# Most recent collection, kept so startup profiling can report its timings
+last_fingerprint: Optional[HardwareFingerprint] = None
+
+
 def get_hardware_id() -> str:
     """Convenience function to get hardware ID"""
+    global last_fingerprint
     fingerprint = HardwareFingerprint()
+    last_fingerprint = fingerprint
     return fingerprint.generate_fingerprint()
 
 
@@ -274,3 +406,5 @@ if __name__ == "__main__":
     print("\nComponents:")
     for key, value in info['components'].items():
         print(f"  {key}: {value}")
+    print()
+    print(fingerprint.get_timing_report())
@@ -6,9 +6,10 @@ Handles license validation, activation, and management
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from .hardware_fingerprint import get_hardware_id, get_hardware_info
 from .crypto_utils import SecureStorage, LicenseCrypto
+from .license_store import LicenseStore, get_store_path
 
 
 class LicenseManager:
@@ -181,35 +182,54 @@ class LicenseManager:
 
         return True
 
-    def _get_license_from_admin_db(self, license_key: str) -> Optional[Dict[str, Any]]:
-        """Get license information from admin database"""
-        try:
-            # Try multiple possible locations for the admin database
-            admin_db_file = None
-            possible_paths = [
-                self._get_appdata_license_db_path(),  # AppData directory (primary)
-                "license_database.json",  # Current directory (fallback)
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), "license_database.json"),  # Project root
-                os.path.join(os.getcwd(), "license_database.json")  # Working directory
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    admin_db_file = path
-                    break
-
-            if not admin_db_file:
-                return None
+    def _get_admin_db_paths(self) -> List[str]:
+        """Possible locations of the admin license database, in lookup order"""
+        return [
+            self._get_appdata_license_db_path(),  # AppData directory (primary)
+            "license_database.json",  # Current directory (fallback)
+            os.path.join(os.path.dirname(os.path.dirname(__file__)), "license_database.json"),  # Project root
+            os.path.join(os.getcwd(), "license_database.json")  # Working directory
+        ]
+
+    def get_license_file_paths(self) -> List[str]:
+        """Files whose contents determine the license state (stored license and admin databases)"""
+        paths = [self.storage.get_license_file_path()]
+        for path in self._get_admin_db_paths():
+            paths.extend([get_store_path(path), path])
+        return paths
+
+    def _find_admin_license(self, license_key: str,
+                            possible_paths: Optional[List[str]] = None) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look up a license in the first admin database found.
+
+        The indexed store (license_database.db) is preferred over the legacy
+        JSON file at the same location.  Returns ``(database_found, record)``.
+        """
+        for path in possible_paths or self._get_admin_db_paths():
+            store_path = get_store_path(path)
+            if os.path.exists(store_path):
+                store = LicenseStore(store_path)
+                try:
+                    return True, store.get_license(license_key)
+                finally:
+                    store.close()
 
-            with open(admin_db_file, 'r') as f:
-                admin_data = json.load(f)
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    admin_data = json.load(f)
 
-            # Find license in admin database
-            for record in admin_data.get('licenses', []):
-                if record.get('license_key') == license_key.upper():
-                    return record
+                for record in admin_data.get('licenses', []):
+                    if record.get('license_key') == license_key:
+                        return True, record
+                return True, None
 
-            return None
+        return False, None
+
+    def _get_license_from_admin_db(self, license_key: str) -> Optional[Dict[str, Any]]:
+        """Get license information from admin database"""
+        try:
+            _, record = self._find_admin_license(license_key.upper())
+            return record
 
         except Exception:
             return None
@@ -217,35 +237,13 @@ class LicenseManager:
     def _decode_license_from_key(self, license_key: str, user_name: str) -> Optional[Dict[str, Any]]:
         """Decode license data from license key using admin database"""
         try:
-            # Load admin database to verify license
-            # Try multiple possible locations for the admin database
-            admin_db_file = None
-            possible_paths = [
-                self._get_appdata_license_db_path(),  # AppData directory (primary)
-                "license_database.json",  # Current directory (fallback)
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), "license_database.json"),  # Project root
-                os.path.join(os.getcwd(), "license_database.json")  # Working directory
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    admin_db_file = path
-                    break
-
-            if not admin_db_file:
+            # Look the license up in the admin database
+            admin_db_found, license_record = self._find_admin_license(license_key.upper())
+
+            if not admin_db_found:
                 # Fallback to demo mode if no admin database found
                 return self._decode_license_demo_mode(license_key, user_name)
 
-            with open(admin_db_file, 'r') as f:
-                admin_data = json.load(f)
-
-            # Find license in admin database
-            license_record = None
-            for record in admin_data.get('licenses', []):
-                if record.get('license_key') == license_key.upper():
-                    license_record = record
-                    break
-
             if not license_record:
                 # Fallback to demo mode if license not found in admin database
                 return self._decode_license_demo_mode(license_key, user_name)
@@ -435,29 +433,18 @@ class LicenseManager:
             if self.current_license.get('license_type') == 'trial':
                 return True
 
-            import json
-            import os
-
             # Path to admin license database
             admin_db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "license_database.json")
 
-            if not os.path.exists(admin_db_path):
-                # If admin database doesn't exist, assume license is valid
-                return True
-
-            # Load admin database
-            with open(admin_db_path, 'r') as f:
-                admin_data = json.load(f)
-
-            # Find our license in admin database
+            # Find our license in admin database (indexed lookup when the store exists);
+            # if the admin database doesn't exist, assume license is valid
             license_key = self.current_license.get('license_key', '')
-            for license_record in admin_data.get('licenses', []):
-                if license_record.get('license_key') == license_key:
-                    # Check if license is revoked in admin database
-                    if license_record.get('status') == 'revoked':
-                        print(f"License {license_key} has been revoked")
-                        return False
-                    break
+            _, license_record = self._find_admin_license(license_key, [admin_db_path])
+
+            # Check if license is revoked in admin database
+            if license_record and license_record.get('status') == 'revoked':
+                print(f"License {license_key} has been revoked")
+                return False
 
             return True
 
@@ -0,0 +1,140 @@
+"""
+License state service for Task Planner
+Keeps one LicenseManager per process and caches the validated license state
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+
+class LicenseStateService:
+    """Long-lived, cached view of the current license.
+
+    The hardware fingerprint is computed once, when the underlying
+    ``LicenseManager`` is first needed.  The validated state is memoized and
+    only recomputed when one of the license files changes (by mtime and size),
+    when ``days_remaining`` is about to tick over - which includes the moment
+    the license expires - or after ``invalidate()``.  A periodic status check
+    is therefore just a handful of ``os.stat`` calls.
+    """
+
+    def __init__(self):
+        self._manager = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._file_signature: Optional[Tuple] = None
+        self._refresh_at: Optional[datetime] = None
+        self._lock = threading.RLock()
+        self.validations = 0
+
+    @property
+    def manager(self):
+        """The shared LicenseManager (fingerprints the hardware on first use)"""
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    from .license_manager import LicenseManager
+                    self._manager = LicenseManager()
+                    self._file_signature = self._get_file_signature()
+        return self._manager
+
+    def get_state(self, force: bool = False) -> Dict[str, Any]:
+        """Return the cached license state, re-validating only when it may have changed.
+
+        The state holds ``valid``, ``status`` (the stored license status, e.g.
+        ``'expired'`` or ``'invalid'``), ``info`` (``LicenseManager.get_license_info``
+        for valid licenses) and ``checked_at``.
+        """
+        with self._lock:
+            manager = self.manager
+            signature = self._get_file_signature()
+
+            if not force and self._state is not None:
+                files_changed = signature != self._file_signature
+                due = self._refresh_at is not None and datetime.now() >= self._refresh_at
+                if not files_changed and not due:
+                    return self._state
+
+            if self._state is not None and signature != self._file_signature:
+                # The stored license may have been activated, replaced or removed
+                manager._load_license()
+
+            self._file_signature = signature
+            self._state = self._validate(manager)
+            return self._state
+
+    def is_license_valid(self) -> bool:
+        """Cached equivalent of ``LicenseManager.is_license_valid``"""
+        return self.get_state()['valid']
+
+    def get_license_info(self) -> Dict[str, Any]:
+        """Cached equivalent of ``LicenseManager.get_license_info``"""
+        state = self.get_state()
+        if state['info'] is None:
+            return self.manager.get_license_info()
+        return state['info']
+
+    def invalidate(self):
+        """Force the next ``get_state`` to reload and re-validate the license"""
+        with self._lock:
+            if self._manager is not None:
+                self._manager._load_license()
+            self._state = None
+
+    def _validate(self, manager) -> Dict[str, Any]:
+        """Run the full validation and work out when it has to run again"""
+        started = time.perf_counter()
+        valid = manager.is_license_valid()
+        info = manager.get_license_info() if valid else None
+        license_status = manager.current_license.get('status', 'invalid') if manager.current_license else 'invalid'
+
+        self._refresh_at = self._get_refresh_time(manager.current_license)
+        self.validations += 1
+
+        return {
+            'valid': valid,
+            'status': license_status,
+            'info': info,
+            'checked_at': datetime.now(),
+            'validation_ms': (time.perf_counter() - started) * 1000
+        }
+
+    def _get_refresh_time(self, license_data: Optional[Dict[str, Any]]) -> Optional[datetime]:
+        """When the cached state goes stale: the next change of ``days_remaining``"""
+        expires_at = license_data.get('expires_at') if license_data else None
+        if not expires_at:
+            return None
+
+        try:
+            expiry_date = datetime.fromisoformat(expires_at)
+        except (TypeError, ValueError):
+            return None
+
+        now = datetime.now()
+        remaining = expiry_date - now
+        if remaining <= timedelta(0):
+            return None  # Already expired, only a file change can revive it
+
+        # days_remaining is ``remaining.days``, which next drops after the
+        # fractional part of the current day has elapsed
+        return now + (remaining - timedelta(days=remaining.days)) + timedelta(seconds=1)
+
+    def _get_file_signature(self) -> Tuple:
+        """(mtime, size) of every license file, None for missing ones"""
+        if self._manager is None:
+            return ()
+
+        signature = []
+        for path in self._manager.get_license_file_paths():
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+
+# Global license state instance
+license_state = LicenseStateService()
@@ -0,0 +1,258 @@
+"""
+Indexed license store for Task Planner
+SQLite-backed replacement for the admin license_database.json
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+# Columns stored directly; any other record fields are kept in the ``extra`` JSON column
+LICENSE_COLUMNS = [
+    'id', 'license_key', 'hardware_id', 'license_type', 'user_name', 'issued_at',
+    'expires_at', 'status', 'generated_by', 'generated_at', 'revoked_at'
+]
+
+
+def get_store_path(json_path: str) -> str:
+    """Path of the SQLite store that replaces a license_database.json file"""
+    return os.path.splitext(json_path)[0] + '.db'
+
+
+class LicenseStore:
+    """License records in SQLite, indexed by license key and hardware ID.
+
+    Lookups and revocations by license key go through the unique index, and
+    bulk generation inserts any number of records in a single transaction.
+    Record dictionaries have the same shape as the entries of the old
+    ``license_database.json``.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the tables and indexes if they do not exist yet"""
+        with self._lock, self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS licenses (
+                    id INTEGER PRIMARY KEY,
+                    license_key TEXT NOT NULL UNIQUE,
+                    hardware_id TEXT,
+                    license_type TEXT,
+                    user_name TEXT,
+                    issued_at TEXT,
+                    expires_at TEXT,
+                    status TEXT NOT NULL DEFAULT 'active',
+                    generated_by TEXT,
+                    generated_at TEXT,
+                    revoked_at TEXT,
+                    extra TEXT
+                )
+            """)
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_licenses_hardware_id ON licenses (hardware_id)"
+            )
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    @contextmanager
+    def transaction(self):
+        """Run several operations in one transaction"""
+        with self._lock, self.connection:
+            yield self.connection
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.connection.close()
+
+    # --- Reads ---
+
+    def get_license(self, license_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a license by key (indexed)"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT * FROM licenses WHERE license_key = ?", (license_key,)
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def get_status(self, license_key: str) -> Optional[str]:
+        """Status of a license ('active', 'revoked', ...) or None if unknown"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT status FROM licenses WHERE license_key = ?", (license_key,)
+            ).fetchone()
+        return row['status'] if row else None
+
+    def is_revoked(self, license_key: str) -> bool:
+        """Whether a license has been revoked"""
+        return self.get_status(license_key) == 'revoked'
+
+    def get_licenses_for_hardware(self, hardware_id: str) -> List[Dict[str, Any]]:
+        """All licenses issued for a hardware ID (indexed)"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT * FROM licenses WHERE hardware_id = ? ORDER BY id", (hardware_id,)
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def get_all_licenses(self) -> List[Dict[str, Any]]:
+        """All licenses, oldest first"""
+        with self._lock:
+            rows = self.connection.execute("SELECT * FROM licenses ORDER BY id").fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def count(self) -> int:
+        """Number of stored licenses"""
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM licenses").fetchone()[0]
+
+    # --- Writes ---
+
+    def allocate_ids(self, count: int = 1) -> int:
+        """Reserve ``count`` consecutive license IDs and return the first one"""
+        with self.transaction() as conn:
+            value = self.get_meta('next_id')
+            next_id = int(value) if value else 1
+
+            max_row = conn.execute("SELECT MAX(id) FROM licenses").fetchone()
+            if max_row[0] is not None:
+                next_id = max(next_id, max_row[0] + 1)
+
+            self._set_meta(conn, 'next_id', next_id + count)
+            return next_id
+
+    def add_licenses(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert license records in a single transaction; returns how many were added"""
+        with self.transaction() as conn:
+            return self._insert_records(conn, records)
+
+    def add_license(self, record: Dict[str, Any]):
+        """Insert a single license record"""
+        self.add_licenses([record])
+
+    def revoke_license(self, license_key: str) -> bool:
+        """Mark a license as revoked; returns False if the key is unknown"""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE licenses SET status = 'revoked', revoked_at = ? WHERE license_key = ?",
+                (datetime.now().isoformat(), license_key)
+            )
+            return cursor.rowcount > 0
+
+    def delete_license(self, license_key: str) -> bool:
+        """Permanently delete a license; returns False if the key is unknown"""
+        with self.transaction() as conn:
+            cursor = conn.execute("DELETE FROM licenses WHERE license_key = ?", (license_key,))
+            return cursor.rowcount > 0
+
+    # --- Migration ---
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """Import the licenses of a license_database.json file in one transaction.
+
+        Keys that are already in the store are skipped, so running the
+        migration twice is harmless.  Returns the number of imported licenses.
+        """
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+
+        records = data.get('licenses', []) if isinstance(data, dict) else []
+        with self._lock:
+            existing = {row[0] for row in self.connection.execute("SELECT license_key FROM licenses")}
+        new_records = [record for record in records
+                       if record.get('license_key') and record['license_key'] not in existing]
+
+        next_id = data.get('next_id') if isinstance(data, dict) else None
+        with self.transaction() as conn:
+            imported = self._insert_records(conn, new_records)
+            if next_id:
+                current = self.get_meta('next_id')
+                if current is None or int(current) < int(next_id):
+                    self._set_meta(conn, 'next_id', int(next_id))
+            self._set_meta(conn, 'migrated_from', os.path.abspath(json_path))
+
+        return imported
+
+    # --- Helpers ---
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a store metadata value"""
+        with self._lock:
+            row = self.connection.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _insert_records(self, conn, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert records inside an open transaction and keep next_id ahead of them"""
+        rows = [self._record_to_row(record) for record in records]
+        if not rows:
+            return 0
+
+        columns = LICENSE_COLUMNS + ['extra']
+        conn.executemany(
+            f"INSERT INTO licenses ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            rows
+        )
+
+        max_id = max((row[0] for row in rows if row[0] is not None), default=None)
+        if max_id is not None:
+            value = self.get_meta('next_id')
+            if value is None or int(value) <= max_id:
+                self._set_meta(conn, 'next_id', max_id + 1)
+        return len(rows)
+
+    def _set_meta(self, conn, key: str, value):
+        conn.execute(
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value))
+        )
+
+    def _record_to_row(self, record: Dict[str, Any]) -> tuple:
+        extra = {key: value for key, value in record.items() if key not in LICENSE_COLUMNS}
+        row = [record.get(column) for column in LICENSE_COLUMNS]
+        if row[LICENSE_COLUMNS.index('status')] is None:
+            row[LICENSE_COLUMNS.index('status')] = 'active'
+        return tuple(row) + (json.dumps(extra) if extra else None,)
+
+    def _row_to_record(self, row) -> Dict[str, Any]:
+        record = {column: row[column] for column in LICENSE_COLUMNS}
+        if record['revoked_at'] is None:
+            del record['revoked_at']
+        if row['extra']:
+            try:
+                record.update(json.loads(row['extra']))
+            except ValueError:
+                pass
+        return record
+
+
+def open_license_store(json_path: str, migrate: bool = True) -> LicenseStore:
+    """Open the store next to ``json_path``, importing the JSON database once.
+
+    The JSON file is left in place as a backup; after the migration the
+    store is the source of truth.
+    """
+    store = LicenseStore(get_store_path(json_path))
+
+    if migrate and os.path.exists(json_path) and store.get_meta('migrated_from') is None:
+        try:
+            imported = store.migrate_from_json(json_path)
+            print(f"Migrated {imported} licenses from {json_path} to {store.db_path}")
+        except Exception as e:
+            print(f"Error migrating license database: {e}")
+
+    return store
@@ -19,6 +19,12 @@ from config.database_config import DatabaseConfig
 class DatabaseManager:
     """Enhanced database manager supporting MySQL and SQLite"""
 
+    # Columns added after a database may already have been created:
+    # (table, column, column definition)
+    SCHEMA_UPGRADE_COLUMNS = [
+        ('tasks', 'version', 'INTEGER NOT NULL DEFAULT 1'),
+    ]
+
     def __init__(self):
         self.config = DatabaseConfig()
         self.connection = None
@@ -200,7 +206,41 @@ class DatabaseManager:
         else:
             schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
 
-        return self.execute_script_file(schema_path)
+        initialized = self.execute_script_file(schema_path)
+
+        # CREATE TABLE IF NOT EXISTS leaves existing tables alone, so newer
+        # columns are added separately
+        upgraded = self.upgrade_schema()
+        return initialized and upgraded
+
+    def upgrade_schema(self) -> bool:
+        """Add columns from SCHEMA_UPGRADE_COLUMNS that an existing database lacks"""
+        try:
+            with self.get_cursor() as cursor:
+                for table, column, definition in self.SCHEMA_UPGRADE_COLUMNS:
+                    columns = self._get_table_columns(cursor, table)
+                    if columns and column not in columns:
+                        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                        self.logger.info(f"Added column {table}.{column}")
+                self.connection.commit()
+            return True
+
+        except (MySQLError, sqlite3.Error) as e:
+            self.logger.error(f"Error upgrading schema: {e}")
+            return False
+
+    def _get_table_columns(self, cursor, table: str) -> List[str]:
+        """Column names of a table (empty if the table does not exist)"""
+        if self.config.is_sqlite():
+            cursor.execute(f"PRAGMA table_info({table})")
+            return [row[1] for row in cursor.fetchall()]
+
+        cursor.execute(
+            "SELECT column_name AS name FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            (table,)
+        )
+        return [row['name'] for row in cursor.fetchall()]
 
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> Optional[int]:
         """Execute INSERT/UPDATE/DELETE query and return last insert ID or affected rows"""
@@ -223,6 +263,46 @@ class DatabaseManager:
             self.logger.error(f"Error executing query: {e}")
             return None
 
+    def execute_many(self, query: str, params_list: List[Tuple], return_ids: bool = False):
+        """Execute one statement for many parameter sets in a single transaction.
+
+        Returns the number of affected rows, or with ``return_ids`` the list of
+        inserted IDs (None on error).  Neither database guarantees a contiguous
+        block of IDs for a batch (an explicit id, a trigger or MySQL's
+        innodb_autoinc_lock_mode=2 can break the run), so with ``return_ids``
+        the rows are inserted one by one in the same transaction and each
+        insert ID is collected.
+        """
+        if not params_list:
+            return [] if return_ids else 0
+
+        try:
+            # Convert MySQL-style placeholders to SQLite-style for SQLite
+            if self.config.is_sqlite() and '%s' in query:
+                query = query.replace('%s', '?')
+
+            with self.get_cursor() as cursor:
+                try:
+                    ids = None
+                    if return_ids:
+                        ids = []
+                        for params in params_list:
+                            cursor.execute(query, params)
+                            ids.append(cursor.lastrowid)
+                    else:
+                        cursor.executemany(query, params_list)
+
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+
+                return ids if return_ids else cursor.rowcount
+
+        except (MySQLError, sqlite3.Error) as e:
+            self.logger.error(f"Error executing batch: {e}")
+            return None if return_ids else 0
+
     def fetch_all(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """Execute SELECT query and return all results"""
         try:
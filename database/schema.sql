@@ -59,6 +59,7 @@ CREATE TABLE IF NOT EXISTS tasks (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     completed_at TIMESTAMP NULL,
+    version INT NOT NULL DEFAULT 1, -- bumped on every update, for optimistic concurrency
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     FOREIGN KEY (category_id) REFERENCES categories(id) ON DELETE SET NULL,
     FOREIGN KEY (priority_id) REFERENCES priority_levels(id) ON DELETE SET NULL,
@@ -66,7 +67,8 @@ CREATE TABLE IF NOT EXISTS tasks (
     INDEX idx_user_status (user_id, status),
     INDEX idx_due_date (due_date),
     INDEX idx_category (category_id),
-    INDEX idx_priority (priority_id)
+    INDEX idx_priority (priority_id),
+    INDEX idx_parent_task (parent_task_id)
 );
 
 -- Goals table
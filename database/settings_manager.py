@@ -3,18 +3,38 @@ Settings Manager for Task Planner
 Handles application settings storage and retrieval
 """
 
+import atexit
 import json
 import os
 import sys
-from typing import Any, Dict, Optional
+import tempfile
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Saves are written this many seconds after the last save() call...
+SAVE_DELAY = 0.5
+# ...but never postponed for longer than this while saves keep coming in
+MAX_SAVE_DELAY = 3.0
+
+_MISSING = object()
+
+
 class SettingsManager:
-    """Manages application settings"""
+    """Manages application settings.
+
+    Settings are kept in memory; ``save()`` only marks them dirty and a
+    background timer writes the file once the saves have settled (coalescing
+    bursts such as one save per search).  Files are written atomically
+    (temp file + rename) and pending saves are flushed at exit.  Use
+    ``get_settings_manager()`` to share one instance per settings file.
+    """
 
-    def __init__(self, settings_file: str = None):
+    def __init__(self, settings_file: str = None, save_delay: float = SAVE_DELAY):
         if settings_file is None:
             # Default settings file in user's app data directory
             app_data_dir = self.get_app_data_directory()
@@ -24,6 +44,16 @@ class SettingsManager:
             self.settings_file = settings_file
 
         self.settings = {}
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._subscribers = []  # (key or None for all keys, callback)
+        self._dirty = False
+        self._dirty_since = None
+        self._changes = 0  # save_settings() calls, to tell if a write is still current
+        self._save_timer = None
+
+        _all_managers.add(self)
         self.load_settings()
 
     def get_app_data_directory(self) -> str:
@@ -55,13 +85,98 @@ class SettingsManager:
             self.settings = self.get_default_settings()
 
     def save_settings(self):
-        """Save settings to file"""
+        """Schedule a save; the file is written on a background timer"""
+        with self._lock:
+            self._dirty = True
+            self._changes += 1
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+
+            # Debounce, but keep a steady stream of saves from starving the write
+            if self._save_timer is not None:
+                if now - self._dirty_since >= MAX_SAVE_DELAY:
+                    return
+                self._save_timer.cancel()
+
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes to disk now"""
+        # The snapshot is taken under the write lock, so concurrent flushes
+        # (timer, explicit save, exit) write their snapshots in order
+        with self._write_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+
+                try:
+                    data = json.dumps(self.settings, indent=2, ensure_ascii=False)
+                except Exception as e:
+                    print(f"Error saving settings: {e}")
+                    return
+                changes = self._changes
+
+            if not self._write_atomic(data):
+                return  # Still dirty; written by the next save or at exit
+
+            with self._lock:
+                # Saves made during the write stay dirty for their own flush
+                if self._changes == changes:
+                    self._dirty = False
+                    self._dirty_since = None
+
+    def _write_atomic(self, data: str) -> bool:
+        """Write the file via a temp file in the same directory and rename it into place"""
+        temp_path = None
         try:
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            directory = os.path.dirname(self.settings_file) or '.'
+            os.makedirs(directory, exist_ok=True)
+
+            fd, temp_path = tempfile.mkstemp(prefix='.settings-', suffix='.tmp', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self.settings_file)
+            temp_path = None
+            return True
         except Exception as e:
             print(f"Error saving settings: {e}")
+            return False
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def subscribe(self, callback: Callable[[str, Any], None], key: Optional[str] = None):
+        """Call ``callback(key, value)`` when a setting (or, without ``key``, any setting) changes"""
+        with self._lock:
+            self._subscribers.append((key, callback))
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]):
+        """Remove a change callback"""
+        with self._lock:
+            self._subscribers = [(key, cb) for key, cb in self._subscribers if cb != callback]
+
+    def _notify(self, key: str, value: Any):
+        """Call the subscribers of a changed key"""
+        with self._lock:
+            subscribers = [cb for sub_key, cb in self._subscribers if sub_key is None or sub_key == key]
+
+        for callback in subscribers:
+            try:
+                callback(key, value)
+            except Exception as e:
+                print(f"Error in settings subscriber for '{key}': {e}")
 
     def get_default_settings(self) -> Dict[str, Any]:
         """Get default application settings"""
@@ -108,12 +223,20 @@ class SettingsManager:
 
     def set(self, key: str, value: Any):
         """Set setting value"""
-        self.settings[key] = value
+        with self._lock:
+            old_value = self.settings.get(key, _MISSING)
+            self.settings[key] = value
+
+        if old_value is _MISSING or old_value != value:
+            self._notify(key, value)
 
     def delete(self, key: str):
         """Delete setting key"""
-        if key in self.settings:
+        with self._lock:
+            if key not in self.settings:
+                return
             del self.settings[key]
+        self._notify(key, None)
 
     def save(self):
         """Save current settings"""
@@ -121,9 +244,15 @@ class SettingsManager:
 
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
-        self.settings = self.get_default_settings()
+        with self._lock:
+            old_settings = self.settings
+            self.settings = self.get_default_settings()
         self.save_settings()
 
+        for key in set(old_settings) | set(self.settings):
+            if old_settings.get(key, _MISSING) != self.settings.get(key, _MISSING):
+                self._notify(key, self.settings.get(key))
+
     def get_notification_settings(self) -> Dict[str, Any]:
         """Get all notification-related settings"""
         return {
@@ -179,10 +308,36 @@ class SettingsManager:
             default_settings = self.get_default_settings()
             for key, value in imported_settings.items():
                 if key in default_settings:
-                    self.settings[key] = value
+                    self.set(key, value)
 
             self.save_settings()
             return True
         except Exception as e:
             print(f"Error importing settings: {e}")
             return False
+
+
+# Every manager, so pending saves can be flushed at exit
+_all_managers = weakref.WeakSet()
+_shared_managers: Dict[str, SettingsManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_settings_manager(settings_file: str = None) -> SettingsManager:
+    """Process-wide SettingsManager for a settings file (the AppData settings.json by default)"""
+    key = os.path.abspath(settings_file) if settings_file else None
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = SettingsManager(settings_file)
+            _shared_managers[key] = manager
+        return manager
+
+
+def flush_all_settings():
+    """Write every pending settings save to disk"""
+    for manager in list(_all_managers):
+        manager.flush()
+
+
+atexit.register(flush_all_settings)
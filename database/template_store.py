@@ -0,0 +1,120 @@
+"""
+Template store for Task Planner
+Keeps task templates in their own SQLite file with per-template updates
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+
+class TemplateStore:
+    """Task templates stored one row per template.
+
+    Adding, editing or using a template only touches that template's row, so
+    the templates no longer have to be written back into settings.json as a
+    whole.  Templates are exchanged as ``TaskTemplate.to_dict()`` dictionaries.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the templates table if it does not exist yet"""
+        with self._lock, self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS templates (
+                    template_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    usage_count INTEGER NOT NULL DEFAULT 0,
+                    position INTEGER NOT NULL,
+                    updated_at TEXT
+                )
+            """)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.connection.close()
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """All templates in creation order"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT data, usage_count FROM templates ORDER BY position"
+            ).fetchall()
+
+        templates = []
+        for row in rows:
+            try:
+                data = json.loads(row['data'])
+            except ValueError:
+                continue
+            data['usage_count'] = row['usage_count']
+            templates.append(data)
+        return templates
+
+    def count(self) -> int:
+        """Number of stored templates"""
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM templates").fetchone()[0]
+
+    def upsert(self, template: Dict[str, Any]):
+        """Insert or update one template"""
+        self.upsert_many([template])
+
+    def upsert_many(self, templates: Iterable[Dict[str, Any]]):
+        """Insert or update templates in a single transaction"""
+        now = datetime.now().isoformat()
+        with self._lock, self.connection:
+            next_position = self.connection.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM templates"
+            ).fetchone()[0]
+
+            for template in templates:
+                self.connection.execute("""
+                    INSERT INTO templates (template_id, name, data, usage_count, position, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(template_id) DO UPDATE SET
+                        name = excluded.name,
+                        data = excluded.data,
+                        usage_count = excluded.usage_count,
+                        updated_at = excluded.updated_at
+                """, (
+                    template['template_id'],
+                    template.get('name', ''),
+                    json.dumps(template, ensure_ascii=False),
+                    template.get('usage_count', 0),
+                    next_position,
+                    now
+                ))
+                next_position += 1
+
+    def set_usage_counts(self, usage_counts: Dict[str, int]):
+        """Update the usage counters of several templates in one transaction"""
+        if not usage_counts:
+            return
+
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "UPDATE templates SET usage_count = ? WHERE template_id = ?",
+                [(count, template_id) for template_id, count in usage_counts.items()]
+            )
+
+    def delete(self, template_id: str) -> bool:
+        """Delete a template; returns False if it did not exist"""
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM templates WHERE template_id = ?", (template_id,)
+            )
+            return cursor.rowcount > 0
@@ -6,9 +6,6 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 from datetime import datetime, date, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
 import sys
 import os
 
@@ -18,6 +15,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.task import Task
 from models.category import Category, Priority
 from models.goal import Goal
+from gui.chart_manager import ChartManager
+from services.event_bus import event_bus, TASK_EVENTS, GOAL_EVENTS
+
+# Off-main-thread chart rasterization
+try:
+    from services.chart_renderer import chart_renderer
+    CHART_RENDERER_AVAILABLE = True
+except ImportError:
+    CHART_RENDERER_AVAILABLE = False
+    chart_renderer = None
 
 class AnalyticsFrame(ctk.CTkFrame):
     """Analytics and reporting interface"""
@@ -27,8 +34,17 @@ class AnalyticsFrame(ctk.CTkFrame):
         self.main_window = main_window
         self.tasks = []
         self.goals = []
+        self.data_version = 0
+        self.data_fingerprint = None
+
+        # Task and goal changes from the change bus, applied together when idle
+        self.pending_events = []
+        self.apply_changes_scheduled = False
+
         self.setup_ui()
         self.load_data()
+        self.update_analytics()
+        event_bus.subscribe(self.on_data_changed, TASK_EVENTS + GOAL_EVENTS)
 
     def setup_ui(self):
         """Setup analytics UI"""
@@ -166,8 +182,12 @@ class AnalyticsFrame(ctk.CTkFrame):
         self.analytics_frame.grid_columnconfigure(0, weight=1)
         self.analytics_frame.grid_rowconfigure(0, weight=1)
 
-        # Initial view
-        self.show_overview()
+        # Rendered views are cached per (chart, period, data version)
+        self.chart_manager = ChartManager(
+            self.analytics_frame,
+            renderer=chart_renderer if CHART_RENDERER_AVAILABLE else None
+        )
+        self.view_frame = None
 
     def get_filtered_tasks(self):
         """Get tasks filtered by selected time period"""
@@ -191,9 +211,12 @@ class AnalyticsFrame(ctk.CTkFrame):
         """Update analytics display based on selection"""
         analytics_type = self.analytics_var.get()
 
-        # Clear current display
-        for widget in self.analytics_frame.winfo_children():
-            widget.destroy()
+        # Reuse the rendered view if nothing changed since it was built
+        view_key = (analytics_type, self.period_var.get(), self.data_version)
+        if self.chart_manager.show_view(view_key):
+            return
+
+        self.view_frame = self.chart_manager.create_view(view_key)
 
         # Show selected analytics
         if analytics_type == "overview":
@@ -212,7 +235,7 @@ class AnalyticsFrame(ctk.CTkFrame):
     def show_overview(self):
         """Show overview analytics"""
         # Create scrollable frame
-        overview_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        overview_frame = ctk.CTkScrollableFrame(self.view_frame)
         overview_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Title
@@ -316,30 +339,12 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        labels = list(status_counts.keys())
-        sizes = list(status_counts.values())
-        colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
-
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-
-        # Style text
-        for text in texts:
-            text.set_color('white')
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_weight('bold')
-
-        ax.set_title('Task Status Distribution', color='white', fontweight='bold')
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {
+            'labels': list(status_counts.keys()),
+            'sizes': list(status_counts.values())
+        }
+        self.chart_manager.render("status_pie_chart", chart_frame, chart_data, figsize=(6, 4))
 
     def create_daily_completion_chart(self, parent, tasks):
         """Create daily task completion chart"""
@@ -366,35 +371,13 @@ class AnalyticsFrame(ctk.CTkFrame):
             ])
             completions.append(day_completions)
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        ax.plot(dates, completions, marker='o', linewidth=2, markersize=6, color='#66b3ff')
-        ax.fill_between(dates, completions, alpha=0.3, color='#66b3ff')
-
-        # Style
-        ax.set_title('Daily Task Completions', color='white', fontweight='bold')
-        ax.set_xlabel('Date', color='white')
-        ax.set_ylabel('Completed Tasks', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'dates': dates, 'completions': completions}
+        self.chart_manager.render("daily_completion_chart", chart_frame, chart_data, figsize=(6, 4))
 
     def show_productivity(self):
         """Show productivity analytics"""
-        productivity_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        productivity_frame = ctk.CTkScrollableFrame(self.view_frame)
         productivity_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         title_label = ctk.CTkLabel(
@@ -663,40 +646,9 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Prepare data for all 24 hours
-        hours = list(range(24))
-        counts = [hour_counts.get(hour, 0) for hour in hours]
-
-        # Create bar chart
-        bars = ax.bar(hours, counts, color='#4CAF50', alpha=0.7)
-
-        # Highlight peak hour
-        if counts:
-            peak_hour = hours[counts.index(max(counts))]
-            bars[peak_hour].set_color('#FF9800')
-
-        # Style
-        ax.set_title('Tasks Completed by Hour of Day', color='white', fontweight='bold')
-        ax.set_xlabel('Hour of Day', color='white')
-        ax.set_ylabel('Tasks Completed', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        # Format x-axis
-        ax.set_xticks(range(0, 24, 3))
-        ax.set_xticklabels([f'{h}:00' for h in range(0, 24, 3)])
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'counts': [hour_counts.get(hour, 0) for hour in range(24)]}
+        self.chart_manager.render("peak_hours_chart", chart_frame, chart_data, figsize=(6, 4))
 
     def create_weekly_trends_chart(self, parent, completed_tasks):
         """Create weekly productivity trends chart"""
@@ -728,29 +680,9 @@ class AnalyticsFrame(ctk.CTkFrame):
             weeks_data.append(len(week_tasks))
             week_labels.append(f"{week_start.strftime('%m/%d')}")
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create line chart
-        ax.plot(week_labels, weeks_data, marker='o', linewidth=3, markersize=8, color='#2196F3')
-        ax.fill_between(week_labels, weeks_data, alpha=0.3, color='#2196F3')
-
-        # Style
-        ax.set_title('Weekly Task Completion Trend', color='white', fontweight='bold')
-        ax.set_xlabel('Week Starting', color='white')
-        ax.set_ylabel('Tasks Completed', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'week_labels': week_labels, 'weeks_data': weeks_data}
+        self.chart_manager.render("weekly_trends_chart", chart_frame, chart_data, figsize=(6, 4))
 
     def create_difficulty_analysis(self, parent, completed_tasks):
         """Create task difficulty analysis chart"""
@@ -808,38 +740,9 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create histogram
-        bins = [0, 2, 4, 6, 8, 10]
-        counts, _, patches = ax.hist(difficulty_scores, bins=bins, color='#9C27B0', alpha=0.7, edgecolor='white')
-
-        # Color code the bars
-        colors = ['#4CAF50', '#8BC34A', '#FFC107', '#FF9800', '#F44336']
-        for i, patch in enumerate(patches):
-            if i < len(colors):
-                patch.set_facecolor(colors[i])
-
-        # Style
-        ax.set_title('Task Difficulty Distribution', color='white', fontweight='bold')
-        ax.set_xlabel('Difficulty Score', color='white')
-        ax.set_ylabel('Number of Tasks', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        # Set x-axis labels
-        ax.set_xticks([1, 3, 5, 7, 9])
-        ax.set_xticklabels(['Easy\n(0-2)', 'Medium\n(2-4)', 'Hard\n(4-6)', 'Very Hard\n(6-8)', 'Expert\n(8-10)'])
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'scores': difficulty_scores}
+        self.chart_manager.render("difficulty_analysis", chart_frame, chart_data, figsize=(6, 4))
 
     def create_completion_time_chart(self, parent, completed_tasks):
         """Create completion time trends chart"""
@@ -867,45 +770,13 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create histogram with custom bins
-        bins = [0, 1, 6, 24, 72, 168, max(completion_times) + 1]
-        bin_labels = ['<1h', '1-6h', '6-24h', '1-3d', '3-7d', '>7d']
-
-        counts, _, patches = ax.hist(completion_times, bins=bins, color='#FF5722', alpha=0.7, edgecolor='white')
-
-        # Color code the bars
-        colors = ['#4CAF50', '#8BC34A', '#FFC107', '#FF9800', '#F44336', '#9C27B0']
-        for i, patch in enumerate(patches):
-            if i < len(colors):
-                patch.set_facecolor(colors[i])
-
-        # Style
-        ax.set_title('Task Completion Time Distribution', color='white', fontweight='bold')
-        ax.set_xlabel('Completion Time', color='white')
-        ax.set_ylabel('Number of Tasks', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        # Set custom x-axis labels
-        bin_centers = [(bins[i] + bins[i+1]) / 2 for i in range(len(bins)-1)]
-        ax.set_xticks(bin_centers)
-        ax.set_xticklabels(bin_labels)
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'completion_times': completion_times}
+        self.chart_manager.render("completion_time_chart", chart_frame, chart_data, figsize=(6, 4))
 
     def show_categories(self):
         """Show category analytics"""
-        categories_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        categories_frame = ctk.CTkScrollableFrame(self.view_frame)
         categories_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         title_label = ctk.CTkLabel(
@@ -970,7 +841,7 @@ class AnalyticsFrame(ctk.CTkFrame):
 
     def show_priorities(self):
         """Show priority analytics"""
-        priorities_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        priorities_frame = ctk.CTkScrollableFrame(self.view_frame)
         priorities_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         title_label = ctk.CTkLabel(
@@ -1107,34 +978,12 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(5, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create pie chart
-        labels = list(priority_counts.keys())
-        sizes = list(priority_counts.values())
-        colors = ['#4CAF50', '#FFC107', '#FF9800', '#F44336']  # Green, Yellow, Orange, Red
-
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors[:len(labels)],
-                                         autopct='%1.1f%%', startangle=90)
-
-        # Style text
-        for text in texts:
-            text.set_color('white')
-            text.set_fontsize(10)
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-
-        ax.set_title('Priority Distribution', color='white', fontweight='bold', pad=20)
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {
+            'labels': list(priority_counts.keys()),
+            'sizes': list(priority_counts.values())
+        }
+        self.chart_manager.render("priority_distribution_chart", chart_frame, chart_data, figsize=(5, 4))
 
     def create_priority_completion_chart(self, parent, tasks, priorities):
         """Create priority completion rate bar chart"""
@@ -1176,37 +1025,13 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(5, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create bar chart
-        bars = ax.bar(priority_names, completion_rates, color=colors, alpha=0.8, edgecolor='white')
-
-        # Add value labels on bars
-        for bar, rate in zip(bars, completion_rates):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{rate:.1f}%', ha='center', va='bottom', color='white', fontweight='bold')
-
-        # Style
-        ax.set_title('Completion Rate by Priority', color='white', fontweight='bold')
-        ax.set_ylabel('Completion Rate (%)', color='white')
-        ax.set_ylim(0, 105)
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3, axis='y')
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'names': priority_names, 'rates': completion_rates, 'colors': colors}
+        self.chart_manager.render("priority_completion_chart", chart_frame, chart_data, figsize=(5, 4))
 
     def show_completion_rate(self):
         """Show completion rate analytics"""
-        completion_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        completion_frame = ctk.CTkScrollableFrame(self.view_frame)
         completion_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         title_label = ctk.CTkLabel(
@@ -1338,38 +1163,12 @@ class AnalyticsFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(5, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create donut chart
-        labels = list(status_counts.keys())
-        sizes = list(status_counts.values())
-        colors = ['#4CAF50', '#2196F3', '#FF9800', '#F44336']
-
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors[:len(labels)],
-                                         autopct='%1.1f%%', startangle=90, pctdistance=0.85)
-
-        # Create donut hole
-        centre_circle = plt.Circle((0,0), 0.70, fc='#212121')
-        fig.gca().add_artist(centre_circle)
-
-        # Style text
-        for text in texts:
-            text.set_color('white')
-            text.set_fontsize(10)
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-
-        ax.set_title('Status Distribution', color='white', fontweight='bold', pad=20)
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {
+            'labels': list(status_counts.keys()),
+            'sizes': list(status_counts.values())
+        }
+        self.chart_manager.render("status_distribution_chart", chart_frame, chart_data, figsize=(5, 4))
 
     def create_weekly_completion_trend(self, parent, completed_tasks):
         """Create weekly completion trend line chart"""
@@ -1409,34 +1208,13 @@ class AnalyticsFrame(ctk.CTkFrame):
         weeks = [week[0] for week in sorted_weeks]
         counts = [week[1] for week in sorted_weeks]
 
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(5, 4))
-        fig.patch.set_facecolor('#212121')
-        ax.set_facecolor('#212121')
-
-        # Create line chart
-        ax.plot(weeks, counts, marker='o', linewidth=2, markersize=6, color='#4CAF50')
-        ax.fill_between(weeks, counts, alpha=0.3, color='#4CAF50')
-
-        # Style
-        ax.set_title('Weekly Completion Trend', color='white', fontweight='bold')
-        ax.set_ylabel('Tasks Completed', color='white')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3)
-
-        # Format x-axis dates
-        ax.tick_params(axis='x', rotation=45)
-
-        plt.tight_layout()
-
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        # Render chart
+        chart_data = {'weeks': weeks, 'counts': counts}
+        self.chart_manager.render("weekly_completion_trend", chart_frame, chart_data, figsize=(5, 4))
 
     def show_goals_progress(self):
         """Show goals progress analytics"""
-        goals_frame = ctk.CTkScrollableFrame(self.analytics_frame)
+        goals_frame = ctk.CTkScrollableFrame(self.view_frame)
         goals_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         title_label = ctk.CTkLabel(
@@ -1504,6 +1282,19 @@ class AnalyticsFrame(ctk.CTkFrame):
         try:
             self.tasks = Task.get_all()
             self.goals = Goal.get_all()
+
+            # Bump the data version only when tasks or goals actually changed,
+            # so cached charts survive a refresh with identical data
+            fingerprint = hash((
+                tuple((t.id, t.status, t.updated_at, t.completed_at) for t in self.tasks),
+                tuple((g.id, g.progress_percentage) for g in self.goals)
+            ))
+            if fingerprint != self.data_fingerprint:
+                self.data_fingerprint = fingerprint
+                self.data_version += 1
+                if hasattr(self, 'chart_manager'):
+                    self.chart_manager.invalidate()
+
             self.update_quick_stats()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load analytics data: {e}")
@@ -1512,3 +1303,61 @@ class AnalyticsFrame(ctk.CTkFrame):
         """Refresh analytics data"""
         self.load_data()
         self.update_analytics()
+
+    def on_data_changed(self, event):
+        """Queue a change from the change bus and apply the batch once idle"""
+        self.pending_events.append(event)
+        if not self.apply_changes_scheduled:
+            self.apply_changes_scheduled = True
+            self.after_idle(self.apply_data_changes)
+
+    def apply_data_changes(self):
+        """Apply queued task changes in memory and re-render the current view"""
+        self.apply_changes_scheduled = False
+        events, self.pending_events = self.pending_events, []
+        if not events or not self.winfo_exists():
+            return
+
+        try:
+            tasks_by_id = {task.id: task for task in self.tasks}
+            goals_changed = False
+
+            for event in events:
+                if event.entity == 'goal':
+                    goals_changed = True
+                elif event.action == 'deleted':
+                    tasks_by_id.pop(event.entity_id, None)
+                elif event.action == 'created':
+                    # created_at is set by the database, so read the new row back
+                    task = Task.get_by_id(event.entity_id)
+                    if task:
+                        tasks_by_id[task.id] = task
+                else:
+                    task = Task._from_dict(event.data)
+                    previous = tasks_by_id.get(task.id)
+                    if previous is not None:
+                        task.created_at = previous.created_at
+                        task.updated_at = previous.updated_at
+                    tasks_by_id[task.id] = task
+
+            self.tasks = sorted(tasks_by_id.values(), key=lambda t: t.created_at or datetime.min, reverse=True)
+            if goals_changed:
+                self.goals = Goal.get_all()
+
+            # Cached charts are stale now; the next load_data recomputes the fingerprint
+            self.data_fingerprint = None
+            self.data_version += 1
+            self.chart_manager.invalidate()
+
+            self.update_quick_stats()
+            self.update_analytics()
+
+        except Exception as e:
+            print(f"Error applying analytics changes: {e}")
+
+    def destroy(self):
+        """Close cached charts before destroying the frame"""
+        event_bus.unsubscribe(self.on_data_changed)
+        if hasattr(self, 'chart_manager'):
+            self.chart_manager.clear()
+        super().destroy()
@@ -17,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.task import Task
 from models.category import Category, Priority
 from gui.dialogs.task_dialog import TaskDialog
+from services.event_bus import event_bus, TASK_EVENTS
 
 # Import notification manager
 try:
@@ -37,13 +38,24 @@ class CalendarFrame(ctk.CTkFrame):
         self.view_mode = "month"  # month, week, day
         self.tasks = []
 
+        # Persistent month view: the tkcalendar widget is built once and
+        # updated in place; task markers are tracked per date (date -> event id)
+        self.month_view_frame = None
+        self.calendar_widget = None
+        self.task_markers = {}
+
         # Pagination variables for task details
         self.task_page = 1
         self.task_page_size = 5
         self.total_task_pages = 1
 
+        # Task changes from the change bus, applied together when the event loop is idle
+        self.pending_events = []
+        self.apply_changes_scheduled = False
+
         self.setup_ui()
         self.load_tasks()
+        event_bus.subscribe(self.on_task_changed, TASK_EVENTS)
 
     def setup_ui(self):
         """Setup calendar UI"""
@@ -168,22 +180,41 @@ class CalendarFrame(ctk.CTkFrame):
         self.create_calendar_widget()
 
     def create_calendar_widget(self):
-        """Create the calendar widget based on view mode"""
-        # Clear existing calendar
+        """Show the calendar for the current view mode.
+
+        The month view is created once and then updated in place (display
+        month and task markers); week and day views are rebuilt since their
+        content depends entirely on the period being shown.
+        """
+        # Clear existing week/day widgets, keeping the persistent month view
         for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+            if widget is not self.month_view_frame:
+                widget.destroy()
 
         if self.view_mode == "month":
-            self.create_month_view()
-        elif self.view_mode == "week":
-            self.create_week_view()
-        else:  # day view
-            self.create_day_view()
+            if self.month_view_frame is None:
+                self.create_month_view()
+            else:
+                self.month_view_frame.grid()
+                self.update_month_view()
+        else:
+            if self.month_view_frame is not None:
+                self.month_view_frame.grid_remove()
+
+            if self.view_mode == "week":
+                self.create_week_view()
+            else:  # day view
+                self.create_day_view()
 
     def create_month_view(self):
         """Create modern month calendar view"""
+        self.month_view_frame = ctk.CTkFrame(self.calendar_frame, fg_color="transparent")
+        self.month_view_frame.grid(row=0, column=0, rowspan=2, sticky="nsew")
+        self.month_view_frame.grid_columnconfigure(0, weight=1)
+        self.month_view_frame.grid_rowconfigure(1, weight=1)
+
         # Calendar header
-        header_frame = ctk.CTkFrame(self.calendar_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(self.month_view_frame, fg_color="transparent")
         header_frame.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 10))
         header_frame.grid_columnconfigure(0, weight=1)
 
@@ -203,7 +234,7 @@ class CalendarFrame(ctk.CTkFrame):
         cal_subtitle.grid(row=1, column=0, sticky="w", pady=(2, 0))
 
         # Modern calendar widget with better styling
-        calendar_container = ctk.CTkFrame(self.calendar_frame, corner_radius=15)
+        calendar_container = ctk.CTkFrame(self.month_view_frame, corner_radius=15)
         calendar_container.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
 
         self.calendar_widget = Calendar(
@@ -235,6 +266,20 @@ class CalendarFrame(ctk.CTkFrame):
         self.calendar_widget.bind("<<CalendarSelected>>", self.on_date_selected)
 
         # Mark dates with tasks
+        self.task_markers = {}
+        self.mark_task_dates()
+
+    def update_month_view(self):
+        """Move the existing month calendar to the current date in place"""
+        if self.calendar_widget is None:
+            return
+
+        try:
+            self.calendar_widget.selection_set(self.current_date)
+            self.calendar_widget.see(self.current_date)
+        except Exception as e:
+            print(f"Error updating month view: {e}")
+
         self.mark_task_dates()
 
     def create_week_view(self):
@@ -568,26 +613,37 @@ class CalendarFrame(ctk.CTkFrame):
         self.task_next_btn.pack(side="left", padx=(5, 0))
 
     def mark_task_dates(self):
-        """Mark dates that have tasks on the calendar"""
-        if hasattr(self, 'calendar_widget'):
-            # Get all task dates for current month
-            task_dates = set()
-            for task in self.tasks:
-                if (task.due_date and
-                    task.due_date.year == self.current_date.year and
-                    task.due_date.month == self.current_date.month):
-                    task_dates.add(task.due_date)
-
-            # Mark dates (this is a simplified approach)
-            for task_date in task_dates:
-                try:
-                    self.calendar_widget.calevent_create(task_date, "Tasks", "task_marker")
-                except:
-                    pass
+        """Mark dates that have tasks on the calendar.
+
+        Only the difference against the markers already on the calendar is
+        applied: markers for dates without tasks are removed and dates that
+        gained tasks get a new marker.
+        """
+        if self.calendar_widget is None:
+            return
+
+        task_dates = {task.due_date for task in self.tasks if task.due_date}
+
+        # Remove markers for dates that no longer have tasks
+        for task_date in set(self.task_markers) - task_dates:
+            event_id = self.task_markers.pop(task_date)
+            try:
+                self.calendar_widget.calevent_remove(event_id)
+            except Exception:
+                pass
+
+        # Add markers for newly scheduled dates
+        for task_date in task_dates - set(self.task_markers):
+            try:
+                self.task_markers[task_date] = self.calendar_widget.calevent_create(
+                    task_date, "Tasks", "task_marker"
+                )
+            except Exception:
+                pass
 
     def on_date_selected(self, event=None):
         """Handle calendar date selection"""
-        if hasattr(self, 'calendar_widget'):
+        if self.calendar_widget is not None:
             selected = self.calendar_widget.selection_get()
             self.selected_date = selected
             self.task_page = 1  # Reset to first page when date changes
@@ -906,15 +962,11 @@ class CalendarFrame(ctk.CTkFrame):
             task = dialog.result
             task.due_date = self.selected_date
             task.save()
-            self.refresh_data()
-            self.main_window.update_quick_stats()
 
     def edit_task(self, task):
         """Edit selected task"""
-        dialog = TaskDialog(self, task=task)
-        if dialog.result:
-            self.refresh_data()
-            self.main_window.update_quick_stats()
+        # Saving in the dialog publishes the change, which updates the calendar
+        TaskDialog(self, task=task)
 
     def complete_task(self, task):
         """Mark task as completed"""
@@ -923,8 +975,6 @@ class CalendarFrame(ctk.CTkFrame):
             # Send completion notification
             if NOTIFICATIONS_AVAILABLE and notification_manager:
                 notification_manager.send_task_completion_notification(task)
-            self.refresh_data()
-            self.main_window.update_quick_stats()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to complete task: {e}")
 
@@ -934,8 +984,6 @@ class CalendarFrame(ctk.CTkFrame):
             task.status = "pending"
             task.completed_at = None
             task.save()
-            self.refresh_data()
-            self.main_window.update_quick_stats()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to reopen task: {e}")
 
@@ -943,12 +991,56 @@ class CalendarFrame(ctk.CTkFrame):
         """Load tasks from database"""
         try:
             self.tasks = Task.get_all()
-            if hasattr(self, 'calendar_widget'):
-                self.mark_task_dates()
+            self.mark_task_dates()
             self.update_task_details()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load tasks: {e}")
 
+    def on_task_changed(self, event):
+        """Queue a change from the change bus and apply the batch once idle"""
+        self.pending_events.append(event)
+        if not self.apply_changes_scheduled:
+            self.apply_changes_scheduled = True
+            self.after_idle(self.apply_task_changes)
+
+    def apply_task_changes(self):
+        """Apply queued task changes to the loaded tasks and the affected dates only"""
+        self.apply_changes_scheduled = False
+        events, self.pending_events = self.pending_events, []
+        if not events or not self.winfo_exists():
+            return
+
+        try:
+            tasks_by_id = {task.id: task for task in self.tasks}
+            affected_dates = set()
+
+            for event in events:
+                affected_dates.add(event.old_value('due_date'))
+                if event.action == 'deleted':
+                    tasks_by_id.pop(event.entity_id, None)
+                else:
+                    task = Task._from_dict(event.data)
+                    tasks_by_id[task.id] = task
+                    affected_dates.add(task.due_date)
+
+            self.tasks = list(tasks_by_id.values())
+
+            if self.view_mode == "month":
+                self.mark_task_dates()
+            else:
+                self.create_calendar_widget()
+
+            if self.selected_date in affected_dates:
+                self.update_task_details()
+
+        except Exception as e:
+            print(f"Error applying task changes: {e}")
+
+    def destroy(self):
+        """Stop listening for task changes before destroying the frame"""
+        event_bus.unsubscribe(self.on_task_changed)
+        super().destroy()
+
     def refresh_data(self):
         """Refresh calendar data"""
         self.load_tasks()
@@ -0,0 +1,184 @@
+"""
+Chart manager for the analytics views of Task Planner application
+"""
+
+from collections import OrderedDict
+import io
+import customtkinter as ctk
+
+from services.chart_renderer import draw_chart
+
+
+class ChartManager:
+    """Caches rendered analytics views and reuses their matplotlib figures.
+
+    Each view is keyed by ``(chart, period, data_version)``.  Switching back
+    to a view that is still cached only re-packs it, so no figure is drawn
+    again.  Least recently used views are evicted once ``max_views`` is
+    exceeded; their figures are cleared and kept as spares for the next chart
+    of the same name (at most ``max_spares`` per name), anything beyond that
+    is closed.
+
+    When a ``renderer`` (see ``services.chart_renderer``) is given, charts
+    are rasterized by its worker pool and only blitted here as images.
+    matplotlib is imported lazily, so it is only loaded into the UI process
+    when a chart has to be drawn in-process.
+    """
+
+    def __init__(self, parent, renderer=None, max_views: int = 6, max_spares: int = 1):
+        self.parent = parent
+        self.renderer = renderer
+        self.max_views = max_views
+        self.max_spares = max_spares
+        self.views = OrderedDict()  # key -> {'frame': widget, 'figures': [(name, fig)]}
+        self.spare_figures = {}  # chart name -> [Figure]
+        self.current_key = None
+        self._building = None
+
+    def show_view(self, key) -> bool:
+        """Show a cached view; returns False when it has to be built first"""
+        view = self.views.get(key)
+        if view is None or not view['frame'].winfo_exists():
+            self.views.pop(key, None)
+            return False
+
+        self._hide_current()
+        self.views.move_to_end(key)
+        view['frame'].pack(fill="both", expand=True)
+        self.current_key = key
+        return True
+
+    def create_view(self, key):
+        """Create, register and show an empty container for a new view"""
+        self._hide_current()
+        self._evict(key)
+
+        frame = ctk.CTkFrame(self.parent, fg_color="transparent")
+        frame.pack(fill="both", expand=True)
+
+        self.views[key] = {'frame': frame, 'figures': []}
+        self.current_key = key
+        self._building = self.views[key]
+
+        while len(self.views) > self.max_views:
+            self._evict(next(iter(self.views)))
+
+        return frame
+
+    def render(self, name: str, parent, data, figsize=(6, 4)):
+        """Render a registered chart into ``parent``.
+
+        With a renderer the chart is drawn in a worker and a placeholder is
+        shown until the PNG arrives; otherwise it is drawn in-process on a
+        (possibly reused) figure.
+        """
+        if self.renderer is None:
+            self._draw_in_process(name, parent, data, figsize)
+            return
+
+        width, height = int(figsize[0] * 100), int(figsize[1] * 100)
+        placeholder = ctk.CTkLabel(parent, text="Rendering chart...", text_color="gray",
+                                   width=width, height=height)
+        placeholder.pack(fill="both", expand=True, padx=10, pady=10)
+
+        future = self.renderer.render(name, data, figsize)
+        self._wait_for_image(future, placeholder, name, data, figsize)
+
+    def get_figure(self, name: str, figsize=(6, 4), reuse: bool = True):
+        """Return ``(fig, ax)`` for a chart, reusing a spare figure and axes if possible"""
+        spares = self.spare_figures.get(name) if reuse else None
+        if spares:
+            fig = spares.pop()
+            fig.set_size_inches(*figsize, forward=False)
+            ax = fig.axes[0]
+            ax.cla()
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=figsize)
+            ax = fig.add_subplot(111)
+
+        if reuse and self._building is not None:
+            self._building['figures'].append((name, fig))
+
+        return fig, ax
+
+    def embed(self, fig, parent):
+        """Draw a figure into a Tk canvas packed inside ``parent``"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        return canvas
+
+    def _draw_in_process(self, name, parent, data, figsize, reuse=True):
+        """Draw a chart on the UI thread"""
+        fig, ax = self.get_figure(name, figsize, reuse=reuse)
+        draw_chart(name, fig, ax, data)
+        self.embed(fig, parent)
+
+    def _wait_for_image(self, future, placeholder, name, data, figsize):
+        """Poll a render job from the Tk loop and blit the result when ready"""
+        if not placeholder.winfo_exists():
+            return
+
+        if not future.done():
+            placeholder.after(30, self._wait_for_image, future, placeholder, name, data, figsize)
+            return
+
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(future.result()))
+            image.load()
+        except Exception as e:
+            print(f"Chart rendering failed, drawing in-process: {e}")
+            parent = placeholder.master
+            placeholder.destroy()
+            self._draw_in_process(name, parent, data, figsize, reuse=False)
+            return
+
+        ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        placeholder.configure(image=ctk_image, text="")
+        placeholder.image = ctk_image  # Keep a reference
+
+    def invalidate(self):
+        """Drop every cached view, e.g. after the underlying data changed"""
+        for key in list(self.views):
+            self._evict(key)
+        self.current_key = None
+
+    def clear(self):
+        """Drop all cached views and close every figure"""
+        self.invalidate()
+        for spares in self.spare_figures.values():
+            for fig in spares:
+                fig.clf()
+        self.spare_figures.clear()
+
+    def _hide_current(self):
+        """Unpack the view currently on screen, keeping it cached"""
+        view = self.views.get(self.current_key)
+        if view is not None and view['frame'].winfo_exists():
+            view['frame'].pack_forget()
+        self.current_key = None
+
+    def _evict(self, key):
+        """Destroy a cached view and recycle or close its figures"""
+        view = self.views.pop(key, None)
+        if view is None:
+            return
+
+        if self._building is view:
+            self._building = None
+
+        try:
+            view['frame'].destroy()
+        except Exception:
+            pass
+
+        for name, fig in view['figures']:
+            spares = self.spare_figures.setdefault(name, [])
+            if len(spares) < self.max_spares and len(fig.axes) == 1:
+                spares.append(fig)
+            else:
+                fig.clf()
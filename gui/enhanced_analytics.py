@@ -6,10 +6,8 @@ Enhanced Analytics Dashboard for Task Planner
 import tkinter as tk
 import customtkinter as ctk
 from typing import Dict, Any, List
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from gui.chart_manager import ChartManager
+from services.event_bus import event_bus, TASK_EVENTS, GOAL_EVENTS
 
 try:
     from services.analytics_manager import analytics_manager
@@ -18,6 +16,14 @@ try:
 except ImportError:
     ANALYTICS_AVAILABLE = False
 
+# Off-main-thread chart rasterization
+try:
+    from services.chart_renderer import chart_renderer
+    CHART_RENDERER_AVAILABLE = True
+except ImportError:
+    CHART_RENDERER_AVAILABLE = False
+    chart_renderer = None
+
 class EnhancedAnalytics(ctk.CTkFrame):
     """Enhanced analytics dashboard with charts and insights"""
     
@@ -25,6 +31,7 @@ class EnhancedAnalytics(ctk.CTkFrame):
         super().__init__(parent)
         self.main_window = main_window
         self.current_period = 30  # days
+        self.reload_id = None
         
         if not ANALYTICS_AVAILABLE:
             self.show_unavailable_message()
@@ -32,6 +39,7 @@ class EnhancedAnalytics(ctk.CTkFrame):
         
         self.setup_ui()
         self.load_analytics_data()
+        event_bus.subscribe(self.on_data_changed, TASK_EVENTS + GOAL_EVENTS)
     
     def show_unavailable_message(self):
         """Show message when analytics are not available"""
@@ -49,6 +57,12 @@ class EnhancedAnalytics(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
+        # Charts are rasterized by the renderer's worker pool when available
+        self.chart_manager = ChartManager(
+            self,
+            renderer=chart_renderer if CHART_RENDERER_AVAILABLE else None
+        )
+        
         # Header with controls
         self.create_header()
         
@@ -266,38 +280,16 @@ class EnhancedAnalytics(ctk.CTkFrame):
         if not self.productivity_data.get('daily_stats'):
             return
         
-        # Create matplotlib figure
-        fig = Figure(figsize=(10, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        
         # Prepare data
         daily_stats = self.productivity_data['daily_stats']
-        dates = [stat['date'] for stat in daily_stats]
-        completed = [stat['completed_tasks'] for stat in daily_stats]
-        created = [stat['created_tasks'] for stat in daily_stats]
-        
-        # Create chart
-        x = range(len(dates))
-        ax.bar([i - 0.2 for i in x], created, 0.4, label='Created', alpha=0.7, color='#3b82f6')
-        ax.bar([i + 0.2 for i in x], completed, 0.4, label='Completed', alpha=0.7, color='#10b981')
-        
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Tasks')
-        ax.set_title('Daily Task Activity')
-        ax.legend()
-        
-        # Format x-axis
-        if len(dates) <= 30:
-            step = max(1, len(dates) // 10)
-            ax.set_xticks(range(0, len(dates), step))
-            ax.set_xticklabels([dates[i][-5:] for i in range(0, len(dates), step)], rotation=45)
-        
-        fig.tight_layout()
-        
-        # Add to GUI
-        canvas = FigureCanvasTkAgg(fig, self.overview_chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        chart_data = {
+            'dates': [stat['date'] for stat in daily_stats],
+            'completed': [stat['completed_tasks'] for stat in daily_stats],
+            'created': [stat['created_tasks'] for stat in daily_stats]
+        }
+        
+        # Render chart off the UI thread and show it as an image
+        self.chart_manager.render("daily_activity_chart", self.overview_chart_frame, chart_data, figsize=(10, 4))
     
     def update_productivity_display(self):
         """Update productivity tab display"""
@@ -330,3 +322,22 @@ class EnhancedAnalytics(ctk.CTkFrame):
     def refresh_data(self):
         """Refresh all analytics data"""
         self.load_analytics_data()
+    
+    def on_data_changed(self, event):
+        """Recompute the aggregates once for a burst of task or goal changes"""
+        if self.reload_id is None:
+            self.reload_id = self.after(500, self.apply_data_changes)
+    
+    def apply_data_changes(self):
+        """Run the reload scheduled by on_data_changed"""
+        self.reload_id = None
+        if self.winfo_exists():
+            self.load_analytics_data()
+    
+    def destroy(self):
+        """Stop listening for changes before destroying the frame"""
+        event_bus.unsubscribe(self.on_data_changed)
+        if self.reload_id is not None:
+            self.after_cancel(self.reload_id)
+            self.reload_id = None
+        super().destroy()
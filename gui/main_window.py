@@ -12,44 +12,48 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from gui.task_manager import TaskManagerFrame
-from gui.calendar_view import CalendarFrame
-from gui.analytics import AnalyticsFrame
-from gui.settings import SettingsFrame
-from gui.dialogs.help_dialog import HelpDialog
 from models.task import Task
 from models.category import Category, Priority
+from utils.lazy_loader import lazy_import
+from services.event_bus import event_bus, TASK_EVENTS
 
-# Import notification manager
-try:
-    from services.notification_manager import notification_manager
-    NOTIFICATIONS_AVAILABLE = True
-except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
-    notification_manager = None
+# Views (and the heavy modules they pull in, e.g. tkcalendar or matplotlib)
+# are imported on first navigation in the show_* methods below
+
+# Import notification manager on first use - constructing it starts the
+# reminder thread, so it is loaded by init_notifications
+notification_manager = lazy_import('services.notification_manager', 'notification_manager')
+NOTIFICATIONS_AVAILABLE = True
 
 # Import enhanced services
 try:
     from services.theme_manager import theme_manager
     from services.keyboard_manager import KeyboardManager
-    from services.search_manager import search_manager
-    from services.template_manager import template_manager
     ENHANCED_FEATURES_AVAILABLE = True
 except ImportError:
     ENHANCED_FEATURES_AVAILABLE = False
     print("Enhanced features not available - using basic functionality")
 
+# Loaded on first search / template use
+search_manager = lazy_import('services.search_manager', 'search_manager')
+template_manager = lazy_import('services.template_manager', 'template_manager')
+
 class MainWindow:
     """Main application window"""
 
-    def __init__(self, root):
+    def __init__(self, root, defer_services=False):
         self.root = root
         self.current_frame = None
 
+        # When deferred, the caller starts notifications and fills in the
+        # license panel once the window is shown (see main.py)
+        self.defer_services = defer_services
+
         # Initialize enhanced features
         self.keyboard_manager = None
         self.global_search_visible = False
         self.license_update_id = None
+        self.stats_update_id = None
 
         if ENHANCED_FEATURES_AVAILABLE:
             # Initialize keyboard manager
@@ -71,6 +75,9 @@ class MainWindow:
         self.setup_ui()
         self.load_initial_data()
 
+        # Keep the sidebar stats current whenever a task changes
+        event_bus.subscribe(self.on_task_changed, TASK_EVENTS)
+
     def setup_ui(self):
         """Setup main window UI"""
         # Configure grid weights
@@ -87,7 +94,8 @@ class MainWindow:
         self.create_main_content()
 
         # Initialize notifications
-        self.init_notifications()
+        if not self.defer_services:
+            self.init_notifications()
 
         # Show default view
         self.show_tasks()
@@ -361,7 +369,8 @@ class MainWindow:
         self.license_status_label.pack(pady=(0, 10), padx=10, fill="x")
 
         # Update license status
-        self.update_license_status()
+        if not self.defer_services:
+            self.update_license_status()
 
         # Schedule periodic updates (store the after ID to prevent orphaned callbacks)
         self.license_update_id = self.root.after(60000, self.schedule_license_update)  # Update every minute
@@ -436,6 +445,7 @@ class MainWindow:
         self.clear_main_content()
         self.update_nav_buttons('tasks')
 
+        from gui.task_manager import TaskManagerFrame
         self.current_frame = TaskManagerFrame(self.main_content, self)
         self.current_frame.pack(fill="both", expand=True)
 
@@ -446,6 +456,7 @@ class MainWindow:
         self.clear_main_content()
         self.update_nav_buttons('calendar')
 
+        from gui.calendar_view import CalendarFrame
         self.current_frame = CalendarFrame(self.main_content, self)
         self.current_frame.pack(fill="both", expand=True)
 
@@ -487,6 +498,7 @@ class MainWindow:
         self.clear_main_content()
         self.update_nav_buttons('settings')
 
+        from gui.settings import SettingsFrame
         self.current_frame = SettingsFrame(self.main_content, self)
         self.current_frame.pack(fill="both", expand=True)
 
@@ -509,6 +521,7 @@ class MainWindow:
 
     def show_help(self):
         """Show help and instructions dialog"""
+        from gui.dialogs.help_dialog import HelpDialog
         HelpDialog(self.root)
 
     def update_quick_stats(self):
@@ -536,14 +549,26 @@ class MainWindow:
         except Exception as e:
             print(f"Error updating quick stats: {e}")
 
+    def on_task_changed(self, event):
+        """Refresh the quick stats once for a burst of task changes"""
+        if self.stats_update_id is None:
+            self.stats_update_id = self.root.after_idle(self.apply_stats_update)
+
+    def apply_stats_update(self):
+        """Run the quick stats update scheduled by on_task_changed"""
+        self.stats_update_id = None
+        self.update_quick_stats()
+
     def update_license_status(self):
         """Update license status display"""
         try:
-            from auth.license_manager import LicenseManager
-            license_manager = LicenseManager()
+            # Cached: only re-validated when the license files change or the
+            # remaining days tick over (see auth.license_state)
+            from auth.license_state import license_state
+            state = license_state.get_state()
 
-            if license_manager.is_license_valid():
-                license_info = license_manager.get_license_info()
+            if state['valid']:
+                license_info = state['info']
 
                 # Update license type
                 license_type = license_info.get('license_type', 'Unknown').title()
@@ -608,7 +633,7 @@ class MainWindow:
                     )
             else:
                 # Invalid license - check if it's expired
-                license_status = license_manager.current_license.get('status', 'invalid') if license_manager.current_license else 'invalid'
+                license_status = state['status']
 
                 if license_status == 'expired':
                     self.license_type_label.configure(
@@ -679,6 +704,12 @@ class MainWindow:
 
     def init_notifications(self):
         """Initialize notification system with persistent service"""
+        try:
+            notification_manager.load()
+        except ImportError as e:
+            print(f"Notification system not available: {e}")
+            return
+
         if NOTIFICATIONS_AVAILABLE and notification_manager:
             try:
                 # Start notification monitoring
@@ -776,7 +807,7 @@ class MainWindow:
                     print(f"⚠️ Error stopping notification service: {e}")
 
                 # Stop notification manager
-                if NOTIFICATIONS_AVAILABLE and notification_manager:
+                if NOTIFICATIONS_AVAILABLE and notification_manager.is_loaded:
                     try:
                         notification_manager.stop_monitoring()
                         print("✅ Notification manager stopped")
@@ -962,10 +993,6 @@ class MainWindow:
                 from gui.dialogs.task_dialog import TaskDialog
                 dialog = TaskDialog(self.root)
                 self.root.wait_window(dialog)
-
-                if dialog.result:
-                    self.refresh_data()
-                    self.update_quick_stats()
         except Exception as e:
             print(f"Error showing add task dialog: {e}")
 
@@ -1027,8 +1054,6 @@ class MainWindow:
             task = template_manager.create_task_from_template(template.template_id)
             if task:
                 dialog.destroy()
-                self.refresh_data()
-                self.update_quick_stats()
                 messagebox.showinfo("Success", f"Task created from template: {template.name}")
         except Exception as e:
             print(f"Error creating task from template: {e}")
@@ -1040,7 +1065,3 @@ class MainWindow:
         from gui.dialogs.task_dialog import TaskDialog
         dialog = TaskDialog(self.root)
         self.root.wait_window(dialog)
-
-        if dialog.result:
-            self.refresh_data()
-            self.update_quick_stats()
@@ -1076,8 +1076,8 @@ Database File: {conn_info.get('database', 'N/A')}"""
     def load_settings(self):
         """Load settings from file using SettingsManager"""
         try:
-            from database.settings_manager import SettingsManager
-            settings_manager = SettingsManager()
+            from database.settings_manager import get_settings_manager
+            settings_manager = get_settings_manager()
 
             # Get settings from SettingsManager (which uses AppData)
             return {
@@ -1248,8 +1248,8 @@ Database File: {conn_info.get('database', 'N/A')}"""
     def save_settings(self):
         """Save current settings using SettingsManager"""
         try:
-            from database.settings_manager import SettingsManager
-            settings_manager = SettingsManager()
+            from database.settings_manager import get_settings_manager
+            settings_manager = get_settings_manager()
 
             # Update settings from UI
             if hasattr(self, 'reminder_time_var'):
@@ -1284,8 +1284,9 @@ Database File: {conn_info.get('database', 'N/A')}"""
             if hasattr(self, 'notification_manager') and self.notification_manager:
                 self.update_notification_settings()
 
-            # Save to AppData using SettingsManager
+            # Save to AppData using SettingsManager (written now, not on the save timer)
             settings_manager.save()
+            settings_manager.flush()
 
             messagebox.showinfo("Success", "Settings saved successfully!")
 
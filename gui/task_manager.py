@@ -15,6 +15,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.task import Task
 from models.category import Category, Priority
 from gui.dialogs.task_dialog import TaskDialog
+from services.event_bus import event_bus, TASK_EVENTS
 
 # Import notification manager
 try:
@@ -43,6 +44,13 @@ class TaskManagerFrame(ctk.CTkFrame):
         self.selected_tasks = set()
         self.task_checkboxes = {}
 
+        # Row widgets of the current page (task id -> frame)
+        self.task_widgets = {}
+
+        # Task changes from the change bus, applied together when the event loop is idle
+        self.pending_events = []
+        self.apply_changes_scheduled = False
+
         # Filter panel state
         self.filter_panel_collapsed = False
 
@@ -56,6 +64,7 @@ class TaskManagerFrame(ctk.CTkFrame):
 
         self.setup_ui()
         self.load_tasks()
+        event_bus.subscribe(self.on_task_changed, TASK_EVENTS)
 
     def setup_ui(self):
         """Setup task manager UI"""
@@ -632,79 +641,80 @@ class TaskManagerFrame(ctk.CTkFrame):
             pass
         return ""
 
+    def get_active_filters(self):
+        """Resolve the filter controls to (status, priority_id, category_id, search_term)"""
+        # Filter by status
+        status_filter = self.status_var.get()
+        if status_filter == "all":
+            status_filter = None
+
+        # Filter by priority
+        priority_id = None
+        priority_filter = self.priority_var.get()
+        if priority_filter != "all":
+            priorities = Priority.get_all()
+            for p in priorities:
+                if p.name == priority_filter:
+                    priority_id = p.id
+                    break
+
+        # Filter by category
+        category_id = None
+        category_filter = self.category_var.get()
+        if category_filter != "all":
+            categories = Category.get_all()
+            for c in categories:
+                if c.name == category_filter:
+                    category_id = c.id
+                    break
+
+        search_term = self.search_var.get().lower().strip()
+        return status_filter, priority_id, category_id, search_term
+
+    def task_matches_filters(self, task, filters):
+        """Check a task against filters from get_active_filters()"""
+        status_filter, priority_id, category_id, search_term = filters
+
+        if status_filter and task.status != status_filter:
+            return False
+        if priority_id and task.priority_id != priority_id:
+            return False
+        if category_id and task.category_id != category_id:
+            return False
+
+        # Enhanced search functionality
+        if not search_term:
+            return True
+
+        # Search in titles
+        if hasattr(self, 'search_titles') and self.search_titles.get():
+            if search_term in task.title.lower():
+                return True
+
+        # Search in descriptions
+        if hasattr(self, 'search_descriptions') and self.search_descriptions.get():
+            if task.description and search_term in task.description.lower():
+                return True
+
+        # Search in categories
+        if hasattr(self, 'search_categories') and self.search_categories.get():
+            category_name = self.get_category_name(task.category_id)
+            if category_name and search_term in category_name.lower():
+                return True
+
+        # Search in priorities
+        priority_name = self.get_priority_name(task.priority_id)
+        if priority_name and search_term in priority_name.lower():
+            return True
+
+        # Search in status
+        return search_term in task.status.lower()
+
     def apply_filters(self, *args):
         """Apply current filters to task list"""
         try:
-            filtered_tasks = self.tasks.copy()
-
-            # Filter by status
-            status_filter = self.status_var.get()
-            if status_filter != "all":
-                filtered_tasks = [t for t in filtered_tasks if t.status == status_filter]
-
-            # Filter by priority
-            priority_filter = self.priority_var.get()
-            if priority_filter != "all":
-                priorities = Priority.get_all()
-                priority_id = None
-                for p in priorities:
-                    if p.name == priority_filter:
-                        priority_id = p.id
-                        break
-                if priority_id:
-                    filtered_tasks = [t for t in filtered_tasks if t.priority_id == priority_id]
-
-            # Filter by category
-            category_filter = self.category_var.get()
-            if category_filter != "all":
-                categories = Category.get_all()
-                category_id = None
-                for c in categories:
-                    if c.name == category_filter:
-                        category_id = c.id
-                        break
-                if category_id:
-                    filtered_tasks = [t for t in filtered_tasks if t.category_id == category_id]
-
-            # Enhanced search functionality
-            search_term = self.search_var.get().lower().strip()
-            if search_term:
-                search_filtered = []
-                for task in filtered_tasks:
-                    match_found = False
-
-                    # Search in titles
-                    if hasattr(self, 'search_titles') and self.search_titles.get():
-                        if search_term in task.title.lower():
-                            match_found = True
-
-                    # Search in descriptions
-                    if not match_found and hasattr(self, 'search_descriptions') and self.search_descriptions.get():
-                        if task.description and search_term in task.description.lower():
-                            match_found = True
-
-                    # Search in categories
-                    if not match_found and hasattr(self, 'search_categories') and self.search_categories.get():
-                        category_name = self.get_category_name(task.category_id)
-                        if category_name and search_term in category_name.lower():
-                            match_found = True
-
-                    # Search in priorities
-                    if not match_found:
-                        priority_name = self.get_priority_name(task.priority_id)
-                        if priority_name and search_term in priority_name.lower():
-                            match_found = True
-
-                    # Search in status
-                    if not match_found and search_term in task.status.lower():
-                        match_found = True
-
-                    if match_found:
-                        search_filtered.append(task)
-
-                filtered_tasks = search_filtered
-
-            self.filtered_tasks = filtered_tasks
+            filters = self.get_active_filters()
+            self.filtered_tasks = [t for t in self.tasks if self.task_matches_filters(t, filters)]
             self.current_page = 1  # Reset to first page when filters change
             self.update_pagination()
             self.update_search_results_info()
@@ -754,6 +764,7 @@ class TaskManagerFrame(ctk.CTkFrame):
         for widget in self.task_list_frame.winfo_children():
             widget.destroy()
         self.task_checkboxes.clear()
+        self.task_widgets.clear()
 
         # Calculate pagination
         total_tasks = len(self.filtered_tasks)
@@ -828,6 +839,7 @@ class TaskManagerFrame(ctk.CTkFrame):
         task_frame = ctk.CTkFrame(self.task_list_frame, corner_radius=10)
         task_frame.grid(row=index, column=0, sticky="ew", padx=8, pady=4)
         task_frame.grid_columnconfigure(2, weight=1)
+        self.task_widgets[task.id] = task_frame
 
         # Left section - Checkboxes with better spacing
         checkbox_section = ctk.CTkFrame(task_frame, fg_color="transparent")
@@ -1047,35 +1059,35 @@ class TaskManagerFrame(ctk.CTkFrame):
         """Toggle task completion status"""
         try:
             if completed:
-                task.mark_completed()
+                saved = task.mark_completed()
                 # Send completion notification
-                if NOTIFICATIONS_AVAILABLE and notification_manager:
+                if saved and NOTIFICATIONS_AVAILABLE and notification_manager:
                     notification_manager.send_task_completion_notification(task)
             else:
                 task.status = "pending"
                 task.completed_at = None
-                task.save()
+                saved = task.save()
 
-            self.refresh_data()
-            self.main_window.update_quick_stats()
+            # The change bus updates this row and the sidebar stats
+            if not saved:
+                # Most likely the task was changed elsewhere; show its current state
+                messagebox.showwarning("Task Not Updated",
+                                       f"'{task.title}' could not be updated. The task list will be reloaded.")
+                self.refresh_data()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update task status: {e}")
 
     def edit_task(self, task):
         """Edit selected task"""
-        dialog = TaskDialog(self, task=task)
-        if dialog.result:
-            self.refresh_data()
-            self.main_window.update_quick_stats()
+        # Saving in the dialog publishes the change, which updates the list
+        TaskDialog(self, task=task)
 
     def delete_task(self, task):
         """Delete selected task"""
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{task.title}'?"):
             try:
                 task.delete()
-                self.refresh_data()
-                self.main_window.update_quick_stats()
                 messagebox.showinfo("Success", "Task deleted successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete task: {e}")
@@ -1083,14 +1095,9 @@ class TaskManagerFrame(ctk.CTkFrame):
     def show_add_task_dialog(self):
         """Show add task dialog"""
         dialog = TaskDialog(self)
-        # Wait for dialog to close
+        # Wait for dialog to close; a created task arrives through the change bus
         self.wait_window(dialog)
 
-        # Check if task was created successfully
-        if dialog.result:
-            self.refresh_data()
-            self.main_window.update_quick_stats()
-
     def clear_filters(self):
         """Clear all filters and search"""
         self.status_var.set("all")
@@ -1148,6 +1155,89 @@ class TaskManagerFrame(ctk.CTkFrame):
             self.update_pagination()
             self.display_tasks()
 
+    def on_task_changed(self, event):
+        """Queue a change from the change bus and apply the batch once idle"""
+        self.pending_events.append(event)
+        if not self.apply_changes_scheduled:
+            self.apply_changes_scheduled = True
+            self.after_idle(self.apply_task_changes)
+
+    def apply_task_changes(self):
+        """Apply queued task changes without reloading the task list.
+
+        Only the changed tasks are re-checked against the filters.  If the
+        current page still shows the same tasks in the same order, just the
+        changed rows are rebuilt; otherwise the page is redrawn.
+        """
+        self.apply_changes_scheduled = False
+        events, self.pending_events = self.pending_events, []
+        if not events or not self.winfo_exists():
+            return
+
+        try:
+            filters = self.get_active_filters()
+            visible_ids = {t.id for t in self.filtered_tasks}
+            positions = {t.id: i for i, t in enumerate(self.tasks)}
+            changed_ids = set()
+
+            for event in events:
+                task_id = event.entity_id
+                index = positions.get(task_id)
+
+                if event.action == 'deleted':
+                    if index is not None:
+                        self.tasks[index] = None
+                        del positions[task_id]
+                    visible_ids.discard(task_id)
+                    self.selected_tasks.discard(task_id)
+                    continue
+
+                task = Task._from_dict(event.data)
+                if index is None:
+                    # New tasks go first, matching the newest-first order of Task.get_all()
+                    self.tasks.insert(0, task)
+                    positions = {t.id: i for i, t in enumerate(self.tasks) if t is not None}
+                else:
+                    self.tasks[index] = task
+
+                changed_ids.add(task_id)
+                if self.task_matches_filters(task, filters):
+                    visible_ids.add(task_id)
+                else:
+                    visible_ids.discard(task_id)
+
+            self.tasks = [t for t in self.tasks if t is not None]
+            old_page_ids = [t.id for t in self.get_page_tasks()]
+            self.filtered_tasks = [t for t in self.tasks if t.id in visible_ids]
+
+            self.update_pagination()
+            self.update_search_results_info()
+
+            page_tasks = self.get_page_tasks()
+            if [t.id for t in page_tasks] == old_page_ids and old_page_ids:
+                for index, task in enumerate(page_tasks):
+                    if task.id in changed_ids and task.id in self.task_widgets:
+                        self.task_widgets.pop(task.id).destroy()
+                        self.create_task_widget(task, index)
+            else:
+                self.display_tasks()
+
+            self.update_select_all_state()
+            self.update_bulk_actions_visibility()
+
+        except Exception as e:
+            print(f"Error applying task changes: {e}")
+
+    def get_page_tasks(self):
+        """Filtered tasks shown on the current page"""
+        start_index = (self.current_page - 1) * self.page_size
+        return self.filtered_tasks[start_index:start_index + self.page_size]
+
+    def destroy(self):
+        """Stop listening for task changes before destroying the frame"""
+        event_bus.unsubscribe(self.on_task_changed)
+        super().destroy()
+
     def refresh_data(self):
         """Refresh task data"""
         self.load_tasks()
@@ -1260,13 +1350,10 @@ class TaskManagerFrame(ctk.CTkFrame):
                             task.save()
                         updated_count += 1
 
-                # Clear selection
+                # Clear selection; the changed rows are updated through the change bus
                 self.selected_tasks.clear()
-                self.task_checkboxes.clear()
-
-                # Refresh display
-                self.refresh_data()
-                self.main_window.update_quick_stats()
+                self.update_select_all_state()
+                self.update_bulk_actions_visibility()
 
                 messagebox.showinfo("Success",
                                   f"Successfully updated {updated_count} task(s) to {status_text}!")
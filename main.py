@@ -3,15 +3,29 @@ Task Planner - Main Application Entry Point
 A comprehensive desktop task planning application
 """
 
-import tkinter as tk
-from tkinter import messagebox
-import customtkinter as ctk
 import sys
 import os
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Named-phase startup timeline, printed once the main window is up
+# (python main.py --startup-profile, or TASKPLANNER_STARTUP_PROFILE=1)
+from utils.startup_timeline import startup_timeline, StartupOrchestrator
+STARTUP_PROFILE = "--startup-profile" in sys.argv or bool(os.environ.get("TASKPLANNER_STARTUP_PROFILE"))
+
+# Per-module import timing, reported once the main window is up
+# (python main.py --import-profile, or TASKPLANNER_IMPORT_PROFILE=1)
+IMPORT_PROFILE = "--import-profile" in sys.argv or bool(os.environ.get("TASKPLANNER_IMPORT_PROFILE"))
+if IMPORT_PROFILE and __name__ != "__mp_main__":
+    from utils.lazy_loader import import_profiler
+    import_profiler.start()
+
+import tkinter as tk
+from tkinter import messagebox
+import customtkinter as ctk
+import multiprocessing
+
 # Set Application User Model ID for proper Windows notifications (must be done early)
 if sys.platform == "win32":
     try:
@@ -22,41 +36,50 @@ if sys.platform == "win32":
     except Exception as e:
         print(f"Failed to set Application User Model ID: {e}")
 
-# Ensure environment is properly set up
-try:
-    # Try enhanced startup check first, fallback to basic if needed
-    try:
-        from startup_check_enhanced import run_startup_check
-        # Use silent mode for compiled executables to prevent console flashing
-        silent_mode = getattr(sys, 'frozen', False)
-        if not run_startup_check(silent=silent_mode):
-            if not silent_mode:
-                print("Enhanced startup check failed. Exiting...")
-            sys.exit(1)
-    except ImportError:
-        # Fallback to basic startup check
-        from startup_check import setup_environment
-        if not setup_environment():
-            print("Startup check failed. Exiting...")
-            sys.exit(1)
-except Exception as e:
-    print(f"Startup check error: {e}")
-    print("Continuing with basic initialization...")
+# Chart rendering workers (services.chart_renderer) start this module again:
+# frozen builds must hand control to multiprocessing first, and spawned
+# interpreters import it as "__mp_main__" and must skip the startup checks.
+# Launchers that import TaskPlannerApp (start_app.py) still get them.
+if __name__ != "__mp_main__":
+    multiprocessing.freeze_support()
 
-# Special configuration for compiled executables to prevent window flashing
-if getattr(sys, 'frozen', False):
+    # Ensure environment is properly set up
+    startup_check_started = startup_timeline.elapsed()
     try:
-        from compiled_startup import configure_for_compiled
-        configure_for_compiled()
-    except ImportError:
-        pass
+        # Try enhanced startup check first, fallback to basic if needed
+        try:
+            from startup_check_enhanced import run_startup_check
+            # Use silent mode for compiled executables to prevent console flashing
+            silent_mode = getattr(sys, 'frozen', False)
+            if not run_startup_check(silent=silent_mode):
+                if not silent_mode:
+                    print("Enhanced startup check failed. Exiting...")
+                sys.exit(1)
+        except ImportError:
+            # Fallback to basic startup check
+            from startup_check import setup_environment
+            if not setup_environment():
+                print("Startup check failed. Exiting...")
+                sys.exit(1)
+    except Exception as e:
+        print(f"Startup check error: {e}")
+        print("Continuing with basic initialization...")
+    startup_timeline.record("startup_check", startup_check_started, startup_timeline.elapsed())
+
+    # Special configuration for compiled executables to prevent window flashing
+    if getattr(sys, 'frozen', False):
+        try:
+            from compiled_startup import configure_for_compiled
+            configure_for_compiled()
+        except ImportError:
+            pass
 
 # Import CustomTkinter after configuration
 import customtkinter as ctk
 
-from database.db_manager import db_manager
-from gui.main_window import MainWindow
-from config.window_config import window_config
+with startup_timeline.phase("core_imports"):
+    from database.db_manager import db_manager
+    from config.window_config import window_config
 
 class TaskPlannerApp:
     """Main application class"""
@@ -64,6 +87,7 @@ class TaskPlannerApp:
     def __init__(self):
         self.root = None
         self.main_window = None
+        self.startup = StartupOrchestrator(startup_timeline)
         self.setup_customtkinter()
 
     def setup_customtkinter(self):
@@ -98,6 +122,22 @@ class TaskPlannerApp:
             print(f"Database initialization error: {e}")
             return True  # Allow app to start anyway
 
+    def load_license_state(self):
+        """Fingerprint the hardware and load the stored license (startup pool)"""
+        from auth.license_state import license_state
+        return license_state.manager, license_state.is_license_valid()
+
+    def load_settings(self):
+        """Load the settings-backed services the main window needs (startup pool)"""
+        # Importing constructs the global managers, which read settings.json
+        import importlib
+        import services.font_manager
+        try:
+            importlib.import_module("services.theme_manager")
+        except ImportError:
+            pass
+        return window_config.get_setting("startup_mode", "maximized")
+
     def ensure_default_data(self):
         """Ensure default categories and priorities exist"""
         try:
@@ -185,8 +225,10 @@ class TaskPlannerApp:
         # Apply initial window settings (without immediate maximization)
         self.setup_initial_window()
 
-        # Create main window interface
-        self.main_window = MainWindow(self.root)
+        # Create main window interface; notifications and the license panel
+        # are started once the window is on screen (start_background_services)
+        from gui.main_window import MainWindow
+        self.main_window = MainWindow(self.root, defer_services=True)
 
         # Apply final window state after everything is loaded
         self.root.after(50, self.force_maximize)
@@ -268,11 +310,27 @@ class TaskPlannerApp:
                 self.root.after_cancel(self.license_validation_id)
                 self.license_validation_id = None
 
+            self.startup.shutdown()
+
             # Save any pending data and cleanup (stop notifications on app exit)
             if self.main_window:
                 self.main_window.save_settings()
                 self.main_window.cleanup(stop_notifications=True)
 
+            # Stop chart rendering workers
+            try:
+                from services.chart_renderer import chart_renderer
+                chart_renderer.shutdown()
+            except ImportError:
+                pass
+
+            # Write pending settings saves
+            try:
+                from database.settings_manager import flush_all_settings
+                flush_all_settings()
+            except ImportError:
+                pass
+
             # Close database connection
             db_manager.disconnect()
 
@@ -287,15 +345,25 @@ class TaskPlannerApp:
     def run(self):
         """Run the application"""
         try:
-            # Check license first before anything else
+            # Independent phases run concurrently: hardware fingerprinting and
+            # license loading, database connect/schema, and settings load
+            self.startup.submit("license", self.load_license_state)
+            self.startup.submit("database", self.initialize_database)
+            self.startup.submit("settings", self.load_settings)
+
+            # The license gate needs the fingerprint before anything is shown
             if not self.check_license():
                 return  # License check failed, exit application
 
-            # Initialize database (graceful - always returns True for distribution)
-            self.initialize_database()
+            # The main window reads settings and queries the database on build
+            self.startup.result("settings")
+            self.startup.result("database")
 
             # Create and show main window
-            self.create_main_window()
+            self.startup.run("main_window", self.create_main_window)
+
+            # Start non-critical services once the first window has been drawn
+            self.root.after_idle(self.start_background_services)
 
             # Check if database setup is needed after window is created
             self.check_database_setup()
@@ -310,14 +378,66 @@ class TaskPlannerApp:
             )
             sys.exit(1)
 
+    def start_background_services(self):
+        """Start services the first paint does not depend on"""
+        startup_timeline.mark("window_shown")
+
+        if self.main_window:
+            # Notification threads are started off the UI thread; the license
+            # panel is updated from the Tk loop once the window has painted
+            self.startup.submit("notifications", self.main_window.init_notifications)
+            self.root.after(100, self.update_license_panel)
+        else:
+            self.wait_for_background_services()
+
+    def update_license_panel(self):
+        """Fill in the sidebar license panel after the first paint"""
+        try:
+            self.startup.run("license_panel", self.main_window.update_license_status)
+        except Exception as e:
+            print(f"Error updating license panel: {e}")
+        self.wait_for_background_services()
+
+    def wait_for_background_services(self):
+        """Poll the startup pool from the Tk loop and report when it is idle"""
+        try:
+            if not self.root or not self.root.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if not all(future.done() for future in self.startup.futures.values()):
+            self.root.after(50, self.wait_for_background_services)
+            return
+
+        startup_timeline.mark("services_ready")
+        if STARTUP_PROFILE:
+            print(startup_timeline.report())
+            from auth import hardware_fingerprint
+            if hardware_fingerprint.last_fingerprint is not None:
+                print(hardware_fingerprint.last_fingerprint.get_timing_report())
+
+        # Report import times once startup has settled
+        if IMPORT_PROFILE:
+            self.report_import_profile()
+
+    def report_import_profile(self):
+        """Print the per-module import profile collected during startup"""
+        try:
+            from utils.lazy_loader import import_profiler
+            import_profiler.stop()
+            print(import_profiler.report())
+        except Exception as e:
+            print(f"Error reporting import profile: {e}")
+
     def check_license(self):
         """Check license before starting the application"""
         try:
-            from auth.license_manager import LicenseManager
-            license_manager = LicenseManager()
+            # Fingerprinted and validated on the startup pool (load_license_state)
+            license_manager, license_valid = self.startup.result("license")
 
             # Check if license is valid
-            if license_manager.is_license_valid():
+            if license_valid:
                 return True
 
             # For compiled executables, use a different approach to prevent flashing
@@ -412,16 +532,20 @@ class TaskPlannerApp:
 
     def start_license_monitoring(self):
         """Start periodic license validation to catch revoked licenses"""
-        self.validate_license_periodically()
+        # The license was just validated during startup, so the first
+        # periodic check runs after the regular interval
+        self.license_validation_id = self.root.after(300000, self.validate_license_periodically)
 
     def validate_license_periodically(self):
         """Validate license periodically and handle revoked licenses"""
         try:
-            from auth.license_manager import LicenseManager
-            license_manager = LicenseManager()
+            # Shared, cached license state - re-validated only when the
+            # license files change or the license nears expiry
+            from auth.license_state import license_state
+            license_manager = license_state.manager
 
             # Check if current license is still valid
-            if not license_manager.is_license_valid():
+            if not license_state.is_license_valid():
                 # License is no longer valid (could be revoked, expired, etc.)
                 print("License validation failed - showing activation window")
 
@@ -443,6 +567,7 @@ class TaskPlannerApp:
                 else:
                     # License reactivated successfully
                     print("License reactivated successfully")
+                    license_state.invalidate()
                     # Update license status in main window
                     if hasattr(self.main_window, 'update_license_status'):
                         self.main_window.update_license_status()
@@ -10,6 +10,7 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import db_manager
+from services.event_bus import event_bus, CATEGORY_CREATED, CATEGORY_UPDATED, CATEGORY_DELETED
 
 class Category:
     """Category model class"""
@@ -40,6 +41,7 @@ class Category:
                 result = db_manager.execute_query(query, params)
                 if result:
                     self.id = result
+                    event_bus.emit(CATEGORY_CREATED, self.id, self.to_dict())
                     return True
                 return False
             else:
@@ -50,7 +52,11 @@ class Category:
                 """
                 params = (self.name, self.color, self.description, self.id)
 
-                return db_manager.execute_query(query, params) is not None
+                if db_manager.execute_query(query, params) is None:
+                    return False
+
+                event_bus.emit(CATEGORY_UPDATED, self.id, self.to_dict())
+                return True
 
         except Exception as e:
             print(f"Error saving category: {e}")
@@ -63,7 +69,11 @@ class Category:
 
         try:
             query = "DELETE FROM categories WHERE id = %s"
-            return db_manager.execute_query(query, (self.id,)) is not None
+            if db_manager.execute_query(query, (self.id,)) is None:
+                return False
+
+            event_bus.emit(CATEGORY_DELETED, self.id, self.to_dict())
+            return True
         except Exception as e:
             print(f"Error deleting category: {e}")
             return False
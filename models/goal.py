@@ -10,6 +10,7 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import db_manager
+from services.event_bus import event_bus, GOAL_CREATED, GOAL_UPDATED, GOAL_DELETED
 
 class Goal:
     """Goal model class"""
@@ -46,7 +47,11 @@ class Goal:
                          self.target_date, self.status, self.progress_percentage)
                 
                 self.id = db_manager.execute_insert(query, params)
-                return self.id is not None
+                if self.id is None:
+                    return False
+
+                event_bus.emit(GOAL_CREATED, self.id, self.to_dict())
+                return True
             else:
                 # Update existing goal
                 query = """
@@ -57,7 +62,11 @@ class Goal:
                 params = (self.category_id, self.title, self.description, self.target_date,
                          self.status, self.progress_percentage, self.id)
                 
-                return db_manager.execute_update(query, params) > 0
+                if db_manager.execute_update(query, params) <= 0:
+                    return False
+
+                event_bus.emit(GOAL_UPDATED, self.id, self.to_dict())
+                return True
                 
         except Exception as e:
             print(f"Error saving goal: {e}")
@@ -70,7 +79,11 @@ class Goal:
         
         try:
             query = "DELETE FROM goals WHERE id = %s"
-            return db_manager.execute_update(query, (self.id,)) > 0
+            if db_manager.execute_update(query, (self.id,)) <= 0:
+                return False
+
+            event_bus.emit(GOAL_DELETED, self.id, self.to_dict())
+            return True
         except Exception as e:
             print(f"Error deleting goal: {e}")
             return False
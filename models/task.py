@@ -10,10 +10,44 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import db_manager
+from services.event_bus import event_bus, TASK_CREATED, TASK_UPDATED, TASK_DELETED
 
 class Task:
     """Task model class"""
 
+    INSERT_QUERY = """
+    INSERT INTO tasks (user_id, category_id, priority_id, title, description,
+                     due_date, due_time, estimated_duration, actual_duration,
+                     status, is_recurring, recurrence_pattern, recurrence_interval,
+                     recurrence_end_date, parent_task_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+
+    # Fields written by save(); compared against the last saved state for change events
+    PERSISTED_FIELDS = ('user_id', 'category_id', 'priority_id', 'title', 'description', 'due_date',
+                        'due_time', 'estimated_duration', 'actual_duration', 'status', 'is_recurring',
+                        'recurrence_pattern', 'recurrence_interval', 'recurrence_end_date',
+                        'parent_task_id', 'completed_at')
+
+    # Deepest level followed by the subtree queries; also stops runaway
+    # recursion if parent_task_id links ever form a cycle
+    MAX_TREE_DEPTH = 100
+
+    # Task ids of the subtree under a root, with their depth below it
+    # (recursive CTE: SQLite 3.8.3+ and MySQL 8)
+    SUBTREE_QUERY = """
+    WITH RECURSIVE subtree (id, depth) AS (
+        SELECT id, 0 FROM tasks WHERE id = %s
+        UNION ALL
+        SELECT t.id, s.depth + 1 FROM tasks t
+        JOIN subtree s ON t.parent_task_id = s.id
+        WHERE s.depth < %s
+    )
+    SELECT t.*, s.depth AS depth FROM subtree s
+    JOIN tasks t ON t.id = s.id
+    ORDER BY s.depth, t.id
+    """
+
     def __init__(self, task_id: Optional[int] = None, user_id: int = 1, category_id: Optional[int] = None,
                  priority_id: int = 2, title: str = "", description: str = "", due_date: Optional[date] = None,
                  due_time: Optional[time] = None, estimated_duration: Optional[int] = None,
@@ -21,7 +55,8 @@ class Task:
                  is_recurring: bool = False, recurrence_pattern: Optional[str] = None,
                  recurrence_interval: int = 1, recurrence_end_date: Optional[date] = None,
                  parent_task_id: Optional[int] = None, created_at: Optional[datetime] = None,
-                 updated_at: Optional[datetime] = None, completed_at: Optional[datetime] = None):
+                 updated_at: Optional[datetime] = None, completed_at: Optional[datetime] = None,
+                 version: Optional[int] = None):
 
         self.id = task_id
         self.user_id = user_id
@@ -43,6 +78,69 @@ class Task:
         self.updated_at = updated_at
         self.completed_at = completed_at
 
+        # Row version for optimistic concurrency; None if not known (no check)
+        self.version = version
+
+        # Hierarchy position, filled in by get_subtree()
+        self.depth = 0
+        self.subtasks: List['Task'] = []
+
+        # Field values as last loaded from or written to the database
+        self._saved_state = None
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Current values of the persisted fields"""
+        return {field: getattr(self, field) for field in self.PERSISTED_FIELDS}
+
+    def get_dirty_fields(self) -> List[str]:
+        """Persisted fields changed since the task was loaded or last saved"""
+        return list(self.get_changes())
+
+    def is_dirty(self) -> bool:
+        """Whether the task has unsaved changes"""
+        return bool(self.get_changes())
+
+    def get_changes(self) -> Dict[str, tuple]:
+        """Fields changed since the task was loaded or last saved, as (old, new)"""
+        current = self._snapshot()
+        if self._saved_state is None:
+            return {field: (None, value) for field, value in current.items()}
+        return {field: (self._saved_state.get(field), value)
+                for field, value in current.items() if self._saved_state.get(field) != value}
+
+    def _insert_params(self) -> tuple:
+        """Parameters for INSERT_QUERY"""
+        # Convert time object to string for SQLite compatibility
+        due_time_str = self.due_time.strftime('%H:%M:%S') if self.due_time else None
+        return (self.user_id, self.category_id, self.priority_id, self.title,
+                self.description, self.due_date, due_time_str, self.estimated_duration,
+                self.actual_duration, self.status, self.is_recurring,
+                self.recurrence_pattern, self.recurrence_interval,
+                self.recurrence_end_date, self.parent_task_id)
+
+    @classmethod
+    def insert_many(cls, tasks: List['Task']) -> bool:
+        """Insert new tasks in one transaction and assign their IDs"""
+        if not tasks:
+            return True
+
+        try:
+            ids = db_manager.execute_many(cls.INSERT_QUERY, [task._insert_params() for task in tasks],
+                                          return_ids=True)
+            if ids is None:
+                return False
+
+            for task, task_id in zip(tasks, ids):
+                task.id = task_id
+                task.version = 1
+                task._saved_state = task._snapshot()
+                event_bus.emit(TASK_CREATED, task.id, task.to_dict())
+            return True
+
+        except Exception as e:
+            print(f"Error inserting tasks: {e}")
+            return False
+
     def save(self) -> bool:
         """Save task to database"""
         try:
@@ -53,39 +151,42 @@ class Task:
 
             if self.id is None:
                 # Insert new task
-                query = """
-                INSERT INTO tasks (user_id, category_id, priority_id, title, description,
-                                 due_date, due_time, estimated_duration, actual_duration,
-                                 status, is_recurring, recurrence_pattern, recurrence_interval,
-                                 recurrence_end_date, parent_task_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                params = (self.user_id, self.category_id, self.priority_id, self.title,
-                         self.description, self.due_date, due_time_str, self.estimated_duration,
-                         self.actual_duration, self.status, self.is_recurring,
-                         self.recurrence_pattern, self.recurrence_interval,
-                         self.recurrence_end_date, self.parent_task_id)
-
-                result = db_manager.execute_query(query, params)
+                result = db_manager.execute_query(self.INSERT_QUERY, self._insert_params())
                 if result:
                     self.id = result
+                    self.version = 1
+                    self._saved_state = self._snapshot()
+                    event_bus.emit(TASK_CREATED, self.id, self.to_dict())
                     return True
                 return False
             else:
-                # Update existing task
-                query = """
-                UPDATE tasks SET category_id=%s, priority_id=%s, title=%s, description=%s,
-                               due_date=%s, due_time=%s, estimated_duration=%s, actual_duration=%s,
-                               status=%s, is_recurring=%s, recurrence_pattern=%s, recurrence_interval=%s,
-                               recurrence_end_date=%s, parent_task_id=%s, completed_at=%s, updated_at=CURRENT_TIMESTAMP
-                WHERE id=%s
-                """
-                params = (self.category_id, self.priority_id, self.title, self.description,
-                         self.due_date, due_time_str, self.estimated_duration, self.actual_duration,
-                         self.status, self.is_recurring, self.recurrence_pattern,
-                         self.recurrence_interval, self.recurrence_end_date, self.parent_task_id, self.completed_at, self.id)
-
-                return db_manager.execute_query(query, params) is not None
+                # Update only the columns that changed since the task was loaded
+                changes = self.get_changes()
+                if not changes:
+                    return True
+
+                assignments = ", ".join(f"{field}=%s" for field in changes)
+                params = [due_time_str if field == 'due_time' else getattr(self, field) for field in changes]
+                query = f"UPDATE tasks SET {assignments}, version=version+1, updated_at=CURRENT_TIMESTAMP WHERE id=%s"
+                params.append(self.id)
+
+                # Optimistic concurrency: only update the row version this task was loaded with
+                if self.version is not None:
+                    query += " AND version=%s"
+                    params.append(self.version)
+
+                result = db_manager.execute_query(query, tuple(params))
+                if result is None:
+                    return False
+                if result == 0:
+                    print(f"Task {self.id} was changed or deleted elsewhere since it was loaded; not saved")
+                    return False
+
+                if self.version is not None:
+                    self.version += 1
+                self._saved_state = self._snapshot()
+                event_bus.emit(TASK_UPDATED, self.id, self.to_dict(), changes)
+                return True
 
         except Exception as e:
             print(f"Error saving task: {e}")
@@ -97,8 +198,20 @@ class Task:
             return False
 
         try:
+            # Subtasks are removed by ON DELETE CASCADE; collect them first so
+            # views applying deltas can drop them too
+            rows = db_manager.fetch_all(self.SUBTREE_QUERY, (self.id, self.MAX_TREE_DEPTH))
+            subtasks = [self._from_dict(row) for row in rows if row['id'] != self.id]
+
             query = "DELETE FROM tasks WHERE id = %s"
-            return db_manager.execute_query(query, (self.id,)) is not None
+            if db_manager.execute_query(query, (self.id,)) is None:
+                return False
+
+            # Deepest first, so a subtask's event never refers to a parent still shown
+            for subtask in reversed(subtasks):
+                event_bus.emit(TASK_DELETED, subtask.id, subtask.to_dict())
+            event_bus.emit(TASK_DELETED, self.id, self.to_dict())
+            return True
         except Exception as e:
             print(f"Error deleting task: {e}")
             return False
@@ -172,6 +285,98 @@ class Task:
             print(f"Error getting tasks by date range: {e}")
             return []
 
+    @classmethod
+    def get_subtree(cls, root_id: int) -> List['Task']:
+        """Load a task and all of its subtasks in one query.
+
+        Returns the tasks depth-first (root first, each task followed by its
+        subtasks).  Every task has ``depth`` (levels below the root) and
+        ``subtasks`` filled in, so ``result[0]`` is the root of the tree.
+        """
+        try:
+            rows = db_manager.fetch_all(cls.SUBTREE_QUERY, (root_id, cls.MAX_TREE_DEPTH))
+            if not rows:
+                return []
+
+            tasks = {}
+            for row in rows:
+                task = cls._from_dict(row)
+                task.depth = row['depth']
+                # A task reached along two paths (bad data) is kept at its first depth
+                tasks.setdefault(task.id, task)
+
+            for task in tasks.values():
+                parent = tasks.get(task.parent_task_id)
+                if parent is not None and task.depth == parent.depth + 1:
+                    parent.subtasks.append(task)
+
+            ordered = []
+            stack = [tasks[root_id]]
+            while stack:
+                task = stack.pop()
+                ordered.append(task)
+                stack.extend(reversed(task.subtasks))
+            return ordered
+
+        except Exception as e:
+            print(f"Error getting task subtree: {e}")
+            return []
+
+    @classmethod
+    def get_rollup(cls, root_id: int) -> Optional[Dict[str, Any]]:
+        """Load a task tree with progress and time rolled up from its subtasks.
+
+        Uses the single query of get_subtree().  Returns a dictionary with
+        ``root`` (the root Task, subtasks attached), ``tasks`` (depth-first
+        list), ``totals`` (rollup of the whole tree) and ``nodes`` (rollup per
+        task id).  A rollup holds ``total_tasks``, ``completed_tasks``,
+        ``progress`` (percentage of completed leaf tasks, 100 for a completed
+        task), ``estimated_duration``, ``actual_duration`` (minutes, summed
+        over the task and its subtasks) and ``max_depth``.
+        """
+        tasks = cls.get_subtree(root_id)
+        if not tasks:
+            return None
+
+        nodes = {}
+        # Children come after their parent in depth-first order, so walking
+        # the list backwards visits every subtask before its parent
+        for task in reversed(tasks):
+            node = {
+                'total_tasks': 1,
+                'completed_tasks': 1 if task.status == 'completed' else 0,
+                'leaf_tasks': 0,
+                'completed_leaf_tasks': 0,
+                'estimated_duration': task.estimated_duration or 0,
+                'actual_duration': task.actual_duration or 0,
+                'max_depth': task.depth
+            }
+
+            if task.subtasks:
+                for subtask in task.subtasks:
+                    child = nodes[subtask.id]
+                    for key in ('total_tasks', 'completed_tasks', 'leaf_tasks', 'completed_leaf_tasks',
+                                'estimated_duration', 'actual_duration'):
+                        node[key] += child[key]
+                    node['max_depth'] = max(node['max_depth'], child['max_depth'])
+            else:
+                node['leaf_tasks'] = 1
+                node['completed_leaf_tasks'] = node['completed_tasks']
+
+            if task.status == 'completed':
+                node['progress'] = 100.0
+            else:
+                node['progress'] = round(node['completed_leaf_tasks'] / node['leaf_tasks'] * 100, 1)
+
+            nodes[task.id] = node
+
+        return {
+            'root': tasks[0],
+            'tasks': tasks,
+            'totals': nodes[root_id],
+            'nodes': nodes
+        }
+
     @classmethod
     def get_overdue(cls, user_id: int = 1) -> List['Task']:
         """Get overdue tasks"""
@@ -240,7 +445,7 @@ class Task:
                     return None
             return date_str
 
-        return cls(
+        task = cls(
             task_id=data.get('id'),
             user_id=data.get('user_id'),
             category_id=data.get('category_id'),
@@ -259,8 +464,11 @@ class Task:
             parent_task_id=data.get('parent_task_id'),
             created_at=parse_datetime(data.get('created_at')),
             updated_at=parse_datetime(data.get('updated_at')),
-            completed_at=parse_datetime(data.get('completed_at'))
+            completed_at=parse_datetime(data.get('completed_at')),
+            version=data.get('version')
         )
+        task._saved_state = task._snapshot()
+        return task
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary"""
@@ -283,5 +491,6 @@ class Task:
             'parent_task_id': self.parent_task_id,
             'created_at': self.created_at,
             'updated_at': self.updated_at,
-            'completed_at': self.completed_at
+            'completed_at': self.completed_at,
+            'version': self.version
         }
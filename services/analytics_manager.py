@@ -11,13 +11,13 @@ import calendar
 from models.task import Task
 from models.category import Category
 from models.goal import Goal
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
 
 class AnalyticsManager:
     """Provides analytics and insights for task management"""
     
     def __init__(self):
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.cache = {}
         self.cache_timeout = 300  # 5 minutes
     
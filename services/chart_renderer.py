@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Chart Renderer for Task Planner
+Rasterizes analytics charts off the UI thread and caches the PNG output
+"""
+
+import hashlib
+import io
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Bump when a drawer changes so stale PNGs are not served from the disk cache
+RENDERER_VERSION = 1
+
+DARK_BACKGROUND = '#212121'
+
+
+def _style_dark(fig, ax):
+    """Apply the dark background used by the analytics charts"""
+    fig.patch.set_facecolor(DARK_BACKGROUND)
+    ax.set_facecolor(DARK_BACKGROUND)
+
+
+def draw_status_pie_chart(fig, ax, data):
+    """Task status pie chart"""
+    _style_dark(fig, ax)
+    colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
+
+    wedges, texts, autotexts = ax.pie(data['sizes'], labels=data['labels'], colors=colors,
+                                      autopct='%1.1f%%', startangle=90)
+
+    # Style text
+    for text in texts:
+        text.set_color('white')
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_weight('bold')
+
+    ax.set_title('Task Status Distribution', color='white', fontweight='bold')
+
+
+def draw_daily_completion_chart(fig, ax, data):
+    """Daily task completion line chart"""
+    import matplotlib.dates as mdates
+
+    _style_dark(fig, ax)
+    dates, completions = data['dates'], data['completions']
+
+    ax.plot(dates, completions, marker='o', linewidth=2, markersize=6, color='#66b3ff')
+    ax.fill_between(dates, completions, alpha=0.3, color='#66b3ff')
+
+    # Style
+    ax.set_title('Daily Task Completions', color='white', fontweight='bold')
+    ax.set_xlabel('Date', color='white')
+    ax.set_ylabel('Completed Tasks', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    # Format x-axis
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+    ax.tick_params(axis='x', labelrotation=45)
+
+    fig.tight_layout()
+
+
+def draw_peak_hours_chart(fig, ax, data):
+    """Tasks completed per hour of day bar chart"""
+    _style_dark(fig, ax)
+    hours = list(range(24))
+    counts = data['counts']
+
+    # Create bar chart
+    bars = ax.bar(hours, counts, color='#4CAF50', alpha=0.7)
+
+    # Highlight peak hour
+    if counts:
+        peak_hour = hours[counts.index(max(counts))]
+        bars[peak_hour].set_color('#FF9800')
+
+    # Style
+    ax.set_title('Tasks Completed by Hour of Day', color='white', fontweight='bold')
+    ax.set_xlabel('Hour of Day', color='white')
+    ax.set_ylabel('Tasks Completed', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    # Format x-axis
+    ax.set_xticks(range(0, 24, 3))
+    ax.set_xticklabels([f'{h}:00' for h in range(0, 24, 3)])
+
+    fig.tight_layout()
+
+
+def draw_weekly_trends_chart(fig, ax, data):
+    """Weekly productivity trend line chart"""
+    _style_dark(fig, ax)
+    week_labels, weeks_data = data['week_labels'], data['weeks_data']
+
+    # Create line chart
+    ax.plot(week_labels, weeks_data, marker='o', linewidth=3, markersize=8, color='#2196F3')
+    ax.fill_between(week_labels, weeks_data, alpha=0.3, color='#2196F3')
+
+    # Style
+    ax.set_title('Weekly Task Completion Trend', color='white', fontweight='bold')
+    ax.set_xlabel('Week Starting', color='white')
+    ax.set_ylabel('Tasks Completed', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+
+
+def draw_difficulty_analysis(fig, ax, data):
+    """Task difficulty histogram"""
+    _style_dark(fig, ax)
+
+    # Create histogram
+    bins = [0, 2, 4, 6, 8, 10]
+    counts, _, patches = ax.hist(data['scores'], bins=bins, color='#9C27B0', alpha=0.7, edgecolor='white')
+
+    # Color code the bars
+    colors = ['#4CAF50', '#8BC34A', '#FFC107', '#FF9800', '#F44336']
+    for i, patch in enumerate(patches):
+        if i < len(colors):
+            patch.set_facecolor(colors[i])
+
+    # Style
+    ax.set_title('Task Difficulty Distribution', color='white', fontweight='bold')
+    ax.set_xlabel('Difficulty Score', color='white')
+    ax.set_ylabel('Number of Tasks', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    # Set x-axis labels
+    ax.set_xticks([1, 3, 5, 7, 9])
+    ax.set_xticklabels(['Easy\n(0-2)', 'Medium\n(2-4)', 'Hard\n(4-6)', 'Very Hard\n(6-8)', 'Expert\n(8-10)'])
+
+    fig.tight_layout()
+
+
+def draw_completion_time_chart(fig, ax, data):
+    """Completion time histogram"""
+    _style_dark(fig, ax)
+    completion_times = data['completion_times']
+
+    # Create histogram with custom bins
+    bins = [0, 1, 6, 24, 72, 168, max(completion_times) + 1]
+    bin_labels = ['<1h', '1-6h', '6-24h', '1-3d', '3-7d', '>7d']
+
+    counts, _, patches = ax.hist(completion_times, bins=bins, color='#FF5722', alpha=0.7, edgecolor='white')
+
+    # Color code the bars
+    colors = ['#4CAF50', '#8BC34A', '#FFC107', '#FF9800', '#F44336', '#9C27B0']
+    for i, patch in enumerate(patches):
+        if i < len(colors):
+            patch.set_facecolor(colors[i])
+
+    # Style
+    ax.set_title('Task Completion Time Distribution', color='white', fontweight='bold')
+    ax.set_xlabel('Completion Time', color='white')
+    ax.set_ylabel('Number of Tasks', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    # Set custom x-axis labels
+    bin_centers = [(bins[i] + bins[i+1]) / 2 for i in range(len(bins)-1)]
+    ax.set_xticks(bin_centers)
+    ax.set_xticklabels(bin_labels)
+
+    fig.tight_layout()
+
+
+def draw_priority_distribution_chart(fig, ax, data):
+    """Task distribution by priority pie chart"""
+    _style_dark(fig, ax)
+    labels = data['labels']
+    colors = ['#4CAF50', '#FFC107', '#FF9800', '#F44336']  # Green, Yellow, Orange, Red
+
+    wedges, texts, autotexts = ax.pie(data['sizes'], labels=labels, colors=colors[:len(labels)],
+                                      autopct='%1.1f%%', startangle=90)
+
+    # Style text
+    for text in texts:
+        text.set_color('white')
+        text.set_fontsize(10)
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    ax.set_title('Priority Distribution', color='white', fontweight='bold', pad=20)
+    fig.tight_layout()
+
+
+def draw_priority_completion_chart(fig, ax, data):
+    """Completion rate by priority bar chart"""
+    _style_dark(fig, ax)
+    completion_rates = data['rates']
+
+    # Create bar chart
+    bars = ax.bar(data['names'], completion_rates, color=data['colors'], alpha=0.8, edgecolor='white')
+
+    # Add value labels on bars
+    for bar, rate in zip(bars, completion_rates):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+               f'{rate:.1f}%', ha='center', va='bottom', color='white', fontweight='bold')
+
+    # Style
+    ax.set_title('Completion Rate by Priority', color='white', fontweight='bold')
+    ax.set_ylabel('Completion Rate (%)', color='white')
+    ax.set_ylim(0, 105)
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+
+
+def draw_status_distribution_chart(fig, ax, data):
+    """Task status donut chart"""
+    from matplotlib.patches import Circle
+
+    _style_dark(fig, ax)
+    labels = data['labels']
+    colors = ['#4CAF50', '#2196F3', '#FF9800', '#F44336']
+
+    wedges, texts, autotexts = ax.pie(data['sizes'], labels=labels, colors=colors[:len(labels)],
+                                      autopct='%1.1f%%', startangle=90, pctdistance=0.85)
+
+    # Create donut hole
+    centre_circle = Circle((0,0), 0.70, fc=DARK_BACKGROUND)
+    ax.add_artist(centre_circle)
+
+    # Style text
+    for text in texts:
+        text.set_color('white')
+        text.set_fontsize(10)
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    ax.set_title('Status Distribution', color='white', fontweight='bold', pad=20)
+    fig.tight_layout()
+
+
+def draw_weekly_completion_trend(fig, ax, data):
+    """Weekly completion trend line chart"""
+    _style_dark(fig, ax)
+    weeks, counts = data['weeks'], data['counts']
+
+    # Create line chart
+    ax.plot(weeks, counts, marker='o', linewidth=2, markersize=6, color='#4CAF50')
+    ax.fill_between(weeks, counts, alpha=0.3, color='#4CAF50')
+
+    # Style
+    ax.set_title('Weekly Completion Trend', color='white', fontweight='bold')
+    ax.set_ylabel('Tasks Completed', color='white')
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.3)
+
+    # Format x-axis dates
+    ax.tick_params(axis='x', rotation=45)
+
+    fig.tight_layout()
+
+
+def draw_daily_activity_chart(fig, ax, data):
+    """Created vs. completed tasks per day (enhanced analytics overview)"""
+    fig.patch.set_facecolor('white')
+    ax.set_facecolor('white')
+    dates = data['dates']
+
+    x = range(len(dates))
+    ax.bar([i - 0.2 for i in x], data['created'], 0.4, label='Created', alpha=0.7, color='#3b82f6')
+    ax.bar([i + 0.2 for i in x], data['completed'], 0.4, label='Completed', alpha=0.7, color='#10b981')
+
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Tasks')
+    ax.set_title('Daily Task Activity')
+    ax.legend()
+
+    # Format x-axis
+    if len(dates) <= 30:
+        step = max(1, len(dates) // 10)
+        ax.set_xticks(range(0, len(dates), step))
+        ax.set_xticklabels([dates[i][-5:] for i in range(0, len(dates), step)], rotation=45)
+
+    fig.tight_layout()
+
+
+CHART_DRAWERS: Dict[str, Callable] = {
+    'status_pie_chart': draw_status_pie_chart,
+    'daily_completion_chart': draw_daily_completion_chart,
+    'peak_hours_chart': draw_peak_hours_chart,
+    'weekly_trends_chart': draw_weekly_trends_chart,
+    'difficulty_analysis': draw_difficulty_analysis,
+    'completion_time_chart': draw_completion_time_chart,
+    'priority_distribution_chart': draw_priority_distribution_chart,
+    'priority_completion_chart': draw_priority_completion_chart,
+    'status_distribution_chart': draw_status_distribution_chart,
+    'weekly_completion_trend': draw_weekly_completion_trend,
+    'daily_activity_chart': draw_daily_activity_chart,
+}
+
+
+def draw_chart(name: str, fig, ax, data: Dict[str, Any]):
+    """Draw a registered chart onto an existing figure and axes"""
+    CHART_DRAWERS[name](fig, ax, data)
+
+
+def render_chart_png(name: str, data: Dict[str, Any], figsize: Tuple[float, float], dpi: int) -> bytes:
+    """Rasterize a chart to PNG bytes with the Agg backend (runs in a worker)"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    draw_chart(name, fig, ax, data)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, facecolor=fig.get_facecolor())
+    fig.clf()
+    return buffer.getvalue()
+
+
+class ChartRenderer:
+    """Renders charts to PNG in a worker process pool with a disk cache.
+
+    Requests are keyed by a digest of the chart name, size and data, so the
+    same chart for unchanged data is answered from memory or from the disk
+    cache without touching the pool.  If a process pool cannot be used (for
+    example a broken frozen build) rendering falls back to a thread pool.
+    """
+
+    def __init__(self, cache_dir: str = None, max_workers: int = 2,
+                 max_cache_files: int = 200, max_memory_entries: int = 64):
+        if cache_dir is None:
+            cache_dir = os.path.join(self.get_app_data_directory(), 'chart_cache')
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.max_cache_files = max_cache_files
+        self.max_memory_entries = max_memory_entries
+
+        self.memory_cache = {}
+        self.pending = {}
+        self.executor = None
+        self.use_processes = True
+        self.lock = threading.Lock()
+
+    def get_app_data_directory(self) -> str:
+        """Get application data directory"""
+        if sys.platform == "win32":
+            app_data = os.environ.get('APPDATA', os.path.expanduser('~'))
+            return os.path.join(app_data, 'TaskPlanner')
+        elif sys.platform == "darwin":
+            return os.path.expanduser('~/Library/Application Support/TaskPlanner')
+        else:
+            config_dir = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
+            return os.path.join(config_dir, 'TaskPlanner')
+
+    def get_cache_key(self, name: str, data: Dict[str, Any], figsize, dpi: int) -> str:
+        """Data-version key for a chart request"""
+        payload = repr((RENDERER_VERSION, name, tuple(figsize), dpi, data))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def render(self, name: str, data: Dict[str, Any], figsize=(6, 4), dpi: int = 100) -> Future:
+        """Request a chart; the returned future resolves to PNG bytes"""
+        key = self.get_cache_key(name, data, figsize, dpi)
+
+        with self.lock:
+            png = self.memory_cache.get(key)
+            if png is None:
+                png = self._read_disk_cache(key)
+                if png is not None:
+                    self._remember(key, png)
+
+            if png is not None:
+                future = Future()
+                future.set_result(png)
+                return future
+
+            # Identical request already in flight
+            if key in self.pending:
+                return self.pending[key]
+
+            future = self._submit(name, data, tuple(figsize), dpi)
+            self.pending[key] = future
+
+        future.add_done_callback(lambda f, k=key: self._on_rendered(k, f))
+        return future
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, name, data, figsize, dpi) -> Future:
+        """Submit a render job, falling back to threads if processes fail"""
+        if self.executor is None:
+            self.executor = self._create_executor()
+
+        try:
+            return self.executor.submit(render_chart_png, name, data, figsize, dpi)
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            print(f"Chart process pool unavailable, using threads: {e}")
+            self.use_processes = False
+            self.executor = self._create_executor()
+            return self.executor.submit(render_chart_png, name, data, figsize, dpi)
+
+    def _create_executor(self):
+        """Create the worker pool"""
+        if self.use_processes:
+            try:
+                return ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, ValueError, NotImplementedError) as e:
+                print(f"Could not start chart process pool: {e}")
+                self.use_processes = False
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chart-render")
+
+    def _on_rendered(self, key: str, future: Future):
+        """Store a finished render in the memory and disk caches"""
+        with self.lock:
+            self.pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                if isinstance(future.exception(), BrokenProcessPool):
+                    self.use_processes = False
+                    self.executor = None
+                return
+            png = future.result()
+            self._remember(key, png)
+
+        self._write_disk_cache(key, png)
+
+    def _remember(self, key: str, png: bytes):
+        """Keep a PNG in the bounded in-memory cache"""
+        if len(self.memory_cache) >= self.max_memory_entries:
+            self.memory_cache.pop(next(iter(self.memory_cache)))
+        self.memory_cache[key] = png
+
+    def _read_disk_cache(self, key: str) -> Optional[bytes]:
+        """Read a cached PNG from disk"""
+        path = os.path.join(self.cache_dir, f"{key}.png")
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk_cache(self, key: str, png: bytes):
+        """Write a PNG to the disk cache and prune old entries"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, f"{key}.png")
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(png)
+            os.replace(temp_path, path)
+            self._prune_disk_cache()
+        except OSError as e:
+            print(f"Error writing chart cache: {e}")
+
+    def _prune_disk_cache(self):
+        """Remove the oldest cached PNGs beyond ``max_cache_files``"""
+        entries = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith('.png')
+        ]
+        if len(entries) <= self.max_cache_files:
+            return
+
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_cache_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# Global chart renderer instance
+chart_renderer = ChartRenderer()
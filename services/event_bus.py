@@ -0,0 +1,133 @@
+"""
+Change event bus for Task Planner
+Publishes typed model change events so views and services can apply deltas
+"""
+
+import inspect
+import threading
+import weakref
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Event types emitted by the models
+TASK_CREATED = 'task_created'
+TASK_UPDATED = 'task_updated'
+TASK_DELETED = 'task_deleted'
+GOAL_CREATED = 'goal_created'
+GOAL_UPDATED = 'goal_updated'
+GOAL_DELETED = 'goal_deleted'
+CATEGORY_CREATED = 'category_created'
+CATEGORY_UPDATED = 'category_updated'
+CATEGORY_DELETED = 'category_deleted'
+
+TASK_EVENTS = (TASK_CREATED, TASK_UPDATED, TASK_DELETED)
+GOAL_EVENTS = (GOAL_CREATED, GOAL_UPDATED, GOAL_DELETED)
+CATEGORY_EVENTS = (CATEGORY_CREATED, CATEGORY_UPDATED, CATEGORY_DELETED)
+
+
+class ChangeEvent:
+    """A single created/updated/deleted change of a model row.
+
+    ``data`` is the model's ``to_dict()`` after the change (before it, for
+    deletes) and ``changes`` maps each changed field to ``(old, new)``.
+    """
+
+    def __init__(self, event_type: str, entity_id: Optional[int], data: Optional[Dict[str, Any]] = None,
+                 changes: Optional[Dict[str, Tuple[Any, Any]]] = None):
+        self.event_type = event_type
+        self.entity, self.action = event_type.rsplit('_', 1)
+        self.entity_id = entity_id
+        self.data = data or {}
+        self.changes = changes or {}
+        self.timestamp = datetime.now()
+
+    @property
+    def changed_fields(self) -> set:
+        """Names of the fields that changed"""
+        return set(self.changes)
+
+    def affects(self, *fields: str) -> bool:
+        """Whether any of ``fields`` changed (always True for creates and deletes)"""
+        if self.action != 'updated':
+            return True
+        return any(field in self.changes for field in fields)
+
+    def old_value(self, field: str) -> Any:
+        """Value of ``field`` before the change"""
+        if field in self.changes:
+            return self.changes[field][0]
+        return self.data.get(field)
+
+    def __repr__(self):
+        return f"ChangeEvent({self.event_type}, id={self.entity_id}, changed={sorted(self.changes)})"
+
+
+class EventBus:
+    """Publish/subscribe bus for model change events.
+
+    Subscribers are called synchronously on the publishing thread.  Bound
+    methods are held weakly, so a destroyed view that forgot to unsubscribe
+    does not keep receiving events.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.RLock()
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None], event_types: Optional[Iterable[str]] = None):
+        """Call ``callback(event)`` for the given event types (all events if None)"""
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+
+        types = frozenset(event_types) if event_types is not None else None
+        with self._lock:
+            self._subscribers.append((ref, types))
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        """Remove every subscription of ``callback``"""
+        with self._lock:
+            self._subscribers = [
+                (ref, types) for ref, types in self._subscribers
+                if ref() is not None and ref() != callback
+            ]
+
+    def publish(self, event: ChangeEvent):
+        """Deliver an event to its subscribers"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        dead = False
+        for ref, types in subscribers:
+            callback = ref()
+            if callback is None:
+                dead = True
+                continue
+            if types is not None and event.event_type not in types:
+                continue
+
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in change event subscriber for {event.event_type}: {e}")
+
+        if dead:
+            with self._lock:
+                self._subscribers = [(ref, types) for ref, types in self._subscribers if ref() is not None]
+
+    def emit(self, event_type: str, entity_id: Optional[int], data: Optional[Dict[str, Any]] = None,
+             changes: Optional[Dict[str, Tuple[Any, Any]]] = None) -> ChangeEvent:
+        """Build and publish a ChangeEvent"""
+        event = ChangeEvent(event_type, entity_id, data, changes)
+        self.publish(event)
+        return event
+
+    def subscriber_count(self) -> int:
+        """Number of live subscriptions"""
+        with self._lock:
+            return sum(1 for ref, _ in self._subscribers if ref() is not None)
+
+
+# Global event bus instance
+event_bus = EventBus()
@@ -6,14 +6,14 @@ Provides comprehensive keyboard shortcut functionality
 
 import tkinter as tk
 from typing import Dict, Callable, Optional, Any
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
 
 class KeyboardManager:
     """Manages keyboard shortcuts and hotkeys"""
     
     def __init__(self, root_window):
         self.root = root_window
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.shortcuts = {}
         self.main_window = None
         
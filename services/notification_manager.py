@@ -46,13 +46,21 @@ except ImportError:
         print("Failed to install pygame. Sound alerts will be disabled.")
 
 from models.task import Task
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
+from services.event_bus import event_bus, TASK_EVENTS
+
+# Statuses that still get reminders
+REMINDER_STATUSES = ('pending', 'in_progress')
+
+# The reminder candidates are kept current from the change bus; a periodic
+# full reload also picks up changes made outside this process
+REMINDER_RESYNC_INTERVAL = timedelta(minutes=15)
 
 class NotificationManager:
     """Manages desktop notifications and reminders"""
 
     def __init__(self):
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.running = False
         self.notification_thread = None
         self.sound_initialized = False
@@ -71,6 +79,12 @@ class NotificationManager:
         self.sent_notifications = set()
         self.last_notification_reset = datetime.now()
 
+        # Tasks that can get reminders (id -> Task), maintained from change events
+        self.reminder_tasks = None
+        self.reminder_tasks_loaded_at = None
+        self.reminder_lock = threading.Lock()
+        event_bus.subscribe(self.on_task_changed, TASK_EVENTS)
+
         # Load notification settings
         self.load_settings()
 
@@ -437,6 +451,37 @@ class NotificationManager:
         except:
             return None
 
+    def is_reminder_candidate(self, task) -> bool:
+        """Whether a task has a due date and time and is still open"""
+        return bool(task.due_date and task.due_time and task.status in REMINDER_STATUSES)
+
+    def get_reminder_tasks(self) -> List[Task]:
+        """Open tasks with a due date and time, reloaded only on resync"""
+        with self.reminder_lock:
+            now = datetime.now()
+            if (self.reminder_tasks is None or
+                    now - self.reminder_tasks_loaded_at >= REMINDER_RESYNC_INTERVAL):
+                self.reminder_tasks = {
+                    task.id: task for task in Task.get_all() if self.is_reminder_candidate(task)
+                }
+                self.reminder_tasks_loaded_at = now
+            return list(self.reminder_tasks.values())
+
+    def on_task_changed(self, event):
+        """Apply a task change to the reminder candidates"""
+        with self.reminder_lock:
+            if self.reminder_tasks is None:
+                return
+            if event.action == 'deleted':
+                self.reminder_tasks.pop(event.entity_id, None)
+                return
+
+            task = Task._from_dict(event.data)
+            if self.is_reminder_candidate(task):
+                self.reminder_tasks[task.id] = task
+            else:
+                self.reminder_tasks.pop(task.id, None)
+
     def check_task_reminders(self):
         """Check for tasks that need reminders with improved error handling"""
         try:
@@ -465,13 +510,12 @@ class NotificationManager:
             self.check_failures = 0
 
             # Get tasks due within reminder window
-            tasks = Task.get_all()
+            tasks = self.get_reminder_tasks()
             if not tasks:
                 return  # No tasks to check
 
             for task in tasks:
-                if (task.due_date and task.due_time and
-                    task.status in ['pending', 'in_progress']):
+                if self.is_reminder_candidate(task):
 
                     # Ensure due_time is a time object (handle SQLite timedelta)
                     due_time = task.due_time
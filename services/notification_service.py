@@ -14,14 +14,14 @@ import signal
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
 
 
 class NotificationService:
     """Persistent notification service that runs independently"""
     
     def __init__(self):
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.running = False
         self.service_thread = None
         self.notification_manager = None
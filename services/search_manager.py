@@ -5,12 +5,14 @@ Provides comprehensive search functionality across all data types
 """
 
 import re
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, date
 from models.task import Task
 from models.category import Category
 from models.goal import Goal
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
+from services.event_bus import event_bus, TASK_EVENTS
 
 class SearchResult:
     """Represents a search result item"""
@@ -31,7 +33,7 @@ class SearchManager:
     """Advanced search functionality across all application data"""
     
     def __init__(self):
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.search_history = []
         self.max_history = 50
         
@@ -48,6 +50,29 @@ class SearchManager:
         
         # Load search settings
         self.load_search_settings()
+
+        # Searchable tasks by id, loaded on first search and then kept
+        # current from the change bus instead of reloading every search
+        self.tasks = None
+        self.tasks_lock = threading.Lock()
+        event_bus.subscribe(self.on_task_changed, TASK_EVENTS)
+
+    def get_tasks(self) -> List[Task]:
+        """All tasks, from the in-memory index"""
+        with self.tasks_lock:
+            if self.tasks is None:
+                self.tasks = {task.id: task for task in Task.get_all()}
+            return list(self.tasks.values())
+
+    def on_task_changed(self, event):
+        """Apply a task change to the in-memory index"""
+        with self.tasks_lock:
+            if self.tasks is None:
+                return
+            if event.action == 'deleted':
+                self.tasks.pop(event.entity_id, None)
+            else:
+                self.tasks[event.entity_id] = Task._from_dict(event.data)
     
     def load_search_settings(self):
         """Load search configuration from settings"""
@@ -118,7 +143,7 @@ class SearchManager:
         
         try:
             # Get all tasks
-            all_tasks = Task.get_all()
+            all_tasks = self.get_tasks()
             
             for task in all_tasks:
                 # Skip completed tasks if configured
@@ -345,7 +370,7 @@ class SearchManager:
             
             # Get from task titles
             if len(suggestions) < 10:
-                tasks = Task.get_all()
+                tasks = self.get_tasks()
                 task_suggestions = [
                     task.title for task in tasks 
                     if task.title.lower().startswith(partial_query.lower())
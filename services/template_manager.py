@@ -4,13 +4,16 @@ Task Template Manager for Task Planner
 Provides task templates and smart task creation
 """
 
+import bisect
 import json
+import os
+import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date, timedelta
 from models.task import Task
-from models.category import Category
-from models.priority import Priority
-from database.settings_manager import SettingsManager
+from models.category import Category, Priority
+from database.settings_manager import get_settings_manager
+from database.template_store import TemplateStore
 
 class TaskTemplate:
     """Represents a task template"""
@@ -73,22 +76,43 @@ class TaskTemplate:
         return template
 
 class TemplateManager:
-    """Manages task templates and smart task creation"""
+    """Manages task templates and smart task creation
+
+    Templates live in their own store (templates.db next to settings.json)
+    and are updated one at a time.  In memory, a token index over names,
+    descriptions and tags serves ``search_templates`` and a popularity list
+    kept sorted by usage serves ``get_popular_templates``.
+    """
     
-    def __init__(self):
-        self.settings = SettingsManager()
+    def __init__(self, store: TemplateStore = None):
+        self.settings = get_settings_manager()
+        if store is None:
+            store_path = os.path.join(os.path.dirname(self.settings.settings_file), 'templates.db')
+            store = TemplateStore(store_path)
+        self.store = store
         self.templates = {}
+        self._positions = {}  # template_id -> creation order, breaks popularity ties
+        self._token_index = {}  # token -> {template_id}
+        self._tag_index = {}  # tag -> {template_id}
+        self._name_index = {}  # lowercase name -> template_id
+        self._popularity = []  # sorted [(-usage_count, position, template_id)]
         self.load_templates()
         self.create_default_templates()
     
     def load_templates(self):
-        """Load templates from settings"""
+        """Load templates from the template store"""
         try:
-            template_data = self.settings.get('task_templates', {})
+            self._migrate_from_settings()
+
             self.templates = {}
-            
-            for template_id, data in template_data.items():
-                self.templates[template_id] = TaskTemplate.from_dict(data)
+            self._positions = {}
+            self._token_index = {}
+            self._tag_index = {}
+            self._name_index = {}
+            self._popularity = []
+
+            for data in self.store.load_all():
+                self._index_template(TaskTemplate.from_dict(data))
             
             print(f"✅ Loaded {len(self.templates)} task templates")
             
@@ -96,19 +120,108 @@ class TemplateManager:
             print(f"Error loading templates: {e}")
             self.templates = {}
     
+    def _migrate_from_settings(self):
+        """Move templates kept in settings.json by older versions into the store.
+
+        Templates are merged by template_id, keeping the store's row when both
+        have one, and the settings key is only removed once they are stored.
+        """
+        template_data = self.settings.get('task_templates')
+        if not template_data:
+            return
+
+        existing = {data['template_id'] for data in self.store.load_all()}
+        missing = [dict(data, template_id=data.get('template_id') or template_id)
+                   for template_id, data in template_data.items()
+                   if (data.get('template_id') or template_id) not in existing]
+        if missing:
+            self.store.upsert_many(missing)
+            print(f"✅ Migrated {len(missing)} templates out of settings")
+
+        self.settings.delete('task_templates')
+        self.settings.save()
+    
     def save_templates(self):
-        """Save templates to settings"""
+        """Save all templates to the store"""
         try:
-            template_data = {}
-            for template_id, template in self.templates.items():
-                template_data[template_id] = template.to_dict()
-            
-            self.settings.set('task_templates', template_data)
-            self.settings.save()
-            
+            self.store.upsert_many(template.to_dict() for template in self.templates.values())
         except Exception as e:
             print(f"Error saving templates: {e}")
     
+    def save_template(self, template: TaskTemplate):
+        """Insert or update a single template in the store and the indexes"""
+        try:
+            self.store.upsert(template.to_dict())
+            self._unindex_template(template.template_id)
+            self._index_template(template)
+        except Exception as e:
+            print(f"Error saving template: {e}")
+    
+    def _tokenize(self, text: str) -> List[str]:
+        """Lowercase word tokens of a text"""
+        return re.findall(r"\w+", text.lower())
+    
+    def _index_template(self, template: TaskTemplate):
+        """Add a template to the in-memory indexes"""
+        template_id = template.template_id
+        if template_id not in self._positions:
+            self._positions[template_id] = len(self._positions)
+        self.templates[template_id] = template
+
+        tokens = set(self._tokenize(f"{template.name} {template.description}"))
+        for tag in template.tags:
+            tag_lower = tag.lower()
+            tokens.update(self._tokenize(tag))
+            self._tag_index.setdefault(tag_lower, set()).add(template_id)
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(template_id)
+
+        self._name_index[template.name.lower()] = template_id
+        bisect.insort(self._popularity, self._popularity_key(template))
+    
+    def _unindex_template(self, template_id: str):
+        """Remove a template from the in-memory indexes"""
+        template = self.templates.pop(template_id, None)
+        if template is None:
+            return
+
+        for index in (self._token_index, self._tag_index):
+            for key in [key for key, ids in index.items() if template_id in ids]:
+                index[key].discard(template_id)
+                if not index[key]:
+                    del index[key]
+
+        if self._name_index.get(template.name.lower()) == template_id:
+            del self._name_index[template.name.lower()]
+
+        self._popularity = [entry for entry in self._popularity if entry[2] != template_id]
+    
+    def _popularity_key(self, template: TaskTemplate) -> tuple:
+        return (-template.usage_count, self._positions[template.template_id], template.template_id)
+    
+    def _record_usage(self, usage: Dict[str, int]):
+        """Add usage counts ({template_id: uses}) and persist them in one update"""
+        counts = {}
+        for template_id, uses in usage.items():
+            template = self.templates.get(template_id)
+            if template is None or uses <= 0:
+                continue
+
+            # Move the template to its new place in the popularity order
+            old_key = self._popularity_key(template)
+            position = bisect.bisect_left(self._popularity, old_key)
+            if position < len(self._popularity) and self._popularity[position] == old_key:
+                del self._popularity[position]
+
+            template.usage_count += uses
+            bisect.insort(self._popularity, self._popularity_key(template))
+            counts[template_id] = template.usage_count
+
+        try:
+            self.store.set_usage_counts(counts)
+        except Exception as e:
+            print(f"Error saving template usage: {e}")
+    
     def create_default_templates(self):
         """Create default task templates if none exist"""
         if self.templates:
@@ -208,7 +321,8 @@ class TemplateManager:
         ]
         
         for template in default_templates:
-            self.templates[template.template_id] = template
+            self._unindex_template(template.template_id)
+            self._index_template(template)
         
         self.save_templates()
         print(f"✅ Created {len(default_templates)} default templates")
@@ -235,8 +349,7 @@ class TemplateManager:
             checklist=checklist or []
         )
         
-        self.templates[template.template_id] = template
-        self.save_templates()
+        self.save_template(template)
         
         print(f"✅ Created template: {name}")
         return template
@@ -267,8 +380,7 @@ class TemplateManager:
                 checklist=[]  # Could parse from description
             )
             
-            self.templates[template.template_id] = template
-            self.save_templates()
+            self.save_template(template)
             
             print(f"✅ Created template from task: {task.title}")
             return template
@@ -286,51 +398,13 @@ class TemplateManager:
                 print(f"Template not found: {template_id}")
                 return None
             
-            custom_values = custom_values or {}
-            
-            # Replace placeholders in description
-            description = template.description
-            for placeholder, value in custom_values.items():
-                description = description.replace(f"{{{placeholder}}}", value)
-            
-            # Get category ID
-            category_id = None
-            if template.category_name:
-                categories = Category.get_all()
-                for cat in categories:
-                    if cat.name == template.category_name:
-                        category_id = cat.id
-                        break
-            
-            # Get priority ID
-            priority_id = 2  # Default medium
-            if template.priority_name:
-                priorities = Priority.get_all()
-                for pri in priorities:
-                    if pri.name.lower() == template.priority_name.lower():
-                        priority_id = pri.id
-                        break
-            
-            # Calculate due date
-            due_date = None
-            if template.default_due_offset > 0:
-                due_date = date.today() + timedelta(days=template.default_due_offset)
-            
-            # Create task
-            task = Task(
-                title=custom_values.get('title', template.name),
-                description=description,
-                category_id=category_id,
-                priority_id=priority_id,
-                due_date=due_date,
-                estimated_duration=template.estimated_duration
-            )
+            category_ids, priority_ids = self._get_reference_ids()
+            task = self._build_task(template, custom_values or {}, category_ids, priority_ids)
             
             # Save task
             if task.save():
                 # Update template usage count
-                template.usage_count += 1
-                self.save_templates()
+                self._record_usage({template.template_id: 1})
                 
                 print(f"✅ Created task from template: {template.name}")
                 return task
@@ -342,12 +416,99 @@ class TemplateManager:
             print(f"Error creating task from template: {e}")
             return None
     
+    def create_tasks_from_templates(self, batch: List[Dict[str, Any]]) -> List[Task]:
+        """Create many tasks from templates in one transaction.
+
+        Each batch item is ``{'template_id': ..., 'custom_values': {...}}``
+        and may override task fields with ``due_date``, ``parent_task_id`` or
+        ``user_id``.  Categories and priorities are resolved once, all tasks
+        are inserted with a single executemany and the template usage counts
+        are updated once at the end.  Returns the created tasks (with IDs) in
+        batch order, or an empty list if nothing was inserted.
+        """
+        try:
+            category_ids, priority_ids = self._get_reference_ids()
+            tasks = []
+            usage = {}
+
+            for item in batch:
+                template = self.get_template(item.get('template_id'))
+                if not template:
+                    print(f"Template not found: {item.get('template_id')}")
+                    continue
+
+                task = self._build_task(template, item.get('custom_values') or {},
+                                        category_ids, priority_ids)
+                for field in ('due_date', 'parent_task_id', 'user_id'):
+                    if field in item:
+                        setattr(task, field, item[field])
+
+                tasks.append(task)
+                usage[template.template_id] = usage.get(template.template_id, 0) + 1
+
+            if not tasks:
+                return []
+
+            if not Task.insert_many(tasks):
+                print(f"Failed to save {len(tasks)} tasks from templates")
+                return []
+
+            self._record_usage(usage)
+            print(f"✅ Created {len(tasks)} tasks from {len(usage)} templates")
+            return tasks
+
+        except Exception as e:
+            print(f"Error creating tasks from templates: {e}")
+            return []
+    
+    def _get_reference_ids(self):
+        """Category name -> ID and lowercase priority name -> ID lookups"""
+        category_ids = {}
+        for cat in Category.get_all():
+            category_ids.setdefault(cat.name, cat.id)
+
+        priority_ids = {}
+        for pri in Priority.get_all():
+            priority_ids.setdefault(pri.name.lower(), pri.id)
+
+        return category_ids, priority_ids
+    
+    def _build_task(self, template: TaskTemplate, custom_values: Dict[str, str],
+                    category_ids: Dict[str, int], priority_ids: Dict[str, int]) -> Task:
+        """Build an unsaved task from a template"""
+        # Replace placeholders in description
+        description = template.description
+        for placeholder, value in custom_values.items():
+            description = description.replace(f"{{{placeholder}}}", value)
+        
+        # Get category ID
+        category_id = category_ids.get(template.category_name) if template.category_name else None
+        
+        # Get priority ID
+        priority_id = 2  # Default medium
+        if template.priority_name:
+            priority_id = priority_ids.get(template.priority_name.lower(), priority_id)
+        
+        # Calculate due date
+        due_date = None
+        if template.default_due_offset > 0:
+            due_date = date.today() + timedelta(days=template.default_due_offset)
+        
+        return Task(
+            title=custom_values.get('title', template.name),
+            description=description,
+            category_id=category_id,
+            priority_id=priority_id,
+            due_date=due_date,
+            estimated_duration=template.estimated_duration
+        )
+    
     def delete_template(self, template_id: str) -> bool:
         """Delete a template"""
         try:
             if template_id in self.templates:
-                del self.templates[template_id]
-                self.save_templates()
+                self._unindex_template(template_id)
+                self.store.delete(template_id)
                 print(f"✅ Deleted template: {template_id}")
                 return True
             return False
@@ -357,16 +518,34 @@ class TemplateManager:
     
     def get_popular_templates(self, limit: int = 5) -> List[TaskTemplate]:
         """Get most used templates"""
-        templates = list(self.templates.values())
-        templates.sort(key=lambda t: t.usage_count, reverse=True)
-        return templates[:limit]
+        return [self.templates[entry[2]] for entry in self._popularity[:limit]]
+    
+    def get_template_by_name(self, name: str) -> Optional[TaskTemplate]:
+        """Get a template by its (case-insensitive) name"""
+        template_id = self._name_index.get(name.lower())
+        return self.templates.get(template_id) if template_id else None
+    
+    def get_templates_by_tag(self, tag: str) -> List[TaskTemplate]:
+        """Get templates carrying a tag"""
+        ids = self._tag_index.get(tag.lower(), set())
+        return [self.templates[template_id] for template_id in sorted(ids, key=self._positions.get)]
     
     def search_templates(self, query: str) -> List[TaskTemplate]:
         """Search templates by name or description"""
         query_lower = query.lower()
-        results = []
         
-        for template in self.templates.values():
+        if self._tokenize(query_lower) == [query_lower]:
+            # Single word: only templates with a token containing it can match
+            candidates = set()
+            for token, ids in self._token_index.items():
+                if query_lower in token:
+                    candidates |= ids
+        else:
+            candidates = self.templates.keys()
+        
+        results = []
+        for template_id in sorted(candidates, key=self._positions.get):
+            template = self.templates[template_id]
             if (query_lower in template.name.lower() or 
                 query_lower in template.description.lower() or
                 any(query_lower in tag.lower() for tag in template.tags)):
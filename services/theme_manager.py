@@ -6,13 +6,13 @@ Provides comprehensive theme management with custom color schemes
 
 import customtkinter as ctk
 from typing import Dict, Any, Optional
-from database.settings_manager import SettingsManager
+from database.settings_manager import get_settings_manager
 
 class ThemeManager:
     """Enhanced theme management system"""
     
     def __init__(self):
-        self.settings = SettingsManager()
+        self.settings = get_settings_manager()
         self.current_theme = self.settings.get('theme', 'light')
         self.current_color_scheme = self.settings.get('color_scheme', 'blue')
         
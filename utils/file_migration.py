@@ -54,6 +54,7 @@ class FileMigration:
             'settings.json',
             'window_settings.json',
             'license_database.json',
+            'license_database.db',
             'app_config.json',
             'user_preferences.json'
         ]
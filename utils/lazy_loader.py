@@ -0,0 +1,189 @@
+"""
+Lazy loading utilities for Task Planner
+Defers heavy imports until first use and profiles module import times
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class LazyImport:
+    """Proxy for a module (or a module attribute) that is imported on first use.
+
+    ``lazy_import("services.search_manager", "search_manager")`` behaves like
+    the ``search_manager`` instance, but the module is only imported - and its
+    global instance constructed - the first time an attribute is accessed.
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Any:
+        """Import the module and return the proxied object"""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module = importlib.import_module(self._module_name)
+                    if self._attribute:
+                        self._target = getattr(module, self._attribute)
+                    else:
+                        self._target = module
+        return self._target
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the target has been imported already"""
+        return self._target is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self.load())
+
+    def __repr__(self) -> str:
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyImport {target} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyImport:
+    """Create a lazy proxy for a module or a module attribute"""
+    return LazyImport(module_name, attribute)
+
+
+class _TimedLoader:
+    """Wraps a module loader to time module creation and execution"""
+
+    def __init__(self, loader, profiler: 'ImportProfiler', fullname: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._fullname = fullname
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        if create is None:
+            return None
+
+        self._profiler._enter(self._fullname)
+        try:
+            return create(spec)
+        finally:
+            self._profiler._exit(self._fullname)
+
+    def exec_module(self, module):
+        # Restore the real loader so nothing downstream sees the wrapper
+        module.__loader__ = self._loader
+        if getattr(module, '__spec__', None) is not None:
+            module.__spec__.loader = self._loader
+
+        self._profiler._enter(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._fullname)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """Records how long each module takes to import.
+
+    Installed as the first ``sys.meta_path`` finder; every module imported
+    while it is active is timed.  ``self`` time excludes nested imports,
+    ``cumulative`` includes them.
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.active = False
+        self._local = threading.local()
+
+    def start(self):
+        """Start recording import times"""
+        if not self.active:
+            sys.meta_path.insert(0, self)
+            self.active = True
+
+    def stop(self):
+        """Stop recording import times"""
+        if self.active:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self.active = False
+
+    def find_spec(self, fullname, path, target=None):
+        """Locate the module with the remaining finders and wrap its loader"""
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, fullname: str):
+        self._stack().append([fullname, time.perf_counter(), 0.0])
+
+    def _exit(self, fullname: str):
+        stack = self._stack()
+        name, started, children = stack.pop()
+        elapsed = (time.perf_counter() - started) * 1000
+        if stack:
+            stack[-1][2] += elapsed
+
+        entry = self.timings.setdefault(name, {'self': 0.0, 'cumulative': 0.0})
+        entry['self'] += elapsed - children
+        entry['cumulative'] += elapsed
+
+    def record(self, name: str, elapsed_ms: float):
+        """Record an explicit timing, e.g. constructing a view on first navigation"""
+        entry = self.timings.setdefault(name, {'self': 0.0, 'cumulative': 0.0})
+        entry['self'] += elapsed_ms
+        entry['cumulative'] += elapsed_ms
+
+    def report(self, limit: int = 30) -> str:
+        """Format the slowest imports as a text table (times in ms)"""
+        rows = sorted(self.timings.items(), key=lambda item: item[1]['cumulative'], reverse=True)
+        total_self = sum(entry['self'] for entry in self.timings.values())
+
+        lines = [
+            "Import profile (ms)",
+            f"{'module':<48} {'self':>10} {'cumulative':>12}",
+            "-" * 72
+        ]
+        for name, entry in rows[:limit]:
+            lines.append(f"{name:<48} {entry['self']:>10.1f} {entry['cumulative']:>12.1f}")
+        lines.append("-" * 72)
+        lines.append(f"{len(self.timings)} modules, {total_self:.1f} ms total")
+        return "\n".join(lines)
+
+
+# Global import profiler instance
+import_profiler = ImportProfiler()
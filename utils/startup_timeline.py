@@ -0,0 +1,136 @@
+"""
+Startup timeline for Task Planner
+Records named startup phases and runs independent ones on a thread pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class StartupTimeline:
+    """Named-phase timeline of application startup.
+
+    Every phase records its start offset and duration (ms, relative to the
+    creation of the timeline) and the thread it ran on, so phases that ran
+    concurrently on the startup pool show up side by side in the report.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("taskplanner.startup")
+
+    def elapsed(self) -> float:
+        """Milliseconds since the timeline was created"""
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a named phase"""
+        start = self.elapsed()
+        status = "ok"
+        try:
+            yield
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            self.record(name, start, self.elapsed(), status)
+
+    def record(self, name: str, start: float, end: float, status: str = "ok"):
+        """Record a phase that ran from ``start`` to ``end`` (ms offsets)"""
+        entry = {
+            'name': name,
+            'start': start,
+            'duration': end - start,
+            'thread': threading.current_thread().name,
+            'status': status
+        }
+        with self._lock:
+            self.phases.append(entry)
+        self.logger.debug(f"{name}: {entry['duration']:.1f} ms on {entry['thread']} ({status})")
+
+    def mark(self, name: str):
+        """Record a point in time, e.g. when the main window was first shown"""
+        offset = self.elapsed()
+        with self._lock:
+            self.marks[name] = offset
+        self.logger.info(f"Startup {name} after {offset:.0f} ms")
+
+    def report(self) -> str:
+        """Format the timeline as a text table (times in ms)"""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda entry: entry['start'])
+            marks = sorted(self.marks.items(), key=lambda item: item[1])
+
+        lines = [
+            "Startup timeline (ms)",
+            f"{'phase':<28} {'start':>9} {'duration':>10}  {'thread':<22} status",
+            "-" * 80
+        ]
+        for entry in phases:
+            lines.append(
+                f"{entry['name']:<28} {entry['start']:>9.1f} {entry['duration']:>10.1f}  "
+                f"{entry['thread']:<22} {entry['status']}"
+            )
+        if marks:
+            lines.append("-" * 80)
+            for name, offset in marks:
+                lines.append(f"{name:<28} {offset:>9.1f}")
+        lines.append("-" * 80)
+        lines.append(f"{len(phases)} phases, {self.elapsed():.1f} ms since start")
+        return "\n".join(lines)
+
+
+class StartupOrchestrator:
+    """Runs independent startup phases concurrently and records them on a timeline.
+
+    Phases are submitted by name and joined with ``result(name)``; the time
+    the caller spends blocked on a phase is recorded as ``wait:<name>``.
+    """
+
+    def __init__(self, timeline: StartupTimeline, max_workers: int = 3):
+        self.timeline = timeline
+        self.futures = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="startup")
+
+    def submit(self, name: str, func: Callable, *args, **kwargs):
+        """Start a phase on the startup pool"""
+        def run_phase():
+            with self.timeline.phase(name):
+                return func(*args, **kwargs)
+
+        future = self.executor.submit(run_phase)
+        self.futures[name] = future
+        return future
+
+    def run(self, name: str, func: Callable, *args, **kwargs):
+        """Run a phase on the calling thread"""
+        with self.timeline.phase(name):
+            return func(*args, **kwargs)
+
+    def result(self, name: str, timeout: Optional[float] = None):
+        """Wait for a submitted phase and return its result (re-raising its error)"""
+        future = self.futures[name]
+        if future.done():
+            return future.result()
+
+        start = self.timeline.elapsed()
+        try:
+            return future.result(timeout)
+        finally:
+            self.timeline.record(f"wait:{name}", start, self.timeline.elapsed())
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting phases; running ones finish in the background"""
+        self.executor.shutdown(wait=wait)
+
+
+# Global startup timeline instance
+startup_timeline = StartupTimeline()
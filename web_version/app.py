@@ -4,21 +4,30 @@ Task Planner Web Application
 Flask-based web version of the desktop Task Planner
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, g, has_app_context, make_response, Response, stream_with_context
 from flask_cors import CORS
 import sys
 import os
 import sqlite3
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 import json
+import io
+import base64
+import queue
+import threading
+import time
+import re
+import hashlib
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import wraps
 
 # Add parent directory to path to access desktop models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import desktop models (reuse existing database models)
 try:
-    from models.task import Task
-    from models.category import Category
     from models.goal import Goal
     from database.db_manager import DatabaseManager
     MODELS_AVAILABLE = True
@@ -27,6 +36,186 @@ except ImportError as e:
     print(f"Warning: Desktop models not available: {e}")
     MODELS_AVAILABLE = False
 
+# Indexes behind the /api/tasks filters and its (created_at, id) cursor
+TASK_INDEXES = [
+    ('idx_tasks_created_at_id', 'tasks (created_at, id)'),
+    ('idx_tasks_due_date', 'tasks (due_date)'),
+    ('idx_tasks_updated_at', 'tasks (updated_at)')
+]
+
+# Full-text indexes behind /api/search: (FTS table, content table, columns)
+SEARCH_INDEXES = [
+    ('tasks_fts', 'tasks', ('title', 'description')),
+    ('categories_fts', 'categories', ('name', 'description'))
+]
+
+# Connection pool settings; every request checks out at most one connection
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 16))
+DB_POOL_TIMEOUT = 30
+
+# Rows fetched per cursor round trip and bytes per chunk when streaming exports
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class SQLiteConnectionPool:
+    """Bounded pool of SQLite connections.
+
+    A connection is only ever used by one request, and so one thread, at a
+    time.  The database runs in WAL mode, so readers on other connections do
+    not block the writer and vice versa.
+    """
+
+    def __init__(self, db_path, max_size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.created = 0
+        self.closed = False
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def _create_connection(self):
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, timeout=self.timeout)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def acquire(self):
+        """Check out an idle connection, opening one while below max_size"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self.created < self.max_size
+            if can_create:
+                self.created += 1
+
+        if can_create:
+            try:
+                return self._create_connection()
+            except Exception:
+                with self._lock:
+                    self.created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise RuntimeError("Timed out waiting for a database connection")
+
+    def release(self, connection):
+        """Return a connection, rolling back anything left uncommitted"""
+        if connection.in_transaction:
+            connection.rollback()
+        if self.closed:
+            self._discard(connection)
+        else:
+            self._idle.put(connection)
+
+    def close(self):
+        """Close the idle connections; checked-out ones close when released"""
+        self.closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _discard(self, connection):
+        connection.close()
+        with self._lock:
+            self.created -= 1
+
+
+class DataVersions:
+    """Per-table change counters bumped by every write through the db managers.
+
+    Together with the database file signature (which also catches writes by
+    the desktop app or other processes to a shared SQLite file) they version
+    the data behind the cached API responses.
+    """
+
+    WRITE_PATTERN = re.compile(
+        r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[`\"]?(\w+)",
+        re.IGNORECASE
+    )
+    READ_PREFIXES = ('SELECT', 'PRAGMA', 'WITH', 'EXPLAIN', 'CREATE INDEX')
+
+    def __init__(self):
+        # Tokens from an earlier run must never match the restarted counters
+        self.boot_id = uuid.uuid4().hex[:8]
+        self.generation = 0
+        self.listeners = []
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def record_write(self, query):
+        """Bump the table written by ``query``; unknown statements bump everything"""
+        match = self.WRITE_PATTERN.match(query)
+        if match:
+            self.bump(match.group(1).lower())
+        elif not query.strip().upper().startswith(self.READ_PREFIXES):
+            self.bump_all()
+
+    def bump(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+        self._notify(tables)
+
+    def bump_all(self):
+        with self._lock:
+            self.generation += 1
+        self._notify(None)
+
+    def add_listener(self, callback):
+        """Call ``callback(tables)`` after each bump (``tables`` is None for bump_all)"""
+        self.listeners.append(callback)
+
+    def _notify(self, tables):
+        for callback in self.listeners:
+            try:
+                callback(tables)
+            except Exception as e:
+                print(f"Error in data version listener: {e}")
+
+    def get(self, tables):
+        """Current counters of ``tables``"""
+        with self._lock:
+            return (self.boot_id, self.generation) + tuple(self._versions.get(table, 0) for table in tables)
+
+
+# Global data version counters
+data_versions = DataVersions()
+
+
+@contextmanager
+def request_connection(manager):
+    """Connection of ``manager`` for the current request.
+
+    Inside an app context the connection is checked out on first use and kept
+    on ``g`` until ``release_db_connections`` returns it at teardown.  Outside
+    one (startup, scripts) it is only held for the duration of the block.
+    """
+    if has_app_context():
+        connections = g.setdefault('db_connections', {})
+        entry = connections.get(id(manager))
+        if entry is None:
+            entry = connections[id(manager)] = (manager, manager.acquire_connection())
+        yield entry[1]
+    else:
+        connection = manager.acquire_connection()
+        try:
+            yield connection
+        finally:
+            manager.release_connection(connection)
+
+
 # Simple web database manager
 class WebDatabaseManager:
     """Simple database manager for web version using local SQLite"""
@@ -35,62 +224,186 @@ class WebDatabaseManager:
         if db_path is None:
             db_path = os.path.join(os.path.dirname(__file__), 'task_planner.db')
         self.db_path = db_path
-        self.connection = None
+        self.pool = None
+        self.db_type = 'sqlite'
+        self.search_available = False
 
     def connect(self):
-        """Connect to SQLite database"""
+        """Open the connection pool for the SQLite database"""
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
-            self.connection.execute("PRAGMA foreign_keys = ON")
+            if self.pool:
+                self.pool.close()
+            self.pool = SQLiteConnectionPool(self.db_path)
+
+            # Open the first connection now so a bad path fails here
+            self.pool.release(self.pool.acquire())
             return True
         except Exception as e:
             print(f"Database connection error: {e}")
+            self.pool = None
             return False
 
+    def acquire_connection(self):
+        """Check out a pooled connection"""
+        if not self.pool:
+            self.connect()
+        return self.pool.acquire()
+
+    def release_connection(self, connection):
+        """Give a connection back to the pool"""
+        self.pool.release(connection)
+
     def execute_query(self, query, params=None):
         """Execute a query and return lastrowid for inserts"""
-        if not self.connection:
-            self.connect()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
-            self.connection.commit()
-            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+            with request_connection(self) as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params or ())
+                connection.commit()
+                data_versions.record_write(query)
+                return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
         except Exception as e:
             print(f"Query execution error: {e}")
             return None
 
+    def execute_many(self, query, params_list):
+        """Run one statement for many parameter rows in a single transaction; returns the row count"""
+        try:
+            with request_connection(self) as connection:
+                try:
+                    cursor = connection.cursor()
+                    cursor.executemany(query, params_list)
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+            data_versions.record_write(query)
+            return cursor.rowcount
+        except Exception as e:
+            print(f"Batch execution error: {e}")
+            return None
+
     def fetch_all(self, query, params=None):
         """Fetch all results from query"""
-        if not self.connection:
-            self.connect()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
-            return [dict(row) for row in cursor.fetchall()]
+            with request_connection(self) as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params or ())
+                return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
             print(f"Fetch all error: {e}")
             return []
 
     def fetch_one(self, query, params=None):
         """Fetch one result from query"""
-        if not self.connection:
-            self.connect()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
-            result = cursor.fetchone()
-            return dict(result) if result else None
+            with request_connection(self) as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params or ())
+                result = cursor.fetchone()
+                return dict(result) if result else None
         except Exception as e:
             print(f"Fetch one error: {e}")
             return None
 
+    def get_change_signature(self):
+        """(mtime, size) of the database and WAL files, to notice writes by other processes"""
+        signature = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def iter_rows(self, query, params=None, batch_size=None):
+        """Yield the rows of ``query`` as dicts, ``batch_size`` at a time from the cursor.
+
+        Uses its own pooled connection, held until the generator finishes or
+        is closed, so it can feed a streamed response after the request ends.
+        """
+        connection = self.acquire_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size or EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            self.release_connection(connection)
+
+    def backup_to(self, target_path):
+        """Write a consistent snapshot of the live database to ``target_path``"""
+        connection = self.acquire_connection()
+        try:
+            target = sqlite3.connect(target_path)
+            try:
+                connection.backup(target)
+            finally:
+                target.close()
+        finally:
+            self.release_connection(connection)
+
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close the connection pool"""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+
+    def ensure_indexes(self):
+        """Create the task indexes used by the API if they are missing"""
+        for name, definition in TASK_INDEXES:
+            self.execute_query(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+        self.ensure_search_index()
+
+    def ensure_search_index(self):
+        """Create the FTS5 search tables and the triggers that keep them in sync.
+
+        The FTS tables are external-content tables over ``tasks`` and
+        ``categories``, so they only store the index.  They are filled once
+        when created; afterwards the triggers maintain them, including for
+        writes made by the desktop app to a shared database file.
+        """
+        self.search_available = False
+        try:
+            with request_connection(self) as connection:
+                for fts_table, table, columns in SEARCH_INDEXES:
+                    exists = connection.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts_table,)
+                    ).fetchone()
+
+                    column_list = ', '.join(columns)
+                    new_values = ', '.join(f"new.{column}" for column in columns)
+                    old_values = ', '.join(f"old.{column}" for column in columns)
+
+                    connection.executescript(f"""
+                        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                            {column_list}, content='{table}', content_rowid='id', prefix='2 3'
+                        );
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {table} BEGIN
+                            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {table} BEGIN
+                            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE OF {column_list} ON {table} BEGIN
+                            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+                        END;
+                    """)
+
+                    if not exists:
+                        connection.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+                        connection.commit()
+                        print(f"✅ Built search index {fts_table}")
+
+            self.search_available = True
+        except Exception as e:
+            print(f"Search index unavailable, falling back to LIKE search: {e}")
 
     def get_db_info(self):
         """Get database information"""
@@ -132,14 +445,18 @@ class MySQLDatabaseManager:
         self.database = database
         self.username = username
         self.password = password
-        self.connection = None
+        self.pool = None
         self.db_type = 'mysql'
+        self.search_available = False
 
     def connect(self):
-        """Connect to MySQL database"""
+        """Create the MySQL connection pool"""
         try:
-            import mysql.connector
-            self.connection = mysql.connector.connect(
+            from mysql.connector import pooling
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name=f"task_planner_{id(self)}",
+                pool_size=min(DB_POOL_SIZE, pooling.CNX_POOL_MAXSIZE),
+                pool_reset_session=True,
                 host=self.host,
                 port=self.port,
                 database=self.database,
@@ -149,50 +466,141 @@ class MySQLDatabaseManager:
             return True
         except Exception as e:
             print(f"MySQL connection error: {e}")
+            self.pool = None
             return False
 
+    def acquire_connection(self):
+        """Check out a pooled connection, waiting while the pool is exhausted"""
+        from mysql.connector import errors
+
+        if not self.pool:
+            self.connect()
+
+        deadline = time.monotonic() + DB_POOL_TIMEOUT
+        while True:
+            try:
+                return self.pool.get_connection()
+            except errors.PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.01)
+
+    def release_connection(self, connection):
+        """Give a connection back to the pool (closing a pooled connection returns it)"""
+        connection.close()
+
     def execute_query(self, query, params=None):
         """Execute a query and return lastrowid for inserts"""
-        if not self.connection or not self.connection.is_connected():
-            self.connect()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params or ())
-            self.connection.commit()
-            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+            with request_connection(self) as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params or ())
+                connection.commit()
+                data_versions.record_write(query)
+                return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
         except Exception as e:
             print(f"MySQL query execution error: {e}")
             return None
 
+    def execute_many(self, query, params_list):
+        """Run one statement for many parameter rows in a single transaction; returns the row count"""
+        try:
+            with request_connection(self) as connection:
+                try:
+                    cursor = connection.cursor()
+                    cursor.executemany(query, params_list)
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+            data_versions.record_write(query)
+            return cursor.rowcount
+        except Exception as e:
+            print(f"MySQL batch execution error: {e}")
+            return None
+
     def fetch_all(self, query, params=None):
         """Fetch all results from query"""
-        if not self.connection or not self.connection.is_connected():
-            self.connect()
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params or ())
-            return cursor.fetchall()
+            with request_connection(self) as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(query, params or ())
+                return cursor.fetchall()
         except Exception as e:
             print(f"MySQL fetch all error: {e}")
             return []
 
     def fetch_one(self, query, params=None):
         """Fetch one result from query"""
-        if not self.connection or not self.connection.is_connected():
-            self.connect()
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params or ())
-            return cursor.fetchone()
+            with request_connection(self) as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(query, params or ())
+                return cursor.fetchone()
         except Exception as e:
             print(f"MySQL fetch one error: {e}")
             return None
 
+    def get_change_signature(self):
+        """Only writes made through this process are tracked for MySQL"""
+        return ()
+
+    def iter_rows(self, query, params=None, batch_size=None):
+        """Yield the rows of ``query`` as dicts from an unbuffered cursor (see WebDatabaseManager)"""
+        connection = self.acquire_connection()
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size or EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+            cursor.close()
+        finally:
+            self.release_connection(connection)
+
     def close(self):
-        """Close database connection"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            self.connection = None
+        """Close the idle pooled connections"""
+        if self.pool:
+            try:
+                self.pool._remove_connections()
+            except Exception as e:
+                print(f"MySQL pool close error: {e}")
+            self.pool = None
+
+    def ensure_indexes(self):
+        """Add the indexes used by the API to tables created before they existed"""
+        self.ensure_search_index()
+
+    def ensure_search_index(self):
+        """Add the FULLTEXT indexes behind /api/search if they are missing.
+
+        New tables get them from initialize_tables; older databases are
+        altered once here.  Search falls back to LIKE if this fails.
+        """
+        self.search_available = False
+        try:
+            with request_connection(self) as connection:
+                cursor = connection.cursor()
+                for _, table, columns in SEARCH_INDEXES:
+                    index_name = f"ft_{table}_search"
+                    cursor.execute("""
+                        SELECT 1 FROM information_schema.statistics
+                        WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+                        LIMIT 1
+                    """, (table, index_name))
+                    if cursor.fetchall():
+                        continue
+
+                    cursor.execute(f"ALTER TABLE {table} ADD FULLTEXT INDEX {index_name} ({', '.join(columns)})")
+                    connection.commit()
+                    print(f"✅ Built search index {index_name}")
+
+            self.search_available = True
+        except Exception as e:
+            print(f"Search index unavailable, falling back to LIKE search: {e}")
 
     def get_db_info(self):
         """Get database information"""
@@ -245,7 +653,8 @@ class MySQLDatabaseManager:
                     description TEXT,
                     color VARCHAR(7) DEFAULT '#007bff',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    FULLTEXT INDEX ft_categories_search (name, description)
                 )
                 """,
                 """
@@ -279,6 +688,10 @@ class MySQLDatabaseManager:
                     completed_at TIMESTAMP NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    INDEX idx_tasks_created_at_id (created_at, id),
+                    INDEX idx_tasks_due_date (due_date),
+                    INDEX idx_tasks_updated_at (updated_at),
+                    FULLTEXT INDEX ft_tasks_search (title, description),
                     FOREIGN KEY (category_id) REFERENCES categories(id) ON DELETE SET NULL,
                     FOREIGN KEY (priority_id) REFERENCES priority_levels(id) ON DELETE SET NULL,
                     FOREIGN KEY (parent_task_id) REFERENCES tasks(id) ON DELETE CASCADE
@@ -356,6 +769,7 @@ def initialize_database():
             db_manager = WebDatabaseManager(web_db_path)
             if db_manager.connect():
                 print("✅ Connected to web database successfully")
+                db_manager.ensure_indexes()
                 return True
 
         # Try to use existing desktop database
@@ -365,6 +779,7 @@ def initialize_database():
             db_manager = WebDatabaseManager(desktop_db_path)
             if db_manager.connect():
                 print("✅ Connected to desktop database successfully")
+                db_manager.ensure_indexes()
                 return True
 
         # Create new database for web version
@@ -372,6 +787,7 @@ def initialize_database():
         db_manager = WebDatabaseManager()
         if db_manager.connect():
             create_sample_data()
+            db_manager.ensure_indexes()
             return True
 
         return False
@@ -527,6 +943,86 @@ else:
     print("❌ Database connection failed")
     db_manager = None
 
+@app.teardown_appcontext
+def release_db_connections(exception=None):
+    """Return the connections checked out by this request to their pools"""
+    connections = g.pop('db_connections', {})
+    for manager, connection in connections.values():
+        try:
+            manager.release_connection(connection)
+        except Exception as e:
+            print(f"Error releasing database connection: {e}")
+
+# Cached GET responses: cache key -> (etag, body, status, mimetype)
+RESPONSE_CACHE_SIZE = 256
+response_cache = OrderedDict()
+response_cache_lock = threading.Lock()
+
+
+def get_response_etag(tables, full_path, daily=False):
+    """ETag of a cached GET response for the current versions of ``tables``"""
+    # Computed before running the view, so the body is never older than its tag
+    state = (data_versions.get(tables), db_manager.get_change_signature(), full_path)
+    if daily:
+        state += (date.today().isoformat(),)
+    return hashlib.sha1(repr(state).encode('utf-8')).hexdigest()[:20]
+
+
+def get_cached_body(key, etag):
+    """Cached (body, status, mimetype) of ``key`` if it is still at ``etag``"""
+    with response_cache_lock:
+        cached = response_cache.get(key)
+    if cached and cached[0] == etag:
+        return cached[1:]
+    return None
+
+
+def store_cached_body(key, etag, body, status, mimetype):
+    """Remember a serialized response, dropping the least recently stored ones"""
+    with response_cache_lock:
+        response_cache[key] = (etag, body, status, mimetype)
+        response_cache.move_to_end(key)
+        while len(response_cache) > RESPONSE_CACHE_SIZE:
+            response_cache.popitem(last=False)
+
+
+def cached_response(*tables, daily=False):
+    """Serve a GET endpoint with a data-version ETag and an in-process cache.
+
+    The ETag is derived from the change counters of ``tables`` (plus today's
+    date for ``daily`` endpoints whose results depend on it) and the request
+    URL, so ``If-None-Match`` polls are answered with 304 and repeated reads
+    reuse the serialized body until one of the tables is written.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not db_manager:
+                return view(*args, **kwargs)
+
+            etag = get_response_etag(tables, request.full_path, daily)
+            if etag in request.if_none_match:
+                response = make_response('', 304)
+                response.set_etag(etag)
+                return response
+
+            key = (request.endpoint, request.full_path)
+            cached = get_cached_body(key, etag)
+            if cached:
+                response = make_response(cached[0], cached[1])
+                response.mimetype = cached[2]
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                store_cached_body(key, etag, response.get_data(), response.status_code, response.mimetype)
+
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
 @app.route('/')
 def index():
     """Main web application page"""
@@ -558,9 +1054,75 @@ def settings():
     return render_template('settings.html')
 
 # API Routes
+
+# Columns that /api/tasks can return through ``fields=``
+TASK_FIELD_COLUMNS = {
+    'id': 't.id',
+    'user_id': 't.user_id',
+    'category_id': 't.category_id',
+    'priority_id': 't.priority_id',
+    'title': 't.title',
+    'description': 't.description',
+    'due_date': 't.due_date',
+    'due_time': 't.due_time',
+    'estimated_duration': 't.estimated_duration',
+    'actual_duration': 't.actual_duration',
+    'status': 't.status',
+    'is_recurring': 't.is_recurring',
+    'recurrence_pattern': 't.recurrence_pattern',
+    'recurrence_interval': 't.recurrence_interval',
+    'recurrence_end_date': 't.recurrence_end_date',
+    'parent_task_id': 't.parent_task_id',
+    'completed_at': 't.completed_at',
+    'created_at': 't.created_at',
+    'updated_at': 't.updated_at',
+    'category_name': 'c.name',
+    'category_color': 'c.color',
+    'priority_name': 'p.name',
+    'priority_color': 'p.color'
+}
+
+# Largest page /api/tasks returns when a limit is given
+MAX_TASK_PAGE_SIZE = 500
+
+
+def encode_task_cursor(task):
+    """Opaque cursor pointing just after ``task`` in (created_at, id) DESC order"""
+    raw = json.dumps([task.get('created_at'), task['id']], default=str)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_task_cursor(cursor):
+    """Inverse of encode_task_cursor; raises ValueError for malformed cursors"""
+    try:
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return created_at, int(task_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def parse_date_arg(name):
+    """Read an optional YYYY-MM-DD query parameter"""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"'{name}' must be a date (YYYY-MM-DD)")
+
+
 @app.route('/api/tasks', methods=['GET'])
+@cached_response('tasks', 'categories', 'priority_levels')
 def get_tasks():
-    """Get all tasks"""
+    """Get tasks, optionally filtered, field-selected and paginated.
+
+    Query parameters: ``status``, ``category``, ``priority``, ``due_from`` /
+    ``due_to`` (inclusive due date range), ``updated_since`` (UTC timestamp),
+    ``fields`` (comma separated column names), ``limit`` and ``after`` (the
+    ``next_cursor`` of the previous page).  Without ``limit`` every matching
+    task is returned, as before.
+    """
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
@@ -569,11 +1131,37 @@ def get_tasks():
         status_filter = request.args.get('status')
         category_filter = request.args.get('category')
         priority_filter = request.args.get('priority')
+        updated_since = request.args.get('updated_since')
+
+        try:
+            due_from = parse_date_arg('due_from')
+            due_to = parse_date_arg('due_to')
+
+            limit = request.args.get('limit', type=int)
+            if limit is not None:
+                limit = max(1, min(limit, MAX_TASK_PAGE_SIZE))
+
+            after = request.args.get('after')
+            cursor = decode_task_cursor(after) if after else None
+
+            fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+            unknown = [field for field in fields if field not in TASK_FIELD_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # id and created_at are always read so the next cursor can be built
+        if fields:
+            selected = list(dict.fromkeys(['id', 'created_at'] + fields))
+            columns = ', '.join(f"{TASK_FIELD_COLUMNS[field]} AS {field}" for field in selected)
+        else:
+            columns = """t.*, c.name as category_name, c.color as category_color,
+                   p.name as priority_name, p.color as priority_color"""
 
         # Build query with filters
-        query = """
-            SELECT t.*, c.name as category_name, c.color as category_color,
-                   p.name as priority_name, p.color as priority_color
+        query = f"""
+            SELECT {columns}
             FROM tasks t
             LEFT JOIN categories c ON t.category_id = c.id
             LEFT JOIN priority_levels p ON t.priority_id = p.id
@@ -590,11 +1178,47 @@ def get_tasks():
         if priority_filter:
             query += " AND t.priority_id = ?"
             params.append(priority_filter)
+        if due_from:
+            query += " AND t.due_date >= ?"
+            params.append(due_from)
+        if due_to:
+            query += " AND t.due_date <= ?"
+            params.append(due_to)
+        if updated_since:
+            query += " AND t.updated_at > ?"
+            params.append(updated_since.replace('T', ' '))
+
+        if cursor:
+            created_at, task_id = cursor
+            if created_at is None:
+                query += " AND t.created_at IS NULL AND t.id < ?"
+                params.append(task_id)
+            else:
+                query += " AND (t.created_at < ? OR (t.created_at = ? AND t.id < ?) OR t.created_at IS NULL)"
+                params.extend([created_at, created_at, task_id])
+
+        query += " ORDER BY t.created_at DESC, t.id DESC"
 
-        query += " ORDER BY t.created_at DESC"
+        if limit is not None:
+            # One extra row tells whether another page follows
+            query += " LIMIT ?"
+            params.append(limit + 1)
 
         tasks = db_manager.fetch_all(query, tuple(params) if params else None)
-        return jsonify({'tasks': tasks})
+
+        has_more = limit is not None and len(tasks) > limit
+        if has_more:
+            tasks = tasks[:limit]
+        next_cursor = encode_task_cursor(tasks[-1]) if has_more else None
+
+        if fields and 'created_at' not in fields:
+            for task in tasks:
+                task.pop('created_at', None)
+        if fields and 'id' not in fields:
+            for task in tasks:
+                task.pop('id', None)
+
+        return jsonify({'tasks': tasks, 'next_cursor': next_cursor, 'has_more': has_more})
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -716,9 +1340,8 @@ def update_task(task_id):
             update_fields.append("recurrence_end_date = ?")
             params.append(data['recurrence_end_date'])
 
-        # Always update the updated_at field
-        update_fields.append("updated_at = ?")
-        params.append(datetime.now().isoformat())
+        # Always update the updated_at field (UTC, like the inserts, so updated_since compares correctly)
+        update_fields.append("updated_at = datetime('now')")
 
         # Add task_id for WHERE clause
         params.append(task_id)
@@ -810,14 +1433,19 @@ def get_tasks_for_date(date_str):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+CATEGORIES_QUERY = "SELECT * FROM categories ORDER BY name"
+PRIORITIES_QUERY = "SELECT * FROM priority_levels ORDER BY level"
+
+
 @app.route('/api/categories', methods=['GET'])
+@cached_response('categories')
 def get_categories():
     """Get all categories"""
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
-        categories = db_manager.fetch_all("SELECT * FROM categories ORDER BY name")
+        categories = db_manager.fetch_all(CATEGORIES_QUERY)
         return jsonify({'success': True, 'categories': categories})
 
     except Exception as e:
@@ -903,13 +1531,14 @@ def delete_category(category_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/priorities', methods=['GET'])
+@cached_response('priority_levels')
 def get_priorities():
     """Get all priorities"""
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
-        priorities = db_manager.fetch_all("SELECT * FROM priority_levels ORDER BY level")
+        priorities = db_manager.fetch_all(PRIORITIES_QUERY)
         return jsonify({'priorities': priorities})
 
     except Exception as e:
@@ -943,37 +1572,47 @@ def get_goals():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/analytics/overview', methods=['GET'])
+@cached_response('tasks', daily=True)
 def get_analytics_overview():
-    """Get analytics overview"""
-    if not MODELS_AVAILABLE:
+    """Get analytics overview.
+
+    Counted by one conditional-aggregate query; the serialized result is
+    cached per tasks data version (and day) by ``cached_response``.
+    """
+    if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
-        # Get basic statistics
-        all_tasks = Task.get_all()
-        total_tasks = len(all_tasks)
-        completed_tasks = len([t for t in all_tasks if t.status == 'completed'])
-        pending_tasks = len([t for t in all_tasks if t.status == 'pending'])
-        in_progress_tasks = len([t for t in all_tasks if t.status == 'in_progress'])
+        today = date.today().isoformat()
+        placeholder = '%s' if db_manager.db_type == 'mysql' else '?'
+        counts = db_manager.fetch_one("""
+            SELECT COUNT(*) AS total_tasks,
+                   COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0) AS completed_tasks,
+                   COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0) AS pending_tasks,
+                   COALESCE(SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END), 0) AS in_progress_tasks,
+                   COALESCE(SUM(CASE WHEN due_date = {p} THEN 1 ELSE 0 END), 0) AS today_tasks,
+                   COALESCE(SUM(CASE WHEN due_date < {p} AND status != 'completed' THEN 1 ELSE 0 END), 0) AS overdue_tasks
+            FROM tasks
+        """.format(p=placeholder), (today, today))
+
+        if counts is None:
+            return jsonify({'error': 'Failed to load analytics'}), 500
+
+        # MySQL returns the sums as Decimal
+        counts = {key: int(value or 0) for key, value in counts.items()}
+        total_tasks = counts['total_tasks']
 
         # Calculate completion rate
-        completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-
-        # Get today's tasks
-        today = date.today()
-        today_tasks = [t for t in all_tasks if t.due_date == today]
-
-        # Get overdue tasks
-        overdue_tasks = [t for t in all_tasks if t.due_date and t.due_date < today and t.status != 'completed']
+        completion_rate = (counts['completed_tasks'] / total_tasks * 100) if total_tasks > 0 else 0
 
         analytics_data = {
             'total_tasks': total_tasks,
-            'completed_tasks': completed_tasks,
-            'pending_tasks': pending_tasks,
-            'in_progress_tasks': in_progress_tasks,
+            'completed_tasks': counts['completed_tasks'],
+            'pending_tasks': counts['pending_tasks'],
+            'in_progress_tasks': counts['in_progress_tasks'],
             'completion_rate': round(completion_rate, 1),
-            'today_tasks': len(today_tasks),
-            'overdue_tasks': len(overdue_tasks)
+            'today_tasks': counts['today_tasks'],
+            'overdue_tasks': counts['overdue_tasks']
         }
 
         return jsonify(analytics_data)
@@ -981,64 +1620,192 @@ def get_analytics_overview():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Search paging limits
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+
+
+def build_search_terms(query):
+    """Words of a search query (punctuation would be FTS syntax, so it is dropped)"""
+    return re.findall(r'\w+', query.lower())
+
+
 @app.route('/api/search', methods=['GET'])
 def search():
-    """Search across tasks, categories, and goals"""
-    if not MODELS_AVAILABLE:
+    """Search tasks and categories, best matches first.
+
+    Uses the FTS5 (SQLite) or FULLTEXT (MySQL) indexes with every word matched
+    as a prefix, ranked with title/name matches weighted above descriptions.
+    ``limit`` and ``offset`` page through the ranked results in the database.
+    """
+    if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
-        query = request.args.get('q', '').strip().lower()
-        if len(query) < 2:
-            return jsonify({'results': []})
+        query = request.args.get('q', '').strip()
+        limit = max(1, min(request.args.get('limit', SEARCH_DEFAULT_LIMIT, type=int), SEARCH_MAX_LIMIT))
+        offset = max(0, request.args.get('offset', 0, type=int))
+
+        terms = build_search_terms(query)
+        if len(query) < 2 or not terms:
+            return jsonify({'results': [], 'has_more': False, 'next_offset': None})
+
+        if db_manager.db_type == 'mysql' and db_manager.search_available:
+            match = ' '.join(f"+{term}*" for term in terms)
+            sql = """
+                SELECT 'task' AS type, id, title, description, status, NULL AS color,
+                       MATCH(title, description) AGAINST (%s IN BOOLEAN MODE) AS score
+                FROM tasks
+                WHERE MATCH(title, description) AGAINST (%s IN BOOLEAN MODE)
+                UNION ALL
+                SELECT 'category' AS type, id, name AS title, description, NULL AS status, color,
+                       MATCH(name, description) AGAINST (%s IN BOOLEAN MODE) AS score
+                FROM categories
+                WHERE MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)
+                ORDER BY score DESC, id DESC
+                LIMIT %s OFFSET %s
+            """
+            params = (match, match, match, match, limit + 1, offset)
+        elif db_manager.search_available:
+            match = ' '.join(f'"{term}"*' for term in terms)
+            sql = """
+                SELECT 'task' AS type, t.id, t.title, t.description, t.status, NULL AS color,
+                       bm25(tasks_fts, 10.0, 1.0) AS score
+                FROM tasks_fts
+                JOIN tasks t ON t.id = tasks_fts.rowid
+                WHERE tasks_fts MATCH ?
+                UNION ALL
+                SELECT 'category' AS type, c.id, c.name AS title, c.description, NULL AS status, c.color,
+                       bm25(categories_fts, 10.0, 1.0) AS score
+                FROM categories_fts
+                JOIN categories c ON c.id = categories_fts.rowid
+                WHERE categories_fts MATCH ?
+                ORDER BY score, id DESC
+                LIMIT ? OFFSET ?
+            """
+            params = (match, match, limit + 1, offset)
+        else:
+            # No full-text index available: substring search, still limited in the database
+            pattern = f"%{query.lower()}%"
+            placeholder = '%s' if db_manager.db_type == 'mysql' else '?'
+            sql = """
+                SELECT 'task' AS type, id, title, description, status, NULL AS color,
+                       CASE WHEN lower(title) LIKE {p} THEN 0 ELSE 1 END AS score
+                FROM tasks
+                WHERE lower(title) LIKE {p} OR lower(description) LIKE {p}
+                UNION ALL
+                SELECT 'category' AS type, id, name AS title, description, NULL AS status, color, 0 AS score
+                FROM categories
+                WHERE lower(name) LIKE {p}
+                ORDER BY score, id DESC
+                LIMIT {p} OFFSET {p}
+            """.format(p=placeholder)
+            params = (pattern, pattern, pattern, pattern, limit + 1, offset)
+
+        rows = db_manager.fetch_all(sql, params)
+        has_more = len(rows) > limit
 
         results = []
+        for row in rows[:limit]:
+            result = {
+                'type': row['type'],
+                'id': row['id'],
+                'title': row['title'],
+                'description': row['description'] or ''
+            }
+            if row['type'] == 'task':
+                result['status'] = row['status']
+            else:
+                result['color'] = row['color']
+            results.append(result)
 
-        # Search tasks
-        tasks = Task.get_all()
-        for task in tasks:
-            if (query in task.title.lower() or
-                (task.description and query in task.description.lower())):
-                results.append({
-                    'type': 'task',
-                    'id': task.id,
-                    'title': task.title,
-                    'description': task.description or '',
-                    'status': task.status
-                })
-
-        # Search categories
-        categories = Category.get_all()
-        for category in categories:
-            if query in category.name.lower():
-                results.append({
-                    'type': 'category',
-                    'id': category.id,
-                    'title': category.name,
-                    'description': category.description or '',
-                    'color': category.color
-                })
-
-        return jsonify({'results': results[:20]})  # Limit to 20 results
+        return jsonify({
+            'results': results,
+            'has_more': has_more,
+            'next_offset': offset + limit if has_more else None
+        })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Settings API Routes
+
+class SettingsCache:
+    """In-memory copy of the user's settings.
+
+    Reloaded only when ``user_settings`` has been written (or the database
+    file changed underneath us), and saved with one batched upsert.
+    """
+
+    UPSERT_QUERIES = {
+        'sqlite': """
+            INSERT INTO user_settings (user_id, setting_key, setting_value, created_at, updated_at)
+            VALUES (1, ?, ?, ?, ?)
+            ON CONFLICT(user_id, setting_key) DO UPDATE SET
+                setting_value = excluded.setting_value,
+                updated_at = excluded.updated_at
+        """,
+        'mysql': """
+            INSERT INTO user_settings (user_id, setting_key, setting_value, created_at, updated_at)
+            VALUES (1, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                setting_value = VALUES(setting_value),
+                updated_at = VALUES(updated_at)
+        """
+    }
+
+    def __init__(self):
+        self._settings = None
+        self._state = None
+        self._lock = threading.Lock()
+
+    def _get_state(self):
+        return (id(db_manager), data_versions.get(('user_settings',)), db_manager.get_change_signature())
+
+    def get(self):
+        """All settings of the user as a {key: value} dict"""
+        state = self._get_state()
+        with self._lock:
+            if self._settings is None or state != self._state:
+                rows = db_manager.fetch_all(
+                    "SELECT setting_key, setting_value FROM user_settings WHERE user_id = 1"
+                )
+                self._settings = {row['setting_key']: row['setting_value'] for row in rows}
+                self._state = state
+            return dict(self._settings)
+
+    def save(self, settings):
+        """Upsert the settings whose value changed in one transaction; returns how many were written"""
+        current = self.get()
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        rows = [
+            (key, str(value), now, now)
+            for key, value in settings.items()
+            if current.get(key) != str(value)
+        ]
+        if not rows:
+            return 0
+
+        if db_manager.execute_many(self.UPSERT_QUERIES[db_manager.db_type], rows) is None:
+            raise RuntimeError('Failed to save settings')
+        return len(rows)
+
+
+# Global settings cache instance
+settings_cache = SettingsCache()
+
+
 @app.route('/api/settings', methods=['GET'])
+@cached_response('user_settings')
 def get_settings():
     """Get user settings"""
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
-        # Get settings from database or return defaults
-        settings = db_manager.fetch_all("SELECT * FROM user_settings WHERE user_id = 1")
+        settings_dict = settings_cache.get()
 
-        if settings:
-            # Convert to key-value pairs
-            settings_dict = {setting['setting_key']: setting['setting_value'] for setting in settings}
-        else:
+        if not settings_dict:
             # Return default settings
             settings_dict = {
                 'theme': 'light',
@@ -1054,7 +1821,7 @@ def get_settings():
 
 @app.route('/api/settings', methods=['POST'])
 def save_settings():
-    """Save user settings"""
+    """Save user settings with a single batched upsert"""
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
@@ -1062,26 +1829,7 @@ def save_settings():
         data = request.get_json()
         settings = data.get('settings', {})
 
-        # Save each setting
-        for key, value in settings.items():
-            # Check if setting exists
-            existing = db_manager.fetch_one(
-                "SELECT id FROM user_settings WHERE user_id = 1 AND setting_key = ?",
-                (key,)
-            )
-
-            if existing:
-                # Update existing setting
-                db_manager.execute_query(
-                    "UPDATE user_settings SET setting_value = ?, updated_at = datetime('now') WHERE user_id = 1 AND setting_key = ?",
-                    (str(value), key)
-                )
-            else:
-                # Insert new setting
-                db_manager.execute_query(
-                    "INSERT INTO user_settings (user_id, setting_key, setting_value, created_at, updated_at) VALUES (1, ?, ?, datetime('now'), datetime('now'))",
-                    (key, str(value))
-                )
+        settings_cache.save(settings)
 
         return jsonify({'success': True, 'message': 'Settings saved successfully'})
 
@@ -1145,28 +1893,44 @@ def optimize_database():
 
 @app.route('/api/database/export', methods=['GET'])
 def export_database():
-    """Export database file"""
+    """Export a consistent snapshot of the SQLite database file.
+
+    The snapshot is taken with the sqlite3 backup API, so concurrent writes
+    cannot tear it, and streamed to the client in chunks.
+    """
     if not db_manager:
         return jsonify({'success': False, 'error': 'Database not available'})
 
+    if db_manager.db_type != 'sqlite':
+        return jsonify({'success': False, 'error': 'Database file export is only available for SQLite'})
+
     try:
-        import shutil
-        from flask import send_file
-
-        db_path = db_manager.db_path
-        if not os.path.exists(db_path):
-            return jsonify({'success': False, 'error': 'Database file not found'})
-
-        # Create a temporary copy for download
-        temp_path = db_path + '.backup'
-        shutil.copy2(db_path, temp_path)
-
-        return send_file(
-            temp_path,
-            as_attachment=True,
-            download_name=f'task_planner_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.db',
-            mimetype='application/octet-stream'
-        )
+        import tempfile
+
+        fd, snapshot_path = tempfile.mkstemp(suffix='.db', prefix='task_planner_export_')
+        os.close(fd)
+        try:
+            db_manager.backup_to(snapshot_path)
+        except Exception:
+            os.remove(snapshot_path)
+            raise
+
+        def generate():
+            try:
+                with open(snapshot_path, 'rb') as f:
+                    while True:
+                        chunk = f.read(EXPORT_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        yield chunk
+            finally:
+                os.remove(snapshot_path)
+
+        filename = f'task_planner_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.db'
+        return Response(generate(), mimetype='application/octet-stream', headers={
+            'Content-Disposition': f'attachment; filename={filename}',
+            'Content-Length': str(os.path.getsize(snapshot_path))
+        })
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -1230,11 +1994,13 @@ def configure_database():
                         if mysql_db_manager.connect():
                             # Initialize tables if they don't exist
                             mysql_db_manager.initialize_tables()
+                            mysql_db_manager.ensure_indexes()
 
                             # Replace global db_manager
                             if db_manager:
                                 db_manager.close()
                             db_manager = mysql_db_manager
+                            data_versions.bump_all()
 
                             connection.close()
 
@@ -1296,119 +2062,714 @@ def configure_database():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+class _EchoWriter:
+    """File-like object whose write() returns the text, so csv.writer rows can be yielded"""
+
+    def write(self, value):
+        return value
+
+
+def stream_rows(rows, format_type):
+    """Serialize an iterator of row dicts as CSV, NDJSON or a JSON array, chunk by chunk"""
+    if format_type == 'csv':
+        import csv
+        writer = csv.writer(_EchoWriter())
+        header = None
+        for row in rows:
+            if header is None:
+                header = list(row.keys())
+                yield writer.writerow(header)
+            yield writer.writerow([row[column] for column in header])
+    elif format_type == 'ndjson':
+        for row in rows:
+            yield json.dumps(row, default=str) + '\n'
+    else:
+        yield '['
+        separator = '\n'
+        for row in rows:
+            yield separator + json.dumps(row, default=str)
+            separator = ',\n'
+        yield '\n]\n'
+
+
+# Export queries and streamed formats: format -> (mimetype, file extension)
+EXPORT_QUERIES = {
+    'tasks': """
+        SELECT t.*, c.name as category_name, p.name as priority_name
+        FROM tasks t
+        LEFT JOIN categories c ON t.category_id = c.id
+        LEFT JOIN priority_levels p ON t.priority_id = p.id
+        ORDER BY t.created_at DESC
+    """,
+    'categories': "SELECT * FROM categories ORDER BY name"
+}
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'json': ('application/json', 'json')
+}
+
+
 @app.route('/api/export/<data_type>')
 def export_data(data_type):
-    """Export data (tasks, categories, etc.)"""
+    """Export data (tasks, categories) as a streamed CSV, NDJSON or JSON array download.
+
+    Rows are read from the cursor in batches and written out as they
+    arrive, so memory use does not depend on the number of rows.
+    """
     if not db_manager:
         return jsonify({'error': 'Database not available'}), 500
 
     try:
         format_type = request.args.get('format', 'json')
 
-        if data_type == 'tasks':
-            data = db_manager.fetch_all("""
-                SELECT t.*, c.name as category_name, p.name as priority_name
-                FROM tasks t
-                LEFT JOIN categories c ON t.category_id = c.id
-                LEFT JOIN priority_levels p ON t.priority_id = p.id
-                ORDER BY t.created_at DESC
-            """)
-        elif data_type == 'categories':
-            data = db_manager.fetch_all("SELECT * FROM categories ORDER BY name")
-        else:
+        if data_type not in EXPORT_QUERIES:
             return jsonify({'error': 'Invalid data type'}), 400
+        if format_type not in EXPORT_FORMATS:
+            return jsonify({'error': 'Invalid format'}), 400
 
-        if format_type == 'csv':
-            # Convert to CSV
-            if data:
-                import io
-                import csv
-                output = io.StringIO()
-                writer = csv.DictWriter(output, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-                csv_content = output.getvalue()
-                output.close()
+        mimetype, extension = EXPORT_FORMATS[format_type]
+        rows = db_manager.iter_rows(EXPORT_QUERIES[data_type])
+        filename = f'{data_type}_{date.today().isoformat()}.{extension}'
 
-                return jsonify({
-                    'success': True,
-                    'csv': csv_content
-                })
-            else:
-                return jsonify({
-                    'success': True,
-                    'csv': ''
-                })
-        else:
-            return jsonify({
-                'success': True,
-                'data': data
-            })
+        return Response(stream_rows(rows, format_type), mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename={filename}'
+        })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/notifications/check', methods=['GET'])
-def check_notifications():
-    """Check for pending notifications (due tasks, overdue tasks, etc.)"""
-    if not db_manager:
-        return jsonify({'error': 'Database not available'}), 500
+# Bulk import settings
+IMPORT_CHUNK_SIZE = 1000  # Rows per executemany transaction (and per progress event)
+IMPORT_MAX_ERRORS = 1000  # Row errors listed in the result; further ones are only counted
+IMPORT_STATUSES = ('pending', 'in_progress', 'completed', 'cancelled')
+IMPORT_COLUMNS = [
+    'title', 'description', 'category_id', 'priority_id', 'due_date', 'due_time',
+    'estimated_duration', 'actual_duration', 'status', 'is_recurring', 'recurrence_pattern',
+    'recurrence_interval', 'recurrence_end_date', 'completed_at', 'created_at', 'updated_at'
+]
+TIME_PATTERN = re.compile(r'^\d{1,2}:\d{2}(:\d{2})?$')
+JSON_WHITESPACE = re.compile(r'[\s,]*')
+
+
+def iter_json_array(text, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the items of a JSON array read incrementally from a text stream.
+
+    A top-level object is read whole and its ``tasks`` (or ``data``) list used.
+    """
+    decoder = json.JSONDecoder()
+    buffer = text.read(chunk_size).lstrip()
+
+    if buffer.startswith('{'):
+        data = json.loads(buffer + text.read())
+        yield from data.get('tasks') or data.get('data') or []
+        return
+    if not buffer.startswith('['):
+        raise ValueError('Expected a JSON array of tasks')
+
+    position = 1
+    while True:
+        position = JSON_WHITESPACE.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == ']':
+            return
 
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            chunk = text.read(chunk_size)
+            if not chunk:
+                raise ValueError('Invalid or truncated JSON array')
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        yield item
+        position = end
+
+
+def iter_import_records(stream, format_type):
+    """Yield ``(row_number, record)`` from an uploaded CSV, NDJSON or JSON stream.
+
+    A record that cannot be parsed is yielded as the ValueError describing it.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    if format_type == 'csv':
+        import csv
+        for number, record in enumerate(csv.DictReader(text), 1):
+            yield number, record
+    elif format_type == 'ndjson':
+        number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, ValueError(f"Invalid JSON: {e}")
+    else:
+        for number, record in enumerate(iter_json_array(text), 1):
+            yield number, record
+
+
+class ImportLookups:
+    """Category and priority IDs by name, loaded once per import.
+
+    Unknown category names are created on first use; unknown priorities are
+    row errors.
+    """
+
+    def __init__(self):
+        categories = db_manager.fetch_all("SELECT id, name FROM categories")
+        priorities = db_manager.fetch_all("SELECT id, name, level FROM priority_levels")
+
+        self.category_ids = {row['id'] for row in categories}
+        self.categories = {row['name'].strip().lower(): row['id'] for row in categories if row['name']}
+        self.priority_ids = {row['id'] for row in priorities}
+        self.priorities = {row['name'].strip().lower(): row['id'] for row in priorities if row['name']}
+        self.created_categories = 0
+
+    def get_category_id(self, record):
+        category_id = get_import_value(record, 'category_id')
+        if category_id is not None:
+            category_id = parse_import_int(category_id, 'category_id')
+            if category_id not in self.category_ids:
+                raise ValueError(f"Unknown category_id {category_id}")
+            return category_id
+
+        name = get_import_value(record, 'category_name', 'category')
+        if name is None:
+            return None
+
+        key = str(name).lower()
+        if key not in self.categories:
+            placeholder = '%s' if db_manager.db_type == 'mysql' else '?'
+            category_id = db_manager.execute_query(
+                "INSERT INTO categories (name, description, color) VALUES ({p}, {p}, {p})".format(p=placeholder),
+                (str(name), '', '#3498db')
+            )
+            if not category_id:
+                raise ValueError(f"Could not create category '{name}'")
+            self.categories[key] = category_id
+            self.category_ids.add(category_id)
+            self.created_categories += 1
+        return self.categories[key]
+
+    def get_priority_id(self, record):
+        priority_id = get_import_value(record, 'priority_id')
+        if priority_id is not None:
+            priority_id = parse_import_int(priority_id, 'priority_id')
+            if priority_id not in self.priority_ids:
+                raise ValueError(f"Unknown priority_id {priority_id}")
+            return priority_id
+
+        name = get_import_value(record, 'priority_name', 'priority')
+        if name is None:
+            return 2  # Medium, like create_task
+        if str(name).lower() not in self.priorities:
+            raise ValueError(f"Unknown priority '{name}'")
+        return self.priorities[str(name).lower()]
+
+
+def get_import_value(record, *names):
+    """First non-empty value of ``names`` in a record, with strings stripped"""
+    for name in names:
+        value = record.get(name)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def parse_import_int(value, name):
     try:
-        notifications = []
-        now = datetime.now()
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a whole number")
+
+
+def parse_import_date(value, name):
+    try:
+        return date.fromisoformat(str(value)[:10]).isoformat()
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+
+def build_import_row(record, lookups, now):
+    """Validate one import record and turn it into an INSERT parameter tuple"""
+    if not isinstance(record, dict):
+        raise ValueError("Row is not an object")
+
+    title = get_import_value(record, 'title')
+    if title is None:
+        raise ValueError("title is required")
+    title = str(title)
+    if len(title) > 255:
+        raise ValueError("title is longer than 255 characters")
+
+    status = get_import_value(record, 'status') or 'pending'
+    if status not in IMPORT_STATUSES:
+        raise ValueError(f"Unknown status '{status}'")
+
+    due_time = get_import_value(record, 'due_time')
+    if due_time is not None and not TIME_PATTERN.match(str(due_time)):
+        raise ValueError("due_time must be HH:MM or HH:MM:SS")
+
+    is_recurring = get_import_value(record, 'is_recurring')
+    is_recurring = str(is_recurring).lower() in ('1', 'true', 'yes') if is_recurring is not None else False
+
+    values = {
+        'title': title,
+        'description': get_import_value(record, 'description') or '',
+        'category_id': lookups.get_category_id(record),
+        'priority_id': lookups.get_priority_id(record),
+        'due_date': None,
+        'due_time': str(due_time) if due_time is not None else None,
+        'estimated_duration': None,
+        'actual_duration': None,
+        'status': status,
+        'is_recurring': is_recurring,
+        'recurrence_pattern': get_import_value(record, 'recurrence_pattern'),
+        'recurrence_interval': None,
+        'recurrence_end_date': None,
+        'completed_at': get_import_value(record, 'completed_at'),
+        'created_at': get_import_value(record, 'created_at') or now,
+        'updated_at': now
+    }
+
+    for name in ('due_date', 'recurrence_end_date'):
+        value = get_import_value(record, name)
+        if value is not None:
+            values[name] = parse_import_date(value, name)
+    for name in ('estimated_duration', 'actual_duration', 'recurrence_interval'):
+        value = get_import_value(record, name)
+        if value is not None:
+            values[name] = parse_import_int(value, name)
+
+    return tuple(values[column] for column in IMPORT_COLUMNS)
+
+
+def get_import_format(upload):
+    """Upload format from ?format=, the file name or the content type"""
+    format_type = request.args.get('format')
+    if format_type:
+        return format_type.lower()
+
+    filename = (upload.filename or '') if upload else ''
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    if extension in ('csv', 'ndjson', 'json'):
+        return extension
+    if extension == 'jsonl':
+        return 'ndjson'
+
+    mimetype = upload.mimetype if upload else request.mimetype
+    if mimetype in ('text/csv', 'application/csv'):
+        return 'csv'
+    if mimetype in ('application/x-ndjson', 'application/jsonl'):
+        return 'ndjson'
+    return 'json'
+
+
+@app.route('/api/import', methods=['POST'])
+def import_data():
+    """Bulk import tasks from a CSV, NDJSON or JSON upload.
+
+    The upload (multipart ``file`` field or the raw request body) is parsed as
+    a stream, validated row by row and inserted in executemany transactions
+    of IMPORT_CHUNK_SIZE rows.  The response is NDJSON: one ``progress`` line
+    per chunk and a final ``result`` line with the counts and row errors.
+    """
+    if not db_manager:
+        return jsonify({'success': False, 'error': 'Database not available'}), 500
+
+    upload = request.files.get('file')
+    format_type = get_import_format(upload)
+    if format_type not in ('csv', 'ndjson', 'json'):
+        return jsonify({'success': False, 'error': 'Invalid format'}), 400
+
+    if upload:
+        # The request closes its uploaded files once the view returns, before
+        # the response is streamed, so parse from a copy the generator owns
+        import tempfile
+        stream = tempfile.TemporaryFile()
+        upload.save(stream)
+        stream.seek(0)
+    else:
+        stream = request.stream
+    columns = ', '.join(IMPORT_COLUMNS)
+    placeholder = '%s' if db_manager.db_type == 'mysql' else '?'
+    insert_query = f"INSERT INTO tasks ({columns}) VALUES ({', '.join(placeholder for _ in IMPORT_COLUMNS)})"
+
+    def generate():
+        started = time.perf_counter()
+        processed = imported = error_count = 0
+        errors = []
+        chunk = []
+
+        def add_error(number, message):
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append({'row': number, 'error': message})
+
+        def flush():
+            nonlocal imported
+            if db_manager.execute_many(insert_query, [row for _, row in chunk]) is not None:
+                imported += len(chunk)
+            else:
+                # Find the offending rows one by one
+                for number, row in chunk:
+                    if db_manager.execute_query(insert_query, row):
+                        imported += 1
+                    else:
+                        add_error(number, 'Database rejected the row')
+            chunk.clear()
+
+        def progress(event_type):
+            return json.dumps({
+                'type': event_type,
+                'processed': processed,
+                'imported': imported,
+                'error_count': error_count,
+                'elapsed': round(time.perf_counter() - started, 2)
+            }) + '\n'
 
-        # Get user's reminder setting (default 15 minutes)
-        reminder_minutes = 15
         try:
-            setting = db_manager.fetch_one(
-                "SELECT setting_value FROM user_settings WHERE user_id = 1 AND setting_key = 'reminder_minutes'"
-            )
-            if setting:
-                reminder_minutes = int(setting['setting_value'])
-        except:
-            pass
+            lookups = ImportLookups()
+            now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
-        # Check for tasks due soon
-        due_tasks = db_manager.fetch_all("""
-            SELECT t.*, c.name as category_name
-            FROM tasks t
-            LEFT JOIN categories c ON t.category_id = c.id
-            WHERE t.status != 'completed'
-            AND t.due_date IS NOT NULL
-            AND datetime(t.due_date) BETWEEN datetime('now') AND datetime('now', '+{} minutes')
-        """.format(reminder_minutes))
-
-        for task in due_tasks:
-            notifications.append({
-                'type': 'task_due',
-                'title': '⏰ Task Due Soon',
-                'message': f'"{task["title"]}" is due in {reminder_minutes} minutes',
-                'task': task
+            for number, record in iter_import_records(stream, format_type):
+                processed += 1
+                try:
+                    if isinstance(record, ValueError):
+                        raise record
+                    chunk.append((number, build_import_row(record, lookups, now)))
+                except ValueError as e:
+                    add_error(number, str(e))
+
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    flush()
+                    yield progress('progress')
+
+            if chunk:
+                flush()
+
+            result = json.loads(progress('result'))
+            result.update({
+                'success': True,
+                'created_categories': lookups.created_categories,
+                'errors': errors
             })
+        except Exception as e:
+            # Keep the valid rows read before the upload broke off
+            if chunk:
+                flush()
+            result = json.loads(progress('result'))
+            result.update({'success': False, 'error': str(e), 'errors': errors})
+        finally:
+            if upload:
+                stream.close()
+
+        yield json.dumps(result) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+# Reminder scheduler settings
+REMINDER_CHECK_INTERVAL = 30  # Longest sleep between clock checks (seconds)
+REMINDER_EVENT_BUFFER = 500  # Events kept for clients resuming from a Last-Event-ID
+REMINDER_REPLAY_WINDOW = 10 * 60  # Recently fired events are resent on resume (seconds)
+SSE_KEEPALIVE_INTERVAL = 15
+LONG_POLL_MAX_WAIT = 30
+
+# Hold notification requests open (endless SSE stream, long-poll) only on
+# servers that do not tie up a worker per open request, e.g. the threaded dev
+# server or gunicorn with threaded/gevent workers.  Otherwise clients poll
+# every NOTIFICATION_POLL_INTERVAL seconds.  asgi_app.py always streams.
+NOTIFICATION_STREAMING = os.environ.get('NOTIFICATION_STREAMING', '').lower() in ('1', 'true', 'yes')
+NOTIFICATION_POLL_INTERVAL = 60
+
+
+class ReminderScheduler:
+    """Server-side scheduler behind the notification event stream.
+
+    One background thread keeps the open tasks that can produce a reminder in
+    memory, re-querying them through the due_date index only when tasks or
+    settings change or the day rolls over.  Each due-soon reminder fires once
+    per due time and each overdue notice once per day, into a bounded buffer.
+    Clients read that buffer from their last event ID, so the database work
+    does not grow with the number of open tabs.
+
+    Event IDs are derived from the task and its due time (or day), so every
+    server process gives the same reminder the same ID and clients can drop
+    events they have already shown after reconnecting to another process.
+    """
+
+    def __init__(self):
+        self.events = deque(maxlen=REMINDER_EVENT_BUFFER)  # (monotonic time fired, event)
+        self.candidates = []
+        self.fired = set()
+        self.reminder_minutes = 15
+        self.loaded_state = None
+        self._condition = threading.Condition(threading.RLock())
+        self._thread = None
+        self._wake = threading.Event()
+        self.listeners = []
+        data_versions.add_listener(self._on_data_changed)
+
+    def add_listener(self, callback):
+        """Call ``callback()`` on the scheduler thread after new events are published"""
+        self.listeners.append(callback)
+
+    def start(self):
+        """Start the scheduler thread if it is not running yet"""
+        with self._condition:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='reminder-scheduler', daemon=True)
+            self._thread.start()
+
+    def _on_data_changed(self, tables):
+        """Re-check right away when tasks or settings are written"""
+        if tables is None or 'tasks' in tables or 'user_settings' in tables:
+            self._wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Error in reminder scheduler: {e}")
+            self._wake.wait(self._seconds_until_next_check())
+            self._wake.clear()
+
+    def _seconds_until_next_check(self):
+        """Sleep until the next reminder falls due, at most REMINDER_CHECK_INTERVAL"""
+        now = datetime.now()
+        window = timedelta(minutes=self.reminder_minutes)
+        delay = REMINDER_CHECK_INTERVAL
+        for task, due_at in self.candidates:
+            for fire_at in (due_at - window, due_at):
+                if fire_at > now:
+                    delay = min(delay, (fire_at - now).total_seconds())
+        return max(delay, 1)
+
+    def check(self, now=None):
+        """Publish the reminders that have fallen due since the last check"""
+        if not db_manager:
+            return
+
+        now = now or datetime.now()
+        state = (data_versions.get(('tasks', 'user_settings')), db_manager.get_change_signature(), now.date())
+        if state != self.loaded_state:
+            self._load_candidates(now)
+            self.loaded_state = state
+
+        window = timedelta(minutes=self.reminder_minutes)
+        new_events = []
+        for task, due_at in self.candidates:
+            if due_at <= now:
+                key = ('task_overdue', task['id'], now.date())
+                if key not in self.fired:
+                    self.fired.add(key)
+                    new_events.append({
+                        'id': f"task_overdue-{task['id']}-{now.date():%Y%m%d}",
+                        'type': 'task_overdue',
+                        'title': '⚠️ Task Overdue',
+                        'message': f'"{task["title"]}" is overdue!',
+                        'task': task
+                    })
+            elif task.get('due_time') and due_at - now <= window:
+                key = ('task_due', task['id'], due_at)
+                if key not in self.fired:
+                    self.fired.add(key)
+                    minutes = max(1, round((due_at - now).total_seconds() / 60))
+                    new_events.append({
+                        'id': f"task_due-{task['id']}-{due_at:%Y%m%dT%H%M%S}",
+                        'type': 'task_due',
+                        'title': '⏰ Task Due Soon',
+                        'message': f'"{task["title"]}" is due in {minutes} minutes',
+                        'task': task
+                    })
+
+        if new_events:
+            self._publish(new_events)
+
+    def _load_candidates(self, now):
+        """Reload the unfinished tasks due before the end of the reminder window"""
+        try:
+            self.reminder_minutes = int(settings_cache.get().get('reminder_minutes', 15))
+        except (TypeError, ValueError):
+            self.reminder_minutes = 15
 
-        # Check for overdue tasks
-        overdue_tasks = db_manager.fetch_all("""
+        horizon = (now + timedelta(minutes=self.reminder_minutes)).date()
+        tasks = db_manager.fetch_all("""
             SELECT t.*, c.name as category_name
             FROM tasks t
             LEFT JOIN categories c ON t.category_id = c.id
-            WHERE t.status != 'completed'
-            AND t.due_date IS NOT NULL
-            AND datetime(t.due_date) < datetime('now')
-        """)
+            WHERE t.due_date IS NOT NULL
+            AND t.due_date <= ?
+            AND t.status != 'completed'
+        """, (horizon.isoformat(),))
 
-        for task in overdue_tasks:
-            notifications.append({
-                'type': 'task_overdue',
-                'title': '⚠️ Task Overdue',
-                'message': f'"{task["title"]}" is overdue!',
-                'task': task
-            })
+        candidates = []
+        for task in tasks:
+            due_at = self._get_due_at(task)
+            if due_at:
+                candidates.append((task, due_at))
+        self.candidates = candidates
+
+        # Forget fired reminders of tasks that were completed or removed
+        task_ids = {task['id'] for task, _ in candidates}
+        self.fired = {key for key in self.fired if key[1] in task_ids}
+
+    def _get_due_at(self, task):
+        """When a task is due; tasks without a time are due at the end of their day"""
+        try:
+            due_date = task['due_date']
+            if isinstance(due_date, str):
+                due_date = date.fromisoformat(due_date[:10])
+
+            due_time = task.get('due_time')
+            if not due_time:
+                return datetime.combine(due_date + timedelta(days=1), datetime.min.time())
+            if isinstance(due_time, timedelta):
+                return datetime.combine(due_date, datetime.min.time()) + due_time
+            parts = [int(part) for part in str(due_time).split(':')[:3]]
+            while len(parts) < 3:
+                parts.append(0)
+            return datetime.combine(due_date, datetime.min.time()) + timedelta(hours=parts[0], minutes=parts[1], seconds=parts[2])
+        except (TypeError, ValueError):
+            return None
+
+    def _publish(self, events):
+        fired_at = time.monotonic()
+        with self._condition:
+            for event in events:
+                event['created_at'] = datetime.now().isoformat()
+                self.events.append((fired_at, event))
+            self._condition.notify_all()
+
+        for callback in list(self.listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in reminder listener: {e}")
+
+    def get_events(self, last_event_id=None, exclude=(), replay=True):
+        """Buffered events for a client that has seen up to ``last_event_id``.
+
+        Without an ID the whole buffer is returned.  Otherwise these are the
+        events after it, plus (with ``replay``) the ones fired in the last
+        REMINDER_REPLAY_WINDOW seconds, since another process may have
+        buffered them in a different order; clients drop the IDs they have
+        already shown.  Events whose ID is in ``exclude`` are left out.
+        """
+        with self._condition:
+            buffered = list(self.events)
+
+        ids = [event['id'] for _, event in buffered]
+        if not last_event_id:
+            start = 0
+        elif last_event_id in ids:
+            start = len(ids) - ids[::-1].index(last_event_id)
+        else:
+            start = len(buffered)
+
+        replay_after = time.monotonic() - REMINDER_REPLAY_WINDOW if replay else float('inf')
+        return [event for index, (fired_at, event) in enumerate(buffered)
+                if (index >= start or fired_at >= replay_after) and event['id'] not in exclude]
+
+    def wait_for_events(self, last_event_id=None, timeout=SSE_KEEPALIVE_INTERVAL, exclude=()):
+        """Like get_events, but wait up to ``timeout`` seconds for an event after ``last_event_id``"""
+        with self._condition:
+            if not self.get_events(last_event_id, exclude, replay=False):
+                self._condition.wait(timeout)
+            return self.get_events(last_event_id, exclude)
+
+
+def format_sse_event(event):
+    """One notification as a Server-Sent Events message"""
+    return f"id: {event['id']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+# Global reminder scheduler instance
+reminder_scheduler = ReminderScheduler()
+
+
+@app.route('/api/notifications/stream', methods=['GET'])
+def notification_stream():
+    """Server-Sent Events stream of reminder and overdue notifications.
+
+    Resumes after the ``Last-Event-ID`` header (sent by EventSource on
+    reconnect) or the ``last_event_id`` parameter.  Without
+    NOTIFICATION_STREAMING the response ends after the pending events and
+    EventSource reconnects after NOTIFICATION_POLL_INTERVAL seconds, so no
+    worker is held by an open page.
+    """
+    if not db_manager:
+        return jsonify({'error': 'Database not available'}), 500
+
+    reminder_scheduler.start()
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+
+    def generate_once(last_event_id):
+        yield f"retry: {NOTIFICATION_POLL_INTERVAL * 1000}\n\n"
+        for event in reminder_scheduler.get_events(last_event_id):
+            yield format_sse_event(event)
+
+    def generate(last_event_id):
+        yield "retry: 5000\n\n"
+        sent = set()
+        while True:
+            events = reminder_scheduler.wait_for_events(last_event_id, SSE_KEEPALIVE_INTERVAL, sent)
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            for event in events:
+                last_event_id = event['id']
+                sent.add(event['id'])
+                yield format_sse_event(event)
+
+    stream = generate(last_event_id) if NOTIFICATION_STREAMING else generate_once(last_event_id)
+    return Response(stream, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@app.route('/api/notifications/check', methods=['GET'])
+def check_notifications():
+    """Long-poll fallback of the notification stream.
+
+    Returns the events after ``last_event_id``, waiting up to ``wait``
+    seconds for one to arrive when NOTIFICATION_STREAMING allows holding the
+    request.  ``next_poll`` tells the client how long to wait before asking
+    again.
+    """
+    if not db_manager:
+        return jsonify({'error': 'Database not available'}), 500
+
+    try:
+        reminder_scheduler.start()
+        last_event_id = request.args.get('last_event_id')
+        wait = min(max(request.args.get('wait', 0, type=float), 0), LONG_POLL_MAX_WAIT)
+        if not NOTIFICATION_STREAMING:
+            wait = 0
+
+        if wait:
+            notifications = reminder_scheduler.wait_for_events(last_event_id, wait)
+        else:
+            notifications = reminder_scheduler.get_events(last_event_id)
 
         return jsonify({
             'success': True,
             'notifications': notifications,
-            'count': len(notifications)
+            'count': len(notifications),
+            'last_event_id': notifications[-1]['id'] if notifications else last_event_id,
+            'next_poll': 0 if NOTIFICATION_STREAMING else NOTIFICATION_POLL_INTERVAL
         })
 
     except Exception as e:
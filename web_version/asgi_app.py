@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Task Planner Web Application - ASGI Version
+Serves app.py from an event loop so idle and slow connections do not each hold a thread
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+
+from werkzeug.http import parse_etags
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as web_app
+
+ASGI_THREADS = int(os.environ.get('ASGI_THREADS', web_app.DB_POOL_SIZE))
+REQUEST_BODY_SPOOL_SIZE = 1024 * 1024  # Request bodies above this are spooled to disk
+
+
+class AsyncSQLitePool:
+    """Bounded pool of aiosqlite connections for the endpoints served on the event loop.
+
+    Each aiosqlite connection runs its queries on its own worker thread, so
+    the number of database threads is capped by the pool size however many
+    clients are connected.  Connections use the same pragmas as the
+    synchronous pool.
+    """
+
+    def __init__(self, db_path, max_size=web_app.DB_POOL_SIZE, timeout=web_app.DB_POOL_TIMEOUT):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.created = 0
+        self._idle = asyncio.LifoQueue()
+
+    async def _create_connection(self):
+        import aiosqlite
+
+        connection = await aiosqlite.connect(self.db_path, timeout=self.timeout)
+        connection.row_factory = aiosqlite.Row
+        await connection.execute("PRAGMA foreign_keys = ON")
+        await connection.execute("PRAGMA journal_mode = WAL")
+        await connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    async def acquire(self):
+        """Check out an idle connection, opening one while below max_size"""
+        if self._idle.empty() and self.created < self.max_size:
+            self.created += 1
+            try:
+                return await self._create_connection()
+            except Exception:
+                self.created -= 1
+                raise
+
+        try:
+            return await asyncio.wait_for(self._idle.get(), self.timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Timed out waiting for a database connection")
+
+    async def release(self, connection):
+        """Return a connection, rolling back anything left uncommitted"""
+        if connection.in_transaction:
+            await connection.rollback()
+        self._idle.put_nowait(connection)
+
+    async def fetch_all(self, query, params=None):
+        """Fetch all results from query"""
+        try:
+            connection = await self.acquire()
+            try:
+                async with connection.execute(query, params or ()) as cursor:
+                    return [dict(row) for row in await cursor.fetchall()]
+            finally:
+                await self.release(connection)
+        except Exception as e:
+            print(f"Async fetch all error: {e}")
+            return []
+
+    async def close(self):
+        """Close the idle connections"""
+        while not self._idle.empty():
+            connection = self._idle.get_nowait()
+            self.created -= 1
+            await connection.close()
+
+
+class AsyncMySQLPool:
+    """aiomysql connection pool with the settings of a MySQLDatabaseManager"""
+
+    def __init__(self, manager, max_size=web_app.DB_POOL_SIZE):
+        self.manager = manager
+        self.max_size = max_size
+        self.pool = None
+
+    async def _get_pool(self):
+        if self.pool is None:
+            import aiomysql
+
+            self.pool = await aiomysql.create_pool(
+                host=self.manager.host,
+                port=self.manager.port,
+                db=self.manager.database,
+                user=self.manager.username,
+                password=self.manager.password,
+                minsize=1,
+                maxsize=self.max_size,
+                autocommit=True
+            )
+        return self.pool
+
+    async def fetch_all(self, query, params=None):
+        """Fetch all results from query"""
+        import aiomysql
+
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as connection:
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params)
+                    return list(await cursor.fetchall())
+        except Exception as e:
+            print(f"Async MySQL fetch all error: {e}")
+            return []
+
+    async def close(self):
+        """Close the pooled connections"""
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+
+
+def create_async_pool(manager):
+    """Async pool for the database behind ``manager``; None if its driver is not installed"""
+    try:
+        if manager.db_type == 'mysql':
+            import aiomysql  # noqa: F401
+            return AsyncMySQLPool(manager)
+
+        import aiosqlite  # noqa: F401
+        return AsyncSQLitePool(manager.db_path)
+    except ImportError as e:
+        print(f"Warning: Async database driver not available ({e}); using the thread pool")
+        return None
+
+
+class NotificationHub:
+    """Wakes the event-loop subscribers of the reminder scheduler.
+
+    The scheduler publishes on its own thread.  Each publish swaps in a new
+    asyncio.Event on the loop and sets the old one, which wakes every waiting
+    stream and long-poll at once without a thread per subscriber.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.event = asyncio.Event()
+        web_app.reminder_scheduler.add_listener(self._on_published)
+
+    def _on_published(self):
+        try:
+            self.loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def _wake(self):
+        event, self.event = self.event, asyncio.Event()
+        event.set()
+
+    async def wait_for_events(self, last_event_id, timeout, disconnected=None, exclude=()):
+        """Like ReminderScheduler.wait_for_events, waiting on the loop instead of a thread"""
+        scheduler = web_app.reminder_scheduler
+
+        # Taken before checking the buffer, so a publish in between still wakes us
+        event = self.event
+        if scheduler.get_events(last_event_id, exclude, replay=False):
+            return scheduler.get_events(last_event_id, exclude)
+
+        waiter = asyncio.ensure_future(event.wait())
+        waiters = [waiter] + ([disconnected] if disconnected else [])
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        return scheduler.get_events(last_event_id, exclude)
+
+    def close(self):
+        """Stop listening to the scheduler"""
+        if self._on_published in web_app.reminder_scheduler.listeners:
+            web_app.reminder_scheduler.listeners.remove(self._on_published)
+
+
+async def wait_for_disconnect(receive):
+    """Consume the rest of the request and return once the client goes away"""
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+class WSGIBridge:
+    """Runs the Flask app for ASGI requests on a bounded thread pool.
+
+    The request body is read on the event loop, into a spooled file, before
+    a worker thread is taken, so slow uploads do not hold one.  Response
+    chunks are handed back to the loop as they are produced, so streamed
+    exports and imports keep streaming, and a streamed response stops early
+    once its client disconnects.
+    """
+
+    def __init__(self, wsgi_app, max_threads=ASGI_THREADS):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='wsgi')
+
+    async def __call__(self, scope, receive, send):
+        body = tempfile.SpooledTemporaryFile(max_size=REQUEST_BODY_SPOOL_SIZE)
+        disconnected = None
+        try:
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                body.write(message.get('body', b''))
+                more_body = message.get('more_body', False)
+            body.seek(0)
+
+            disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.run, loop, scope, body, send, disconnected)
+        finally:
+            if disconnected:
+                disconnected.cancel()
+            body.close()
+
+    def run(self, loop, scope, body, send, disconnected):
+        """Run the WSGI app on a worker thread, sending its response through the loop"""
+        response_start = {}
+
+        def call_send(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def start_response(status, headers, exc_info=None):
+            response_start.update({
+                'type': 'http.response.start',
+                'status': int(status.split(' ', 1)[0]),
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+            })
+            return lambda data: call_send({'type': 'http.response.body', 'body': data, 'more_body': True})
+
+        result = self.wsgi_app(self.build_environ(scope, body), start_response)
+        started = False
+        try:
+            for chunk in result:
+                if disconnected.done():
+                    return
+                if not started:
+                    call_send(response_start)
+                    started = True
+                if chunk:
+                    call_send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        if not started:
+            call_send(response_start)
+        call_send({'type': 'http.response.body', 'body': b''})
+
+    def build_environ(self, scope, body):
+        """WSGI environ of an ASGI HTTP request"""
+        script_name = scope.get('root_path', '')
+        path_info = scope['path']
+        if script_name and path_info.startswith(script_name):
+            path_info = path_info[len(script_name):]
+        server = scope.get('server') or ('localhost', 80)
+
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': script_name.encode('utf-8').decode('latin-1'),
+            'PATH_INFO': path_info.encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope['query_string'].decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': body,
+            'wsgi.input_terminated': True,
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        if scope.get('client'):
+            environ['REMOTE_ADDR'] = scope['client'][0]
+
+        for name, value in scope['headers']:
+            name = name.decode('latin-1')
+            if name == 'content-length':
+                key = 'CONTENT_LENGTH'
+            elif name == 'content-type':
+                key = 'CONTENT_TYPE'
+            else:
+                key = 'HTTP_' + name.upper().replace('-', '_')
+            value = value.decode('latin-1')
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+    def close(self):
+        """Stop the worker threads once their requests finish"""
+        self.executor.shutdown(wait=False)
+
+
+class TaskPlannerASGI:
+    """ASGI application serving the Task Planner web app.
+
+    The notification stream and its long-poll fallback, and the cached
+    category and priority lists, are answered on the event loop, reading
+    through an aiosqlite/aiomysql pool.  Every other request runs its Flask
+    view through WSGIBridge, so the routes and JSON shapes stay those of
+    app.py.
+    """
+
+    def __init__(self, flask_app=None, max_threads=ASGI_THREADS):
+        self.flask_app = flask_app or web_app.app
+        self.bridge = WSGIBridge(self.flask_app, max_threads)
+        self.hub = None
+        self.db = None
+        self.db_manager = None
+        self.routes = {
+            '/api/notifications/stream': self.notification_stream,
+            '/api/notifications/check': self.check_notifications,
+            '/api/categories': self.get_categories,
+            '/api/priorities': self.get_priorities,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        handler = None
+        if scope['type'] == 'http' and scope['method'] == 'GET' and web_app.db_manager:
+            handler = self.routes.get(scope['path'])
+
+        if handler:
+            self.startup()
+            return await handler(scope, receive, send)
+        return await self.bridge(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    self.startup()
+                    await send({'type': 'lifespan.startup.complete'})
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def startup(self):
+        """Attach to the running event loop (once)"""
+        if self.hub:
+            return
+        self.hub = NotificationHub(asyncio.get_running_loop())
+        if web_app.db_manager:
+            web_app.reminder_scheduler.start()
+
+    async def shutdown(self):
+        if self.hub:
+            self.hub.close()
+            self.hub = None
+        if self.db:
+            await self.db.close()
+            self.db = None
+        self.bridge.close()
+
+    async def get_database(self):
+        """Async pool of the current database, recreated when the database is reconfigured"""
+        manager = web_app.db_manager
+        if manager is not self.db_manager:
+            if self.db:
+                await self.db.close()
+            self.db = create_async_pool(manager)
+            self.db_manager = manager
+        return self.db
+
+    # --- Responses ---
+
+    def get_headers(self, scope):
+        return {name.decode('latin-1'): value.decode('latin-1') for name, value in scope['headers']}
+
+    def get_args(self, scope):
+        return dict(parse_qsl(scope['query_string'].decode('latin-1')))
+
+    def get_response_headers(self, scope, content_type, extra=None):
+        headers = [(b'content-type', content_type.encode('latin-1'))]
+        if 'origin' in self.get_headers(scope):
+            headers.append((b'access-control-allow-origin', b'*'))
+        for name, value in (extra or {}).items():
+            headers.append((name.encode('latin-1'), value.encode('latin-1')))
+        return headers
+
+    async def send_json(self, scope, send, data, status=200):
+        """Send ``data`` serialized exactly as jsonify would"""
+        body = self.flask_app.json.response(data).get_data()
+        await self.send_body(scope, send, body, status, 'application/json')
+
+    async def send_body(self, scope, send, body, status, mimetype, extra_headers=None):
+        headers = self.get_response_headers(scope, mimetype, extra_headers)
+        headers.append((b'content-length', str(len(body)).encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    # --- Endpoints served on the event loop ---
+
+    async def cached_query(self, scope, receive, send, endpoint, tables, query, build):
+        """A cached_response GET endpoint answered from the shared response cache or the async pool"""
+        db = await self.get_database()
+        if db is None:
+            return await self.bridge(scope, receive, send)
+
+        # Same key and tag as the Flask view, so both modes share the cache and ETags
+        full_path = scope['path'] + '?' + scope['query_string'].decode('latin-1')
+        etag = web_app.get_response_etag(tables, full_path)
+        quoted_etag = f'"{etag}"'
+        extra_headers = {'etag': quoted_etag, 'cache-control': 'no-cache'}
+
+        if etag in parse_etags(self.get_headers(scope).get('if-none-match')):
+            headers = self.get_response_headers(scope, 'text/html; charset=utf-8', extra_headers)
+            await send({'type': 'http.response.start', 'status': 304, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        key = (endpoint, full_path)
+        cached = web_app.get_cached_body(key, etag)
+        if cached:
+            body, status, mimetype = cached
+        else:
+            rows = await db.fetch_all(query)
+            body = self.flask_app.json.response(build(rows)).get_data()
+            status, mimetype = 200, 'application/json'
+            web_app.store_cached_body(key, etag, body, status, mimetype)
+
+        await self.send_body(scope, send, body, status, mimetype, extra_headers)
+
+    async def get_categories(self, scope, receive, send):
+        """Get all categories (see app.get_categories)"""
+        await self.cached_query(scope, receive, send, 'get_categories', ('categories',),
+                                web_app.CATEGORIES_QUERY, lambda rows: {'success': True, 'categories': rows})
+
+    async def get_priorities(self, scope, receive, send):
+        """Get all priorities (see app.get_priorities)"""
+        await self.cached_query(scope, receive, send, 'get_priorities', ('priority_levels',),
+                                web_app.PRIORITIES_QUERY, lambda rows: {'priorities': rows})
+
+    async def notification_stream(self, scope, receive, send):
+        """Server-Sent Events stream of notifications (see app.notification_stream).
+
+        Each subscriber is a coroutine waiting on the hub, not a thread.
+        """
+        web_app.reminder_scheduler.start()
+        last_event_id = self.get_headers(scope).get('last-event-id') or self.get_args(scope).get('last_event_id')
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': self.get_response_headers(scope, 'text/event-stream; charset=utf-8', {
+                'cache-control': 'no-cache',
+                'x-accel-buffering': 'no'
+            })
+        })
+
+        disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+        sent = set()
+        try:
+            chunk = "retry: 5000\n\n"
+            while not disconnected.done():
+                await send({'type': 'http.response.body', 'body': chunk.encode('utf-8'), 'more_body': True})
+
+                events = await self.hub.wait_for_events(last_event_id, web_app.SSE_KEEPALIVE_INTERVAL,
+                                                        disconnected, sent)
+                if not events:
+                    chunk = ": keepalive\n\n"
+                    continue
+
+                chunk = ""
+                for event in events:
+                    last_event_id = event['id']
+                    sent.add(event['id'])
+                    chunk += web_app.format_sse_event(event)
+        except OSError:
+            pass  # Client went away mid-send
+        finally:
+            disconnected.cancel()
+
+    async def check_notifications(self, scope, receive, send):
+        """Long-poll fallback of the notification stream (see app.check_notifications)"""
+        disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+        try:
+            web_app.reminder_scheduler.start()
+            args = self.get_args(scope)
+            last_event_id = args.get('last_event_id')
+            try:
+                wait = float(args.get('wait', 0))
+            except ValueError:
+                wait = 0
+            wait = min(max(wait, 0), web_app.LONG_POLL_MAX_WAIT)
+
+            if wait:
+                notifications = await self.hub.wait_for_events(last_event_id, wait, disconnected)
+            else:
+                notifications = web_app.reminder_scheduler.get_events(last_event_id)
+
+            await self.send_json(scope, send, {
+                'success': True,
+                'notifications': notifications,
+                'count': len(notifications),
+                'last_event_id': notifications[-1]['id'] if notifications else last_event_id,
+                'next_poll': 0
+            })
+
+        except Exception as e:
+            await self.send_json(scope, send, {'error': str(e)}, 500)
+        finally:
+            disconnected.cancel()
+
+
+# Global ASGI application (e.g. ``uvicorn asgi_app:asgi_app``)
+asgi_app = TaskPlannerASGI()
+
+
+if __name__ == '__main__':
+    host = os.environ.get('HOST', '0.0.0.0')
+    port = int(os.environ.get('PORT', 5000))
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ uvicorn is not installed")
+        print("   Install it with: pip install uvicorn aiosqlite")
+        sys.exit(1)
+
+    print("🌐 Starting Task Planner Web Application (ASGI)...")
+    print(f"📍 Host: {host}")
+    print(f"🔌 Port: {port}")
+    print(f"🧵 Worker threads: {ASGI_THREADS}")
+    print(f"🗄️  Database: {web_app.db_manager.get_db_info()['type'] if web_app.db_manager else 'None'}")
+
+    uvicorn.run(asgi_app, host=host, port=port, log_level='info')
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Load test for Task Planner Web
+Measures API throughput as the number of concurrent client threads grows,
+for the threaded WSGI server and the ASGI server (asgi_app.py)
+"""
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PATHS = ['/api/tasks?limit=50', '/api/categories', '/api/priorities', '/api/settings']
+
+
+def run_clients(base_url, paths, threads, duration):
+    """Hit ``paths`` round-robin from ``threads`` clients; returns (requests, errors)"""
+    counts = [0] * threads
+    errors = [0] * threads
+    deadline = time.monotonic() + duration
+
+    def client(index):
+        n = index
+        while time.monotonic() < deadline:
+            url = base_url + paths[n % len(paths)]
+            n += 1
+            try:
+                with urllib.request.urlopen(url, timeout=30) as response:
+                    response.read()
+                counts[index] += 1
+            except Exception:
+                errors[index] += 1
+
+    workers = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return sum(counts), sum(errors)
+
+
+def open_idle_subscribers(base_url, count, path='/api/notifications/stream'):
+    """Open ``count`` event-stream connections that stay idle during the test"""
+    url = urllib.parse.urlsplit(base_url)
+    request = (f"GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\n"
+               "Accept: text/event-stream\r\n\r\n").encode('ascii')
+
+    subscribers = []
+    for _ in range(count):
+        connection = socket.create_connection((url.hostname, url.port or 80), timeout=30)
+        connection.sendall(request)
+        subscribers.append(connection)
+
+    # Wait until every stream has started, i.e. the server is holding it open
+    for connection in subscribers:
+        if not connection.recv(4096):
+            raise RuntimeError("Event stream closed by the server")
+    return subscribers
+
+
+def start_wsgi_server(host, port):
+    """Serve the app with a threaded WSGI server in the background; returns (port, stop)"""
+    from werkzeug.serving import make_server
+    import app as web_app
+
+    # A threaded server can hold idle subscribers open, as in a gthread deployment
+    web_app.NOTIFICATION_STREAMING = True
+
+    # Per-request access logging would dominate the measurement
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    server = make_server(host, port, web_app.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server.server_port, server.shutdown
+
+
+def start_asgi_server(host, port):
+    """Serve asgi_app with uvicorn in the background; returns (port, stop)"""
+    import uvicorn
+    from asgi_app import asgi_app
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+
+    config = uvicorn.Config(asgi_app, log_level='warning', timeout_graceful_shutdown=1)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, kwargs={'sockets': [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("ASGI server failed to start")
+        time.sleep(0.05)
+
+    def stop():
+        server.should_exit = True
+        thread.join(10)
+
+    return sock.getsockname()[1], stop
+
+
+SERVERS = {
+    'wsgi': start_wsgi_server,
+    'asgi': start_asgi_server,
+}
+
+
+def run_mode(mode, base_url, paths, thread_counts, duration, idle):
+    """Run every thread count against one server; returns {threads: req/s}"""
+    stop = None
+    if not base_url:
+        port, stop = SERVERS[mode]('127.0.0.1', 0)
+        base_url = f"http://127.0.0.1:{port}"
+
+    results = {}
+    subscribers = []
+    try:
+        # Threads the in-process server starts to hold the idle subscribers
+        threads_before = threading.active_count()
+        if idle:
+            subscribers = open_idle_subscribers(base_url, idle)
+        idle_threads = threading.active_count() - threads_before
+
+        print(f"\n🔥 Load testing {base_url} ({mode}) for {duration:.0f}s per step")
+        if idle:
+            note = f", holding them took {idle_threads} server threads" if stop else ""
+            print(f"   {idle} idle event-stream subscribers open{note}")
+        print(f"{'threads':>8} {'requests':>9} {'errors':>7} {'req/s':>9} {'scaling':>8}")
+
+        baseline = None
+        for threads in thread_counts:
+            total, errors = run_clients(base_url, paths, threads, duration)
+            throughput = total / duration
+            if baseline is None:
+                baseline = throughput / threads if threads else throughput
+            scaling = throughput / baseline if baseline else 0
+            print(f"{threads:>8} {total:>9} {errors:>7} {throughput:>9.1f} {scaling:>7.2f}x")
+            results[threads] = throughput
+    finally:
+        for connection in subscribers:
+            connection.close()
+        if stop:
+            stop()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task Planner Web load test")
+    parser.add_argument('--url', help="Test a running server (e.g. http://localhost:5000) instead of starting one")
+    parser.add_argument('--mode', choices=['wsgi', 'asgi', 'both'], default='wsgi',
+                        help="Server to start: threaded WSGI, ASGI (uvicorn) or both in turn")
+    parser.add_argument('--threads', default='1,2,4,8,16', help="Comma separated client thread counts")
+    parser.add_argument('--duration', type=float, default=5.0, help="Seconds per thread count")
+    parser.add_argument('--idle', type=int, default=0, help="Idle event-stream subscribers held open during the test")
+    parser.add_argument('--path', action='append', help="Request path (repeatable)")
+    args = parser.parse_args()
+
+    paths = args.path or DEFAULT_PATHS
+    thread_counts = [int(value) for value in args.threads.split(',') if value.strip()]
+    modes = ['wsgi', 'asgi'] if args.mode == 'both' else [args.mode]
+    if args.url and len(modes) > 1:
+        parser.error("--mode both starts its own servers and cannot be combined with --url")
+
+    results = {}
+    for mode in modes:
+        results[mode] = run_mode(mode, args.url, paths, thread_counts, args.duration, args.idle)
+
+    if len(modes) > 1:
+        print(f"\n{'threads':>8} {'wsgi req/s':>11} {'asgi req/s':>11} {'asgi/wsgi':>10}")
+        for threads in thread_counts:
+            wsgi, asgi = results['wsgi'][threads], results['asgi'][threads]
+            ratio = asgi / wsgi if wsgi else 0
+            print(f"{threads:>8} {wsgi:>11.1f} {asgi:>11.1f} {ratio:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
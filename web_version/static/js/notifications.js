@@ -7,8 +7,10 @@ class WebNotificationManager {
     constructor() {
         this.permission = 'default';
         this.settings = this.loadSettings();
-        this.checkInterval = null;
-        this.lastCheck = new Date();
+        this.eventSource = null;
+        this.pollController = null;
+        this.lastEventId = localStorage.getItem('taskPlannerLastEventId');
+        this.seenEventIds = this.loadSeenEventIds();
         this.audioContext = null;
         this.init();
     }
@@ -226,40 +228,111 @@ class WebNotificationManager {
     }
 
     startNotificationMonitoring() {
-        if (this.checkInterval) {
-            clearInterval(this.checkInterval);
+        this.stopNotificationMonitoring();
+
+        if (!window.EventSource) {
+            this.startLongPolling();
+            return;
         }
 
-        const intervalMs = this.settings.notificationCheckInterval * 1000;
-        
-        this.checkInterval = setInterval(() => {
-            this.checkForNotifications();
-        }, intervalMs);
+        // The server pushes reminders (or, when it cannot hold requests open,
+        // ends the response and sets the reconnect delay); EventSource
+        // reconnects by itself and resumes via the Last-Event-ID header
+        const query = this.lastEventId ? `?last_event_id=${encodeURIComponent(this.lastEventId)}` : '';
+        this.eventSource = new EventSource('/api/notifications/stream' + query);
+
+        this.eventSource.onmessage = (event) => {
+            try {
+                const notification = JSON.parse(event.data);
+                if (this.rememberEventId(event.lastEventId || notification.id)) {
+                    this.processNotification(notification);
+                }
+            } catch (error) {
+                console.error('Error handling notification event:', error);
+            }
+        };
 
-        // Initial check
-        this.checkForNotifications();
+        this.eventSource.onerror = () => {
+            console.warn('Notification stream interrupted, reconnecting...');
+        };
     }
 
     stopNotificationMonitoring() {
-        if (this.checkInterval) {
-            clearInterval(this.checkInterval);
-            this.checkInterval = null;
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+        if (this.pollController) {
+            this.pollController.abort();
+            this.pollController = null;
         }
     }
 
-    async checkForNotifications() {
-        try {
-            const response = await fetch('/api/notifications/check');
-            const data = await response.json();
+    // Long-poll fallback for browsers without EventSource
+    async startLongPolling() {
+        const controller = new AbortController();
+        this.pollController = controller;
+
+        while (!controller.signal.aborted) {
+            try {
+                const query = this.lastEventId ? `&last_event_id=${encodeURIComponent(this.lastEventId)}` : '';
+                const response = await fetch(`/api/notifications/check?wait=25${query}`, { signal: controller.signal });
+                const data = await response.json();
+
+                if (data.success && data.notifications) {
+                    data.notifications.forEach(notification => {
+                        if (this.rememberEventId(notification.id)) {
+                            this.processNotification(notification);
+                        }
+                    });
+                }
 
-            if (data.success && data.notifications) {
-                data.notifications.forEach(notification => {
-                    this.processNotification(notification);
-                });
+                // The server answers right away when it cannot hold the request open
+                if (data.next_poll) {
+                    const seconds = this.settings.notificationCheckInterval || data.next_poll;
+                    await new Promise(resolve => setTimeout(resolve, seconds * 1000));
+                }
+            } catch (error) {
+                if (controller.signal.aborted) {
+                    return;
+                }
+                console.error('Error checking for notifications:', error);
+                await new Promise(resolve => setTimeout(resolve, 5000));
             }
+        }
+    }
+
+    loadSeenEventIds() {
+        try {
+            return JSON.parse(localStorage.getItem('taskPlannerSeenEventIds')) || [];
+        } catch (error) {
+            return [];
+        }
+    }
+
+    // Shared by all tabs so a new page resumes instead of replaying old events.
+    // Event IDs are the same on every server process, so events resent after
+    // a reconnect are recognised; returns false for an event already shown.
+    rememberEventId(eventId) {
+        if (!eventId) {
+            return true;
+        }
+
+        this.seenEventIds = this.loadSeenEventIds();
+        if (this.seenEventIds.includes(eventId)) {
+            return false;
+        }
+
+        this.seenEventIds.push(eventId);
+        this.seenEventIds = this.seenEventIds.slice(-500);
+        this.lastEventId = eventId;
+        try {
+            localStorage.setItem('taskPlannerSeenEventIds', JSON.stringify(this.seenEventIds));
+            localStorage.setItem('taskPlannerLastEventId', eventId);
         } catch (error) {
-            console.error('Error checking for notifications:', error);
+            console.warn('Could not store last notification event ID:', error);
         }
+        return true;
     }
 
     processNotification(notification) {
@@ -270,7 +343,7 @@ class WebNotificationManager {
                 if (this.settings.taskDueNotifications) {
                     this.showNotification(
                         '⏰ Task Due Soon',
-                        `"${task.title}" is due in ${this.settings.reminderMinutes} minutes`,
+                        message || `"${task.title}" is due in ${this.settings.reminderMinutes} minutes`,
                         {
                             tag: `task-due-${task.id}`,
                             requireInteraction: true,
@@ -346,11 +419,6 @@ class WebNotificationManager {
 
     updateSettings(newSettings) {
         this.settings = { ...this.settings, ...newSettings };
-        
-        // Restart monitoring with new interval if changed
-        if (newSettings.notificationCheckInterval) {
-            this.startNotificationMonitoring();
-        }
     }
 
     // Public methods for manual notifications
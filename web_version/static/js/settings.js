@@ -469,24 +469,19 @@ class SettingsManager {
         }
     }
 
-    async exportDatabase() {
-        try {
-            const response = await fetch('/api/database/export');
-            const blob = await response.blob();
-
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `task_planner_backup_${new Date().toISOString().split('T')[0]}.db`;
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            window.URL.revokeObjectURL(url);
-
-            this.showToast('Database exported successfully!', 'success');
-        } catch (error) {
-            this.showToast('Error exporting database', 'error');
-        }
+    exportDatabase() {
+        // The server streams a snapshot; let the browser download it directly
+        this.startDownload('/api/database/export');
+        this.showToast('Database export started', 'success');
+    }
+
+    startDownload(url) {
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = '';
+        document.body.appendChild(a);
+        a.click();
+        document.body.removeChild(a);
     }
 
     async saveDatabaseConfiguration() {
@@ -535,33 +530,10 @@ class SettingsManager {
         }
     }
 
-    async exportData(type, format) {
-        try {
-            const response = await fetch(`/api/export/${type}?format=${format}`);
-            const data = await response.json();
-
-            if (data.success) {
-                const content = format === 'csv' ? data.csv : JSON.stringify(data.data, null, 2);
-                const mimeType = format === 'csv' ? 'text/csv' : 'application/json';
-                const extension = format === 'csv' ? 'csv' : 'json';
-
-                const blob = new Blob([content], { type: mimeType });
-                const url = window.URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = `${type}_${new Date().toISOString().split('T')[0]}.${extension}`;
-                document.body.appendChild(a);
-                a.click();
-                document.body.removeChild(a);
-                window.URL.revokeObjectURL(url);
-
-                this.showToast(`${type} exported successfully!`, 'success');
-            } else {
-                this.showToast(`Export failed: ${data.error}`, 'error');
-            }
-        } catch (error) {
-            this.showToast(`Error exporting ${type}`, 'error');
-        }
+    exportData(type, format) {
+        // Streamed as a file download, so large exports never sit in page memory
+        this.startDownload(`/api/export/${type}?format=${format}`);
+        this.showToast(`${type} export started`, 'success');
     }
 
     exportSettings() {
@@ -593,51 +565,102 @@ class SettingsManager {
             return;
         }
 
+        // Small JSON files may be settings exports; everything else goes to the bulk importer
+        if (!file.name.toLowerCase().endsWith('.json') || file.size > 1024 * 1024) {
+            this.importTaskData(file);
+            return;
+        }
+
         const reader = new FileReader();
         reader.onload = (e) => {
+            let data = null;
             try {
-                const data = JSON.parse(e.target.result);
-
-                if (data.settings) {
-                    // Import settings
-                    this.settings = { ...this.settings, ...data.settings };
-                    this.saveSettings();
-                    this.loadCurrentSettings();
-                    this.showToast('Settings imported successfully!', 'success');
-                } else {
-                    // Import tasks/categories
-                    this.importTaskData(data);
-                }
+                data = JSON.parse(e.target.result);
             } catch (error) {
                 this.showToast('Error parsing import file', 'error');
+                return;
+            }
+
+            if (data.settings) {
+                // Import settings
+                this.settings = { ...this.settings, ...data.settings };
+                this.saveSettings();
+                this.loadCurrentSettings();
+                this.showToast('Settings imported successfully!', 'success');
+            } else {
+                // Import tasks
+                this.importTaskData(file);
             }
         };
 
         reader.readAsText(file);
     }
 
-    async importTaskData(data) {
+    async importTaskData(file) {
+        const formData = new FormData();
+        formData.append('file', file);
+
         try {
             const response = await fetch('/api/import', {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify(data)
+                body: formData
             });
 
-            const result = await response.json();
+            if (!response.ok) {
+                const result = await response.json();
+                this.showToast(`Import failed: ${result.error}`, 'error');
+                return;
+            }
+
+            // The server reports progress as NDJSON lines, ending with the result
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let result = null;
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+
+                for (const line of lines) {
+                    if (!line.trim()) {
+                        continue;
+                    }
+                    const event = JSON.parse(line);
+                    this.showImportProgress(event);
+                    if (event.type === 'result') {
+                        result = event;
+                    }
+                }
+            }
 
-            if (result.success) {
-                this.showToast('Data imported successfully!', 'success');
+            if (result && result.success) {
+                const skipped = result.error_count ? `, ${result.error_count} row(s) skipped` : '';
+                this.showToast(`Imported ${result.imported} task(s)${skipped}`, result.error_count ? 'warning' : 'success');
+                if (result.errors && result.errors.length) {
+                    console.warn('Import row errors:', result.errors);
+                }
             } else {
-                this.showToast(`Import failed: ${result.error}`, 'error');
+                this.showToast(`Import failed: ${result ? result.error : 'no response'}`, 'error');
             }
         } catch (error) {
             this.showToast('Error importing data', 'error');
         }
     }
 
+    showImportProgress(event) {
+        const progress = document.getElementById('importProgress');
+        if (progress) {
+            progress.textContent = `${event.processed} row(s) read, ${event.imported} imported, ${event.error_count} error(s)`;
+        }
+    }
+
     autoSave() {
         // Collect current form values
         this.settings.defaultPriority = parseInt(document.getElementById('defaultPriority').value);